@@ -5,6 +5,7 @@ Processes resumes → Parses → Evaluates → Logs results
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
@@ -12,14 +13,46 @@ from typing import Dict, Any, List
 # Import pipeline components
 from src.extraction.extraction import extract_text_pdf, extract_text_docx, extract_text_image
 from src.processing.cleaning import clean_whitespace, redact_pii, normalize_text
-from src.processing.parsing import parse_cv_with_gemini
-from src.logging_utils import log_step
+from src.processing.parsing import parse_cvs_with_gemini
+from src.logging_utils import log_step, flush_log
+import src.extraction.extraction as extraction
 from src.evaluation.evaluate import ResumeEvaluator
 from src.evaluation.weighted_evaluate import WeightedResumeEvaluator
 from src.evaluation.ranked_evaluate import RankedResumeEvaluator
 from src.evaluation.enhanced_evaluation import EnhancedEvaluationPipeline
 
 
+def _init_resume_worker():
+    """Resume files are already spread over the workers; OCR each PDF serially."""
+    extraction._OCR_WORKERS = 1
+
+
+def _clean_text(text: str) -> str:
+    """Clean whitespace, redact PII and normalize extracted text."""
+    return normalize_text(redact_pii(clean_whitespace(text)))
+
+
+def _prepare_resume(file_path: Path):
+    """
+    Extract and clean one resume (runs in a worker process).
+    
+    Args:
+        file_path: Resume file with a supported extension
+        
+    Returns:
+        (extracted text, processed text), or the exception raised
+    """
+    try:
+        extractor = ResumePipeline.SUPPORTED_EXTENSIONS[file_path.suffix.lower()]
+        text = extractor(str(file_path), file_path.name)
+        return text, _clean_text(text)
+    except Exception as e:
+        return e
+    finally:
+        # Worker processes exit without running atexit handlers
+        flush_log()
+
+
 class ResumePipeline:
     """Complete resume processing pipeline."""
     
@@ -69,6 +102,11 @@ class ResumePipeline:
         self.pipeline_log.append(log_entry)
         log_step(message)
     
+    @staticmethod
+    def file_fingerprint(file_path: Path) -> str:
+        """Identify a file by a hash of its full contents (the extraction cache's content hash)."""
+        return extraction.file_digest(str(file_path))
+    
     def get_resume_files(self) -> List[Path]:
         """Get all supported resume files from input directory."""
         files = []
@@ -82,10 +120,8 @@ class ResumePipeline:
         if ext not in self.SUPPORTED_EXTENSIONS:
             raise ValueError(f"Unsupported file type: {ext}")
         
-        extractor = self.SUPPORTED_EXTENSIONS[ext]
-        
         self.log(f"Extracting text from {file_path.name}...")
-        text = extractor(str(file_path), file_path.name)
+        text = self.SUPPORTED_EXTENSIONS[ext](str(file_path), file_path.name)
         self.log(f"Extracted {len(text)} characters from {file_path.name}")
         
         return text
@@ -93,43 +129,65 @@ class ResumePipeline:
     def process_text(self, text: str, filename: str) -> str:
         """Clean and normalize extracted text."""
         self.log(f"Processing text for {filename}...")
-        
-        # Clean whitespace
-        cleaned = clean_whitespace(text)
-        
-        # Redact PII
-        redacted = redact_pii(cleaned)
-        
-        # Normalize
-        normalized = normalize_text(redacted)
-        
+        normalized = _clean_text(text)
         self.log(f"Text processing complete for {filename}")
         return normalized
     
     def parse_resume(self, text: str, filename: str) -> Dict[str, Any]:
         """Parse resume using Gemini API."""
-        self.log(f"Parsing {filename} with Gemini API...")
+        return self.parse_resumes([text], [filename])[0]
+    
+    @staticmethod
+    def error_record(filename: str, error: Exception) -> Dict[str, Any]:
+        """Empty parse result recording why a resume could not be processed."""
+        return {
+            "filename": filename,
+            "name": "",
+            "education": [],
+            "experience": [],
+            "publications": [],
+            "awards": [],
+            "error": str(error)
+        }
+    
+    def parse_resumes(self, texts: List[str], filenames: List[str]) -> List[Dict[str, Any]]:
+        """Parse several resumes with concurrent Gemini API requests."""
+        self.log(f"Parsing {len(texts)} resume(s) with Gemini API...")
         
-        try:
-            parsed = parse_cv_with_gemini(text)
+        results = []
+        for filename, parsed in zip(filenames, parse_cvs_with_gemini(texts)):
+            if isinstance(parsed, Exception):
+                self.log(f"Error parsing {filename}: {str(parsed)}", "ERROR")
+                results.append(self.error_record(filename, parsed))
+                continue
             # Add filename if not present
             if 'filename' not in parsed:
                 parsed['filename'] = filename
             self.log(f"Successfully parsed {filename}")
-            return parsed
-        except Exception as e:
-            self.log(f"Error parsing {filename}: {str(e)}", "ERROR")
-            return {
-                "filename": filename,
-                "name": "",
-                "education": [],
-                "experience": [],
-                "publications": [],
-                "awards": [],
-                "error": str(e)
-            }
+            results.append(parsed)
+        return results
+    
+    def prepare_resumes(self, files: List[Path], max_workers: int = None) -> List[Any]:
+        """
+        Extract and clean resumes, in parallel worker processes.
+        
+        Args:
+            files: Resume files
+            max_workers: Worker processes (default: one per CPU); 1 runs in-process
+            
+        Returns:
+            (extracted text, processed text) per file, or the exception raised
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(files))
+        if workers <= 1:
+            return [_prepare_resume(file_path) for file_path in files]
+        
+        self.log(f"Extracting {len(files)} resume(s) with {workers} worker processes...")
+        chunksize = max(1, min(4, len(files) // workers))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_resume_worker) as pool:
+            return list(pool.map(_prepare_resume, files, chunksize=chunksize))
     
-    def process_all_resumes(self) -> List[Dict[str, Any]]:
+    def process_all_resumes(self, max_workers: int = None) -> List[Dict[str, Any]]:
         """Process all resumes in input directory."""
         self.log("=" * 80)
         self.log("STARTING RESUME PROCESSING PIPELINE")
@@ -138,37 +196,57 @@ class ResumePipeline:
         files = self.get_resume_files()
         self.log(f"Found {len(files)} resume(s) to process")
         
+        # Extraction and cleaning share no state between files, so every distinct
+        # file is prepared up front in worker processes
+        fingerprints = []
+        first_copies = {}  # file fingerprint -> first file with it
+        for file_path in files:
+            try:
+                fingerprint = self.file_fingerprint(file_path)
+                first_copies.setdefault(fingerprint, file_path)
+            except OSError as e:
+                fingerprint = e  # reported below with the file
+            fingerprints.append(fingerprint)
+        prepared = dict(zip(first_copies, self.prepare_resumes(list(first_copies.values()), max_workers)))
+        
         results = []
+        to_parse = []  # (index in results, processed text, filename)
         
-        for i, file_path in enumerate(files, 1):
+        for i, (file_path, fingerprint) in enumerate(zip(files, fingerprints), 1):
             self.log("")
             self.log(f"Processing resume {i}/{len(files)}: {file_path.name}")
             self.log("-" * 80)
             
             try:
-                # Extract
-                text = self.extract_text(file_path)
+                if isinstance(fingerprint, Exception):
+                    raise fingerprint
+                outcome = prepared[fingerprint]
+                if isinstance(outcome, Exception):
+                    raise outcome
+                text, processed_text = outcome
+                if first_copies[fingerprint] == file_path:
+                    self.log(f"Extracted {len(text)} characters from {file_path.name}")
+                    self.log(f"Text processing complete for {file_path.name}")
+                else:
+                    # Same file submitted again; reuse the text of the first copy
+                    self.log(f"{file_path.name} duplicates an earlier file, reusing its text")
                 
-                # Process
-                processed_text = self.process_text(text, file_path.name)
-                
-                # Parse
-                parsed = self.parse_resume(processed_text, file_path.name)
-                
-                results.append(parsed)
-                self.log(f"✓ Successfully processed {file_path.name}")
+                # Parsed below, all resumes at once
+                to_parse.append((len(results), processed_text, file_path.name))
+                results.append(None)
                 
             except Exception as e:
                 self.log(f"✗ Failed to process {file_path.name}: {str(e)}", "ERROR")
-                results.append({
-                    "filename": file_path.name,
-                    "name": "",
-                    "education": [],
-                    "experience": [],
-                    "publications": [],
-                    "awards": [],
-                    "error": str(e)
-                })
+                results.append(self.error_record(file_path.name, e))
+        
+        # Parse (Gemini requests are I/O bound, so they run concurrently)
+        if to_parse:
+            self.log("")
+            indices, texts, filenames = zip(*to_parse)
+            for index, filename, parsed in zip(indices, filenames, self.parse_resumes(list(texts), list(filenames))):
+                results[index] = parsed
+                if "error" not in parsed:
+                    self.log(f"✓ Successfully processed {filename}")
         
         self.parsed_results = results
         
@@ -17,5 +17,6 @@ def _make_abs(path):
 RAW_DIR = _make_abs(os.getenv("RAW_DIR", "NOT_FOUND"))
 FINAL_JSON = _make_abs(os.getenv("FINAL_JSON", "NOT_FOUND"))
 LOG_FILE = _make_abs(os.getenv("LOG_FILE", "NOT_FOUND"))
+EXTRACTION_CACHE_DIR = _make_abs(os.getenv("EXTRACTION_CACHE_DIR", "../data/cache"))
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "NOT_FOUND")
 
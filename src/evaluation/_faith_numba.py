@@ -0,0 +1,59 @@
+"""
+Numeric kernels for faithfulness verification.
+Uses Numba when available, otherwise falls back to equivalent NumPy code.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+def _check_component_deltas_py(rep_d, rep_w, w, a, b, tol):
+    """
+    Compare reported component deltas against actual component scores.
+
+    Args:
+        rep_d: Reported deltas
+        rep_w: Reported weighted deltas
+        w: Component weights
+        a: Actual component scores for candidate A
+        b: Actual component scores for candidate B
+        tol: Absolute tolerance
+
+    Returns:
+        Tuple of (delta_bad, weighted_bad, actual_delta, actual_weighted)
+    """
+    actual_delta = a - b
+    actual_weighted = actual_delta * w
+    delta_bad = np.abs(rep_d - actual_delta) > tol
+    weighted_bad = np.abs(rep_w - actual_weighted) > tol
+    return delta_bad, weighted_bad, actual_delta, actual_weighted
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def check_component_deltas(rep_d, rep_w, w, a, b, tol):
+        n = rep_d.shape[0]
+        delta_bad = np.zeros(n, dtype=np.bool_)
+        weighted_bad = np.zeros(n, dtype=np.bool_)
+        actual_delta = np.empty(n, dtype=np.float64)
+        actual_weighted = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            d = a[i] - b[i]
+            wd = d * w[i]
+            actual_delta[i] = d
+            actual_weighted[i] = wd
+            delta_bad[i] = abs(rep_d[i] - d) > tol
+            weighted_bad[i] = abs(rep_w[i] - wd) > tol
+        return delta_bad, weighted_bad, actual_delta, actual_weighted
+else:
+    check_component_deltas = _check_component_deltas_py
+
+
+def warm_up():
+    """Trigger JIT compilation (or cache load) with tiny dummy arrays."""
+    dummy = np.zeros(1, dtype=np.float64)
+    check_component_deltas(dummy, dummy, dummy, dummy, dummy, 0.0001)
@@ -0,0 +1,315 @@
+"""
+Numeric kernels for ranked evaluation and ranking metrics.
+Uses Numba when available, otherwise falls back to equivalent NumPy/SciPy code.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _top3_abs_indices_py(x, threshold):
+    """
+    Select the three largest non-zero entries of x that clear threshold.
+
+    Args:
+        x: Weighted impact per component
+        threshold: Minimum absolute impact for an entry to be selected
+
+    Returns:
+        Array of up to 3 component indices, largest impact first; ties keep
+        component order
+    """
+    mag = np.abs(x)
+    order = np.argsort(-mag, kind='mergesort')
+    keep = (x[order] != 0) & (mag[order] >= threshold)
+    return order[keep][:3]
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def top3_abs_indices(x, threshold):
+        mag = np.abs(x)
+        order = np.argsort(-mag, kind='mergesort')
+        out = np.empty(3, dtype=np.int64)
+        k = 0
+        for i in order:
+            if x[i] != 0 and mag[i] >= threshold:
+                out[k] = i
+                k += 1
+                if k == 3:
+                    break
+        return out[:k]
+else:
+    top3_abs_indices = _top3_abs_indices_py
+
+
+def _pairwise_agreement_py(sys_scores, gt_scores, threshold):
+    """
+    Count pairs whose system order agrees with the ground truth order.
+    
+    Args:
+        sys_scores: System score per candidate
+        gt_scores: Ground truth score per candidate
+        threshold: Pairs whose ground truth scores differ by less are skipped
+        
+    Returns:
+        Tuple of (correct, total, first5) where first5 holds the (i, j) indices
+        of the first five disagreeing pairs in i < j row-major order, padded
+        with -1
+    """
+    idx_i, idx_j = np.triu_indices(sys_scores.shape[0], k=1)
+    gt_i, gt_j = gt_scores[idx_i], gt_scores[idx_j]
+    valid = ~(np.abs(gt_i - gt_j) < threshold)
+    agree = (gt_i > gt_j) == (sys_scores[idx_i] > sys_scores[idx_j])
+    total = int(np.count_nonzero(valid))
+    correct = int(np.count_nonzero(valid & agree))
+    first5 = np.full((5, 2), -1, dtype=np.int64)
+    if correct < total:
+        violating = np.flatnonzero(valid & ~agree)[:5]
+        first5[:violating.size, 0] = idx_i[violating]
+        first5[:violating.size, 1] = idx_j[violating]
+    return correct, total, first5
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def pairwise_agreement(sys_scores, gt_scores, threshold):
+        n = sys_scores.shape[0]
+        correct = 0
+        total = 0
+        found = 0
+        first5 = np.full((5, 2), -1, dtype=np.int64)
+        for i in range(n):
+            gi = gt_scores[i]
+            si = sys_scores[i]
+            for j in range(i + 1, n):
+                if abs(gi - gt_scores[j]) < threshold:
+                    continue
+                total += 1
+                if (gi > gt_scores[j]) == (si > sys_scores[j]):
+                    correct += 1
+                elif found < 5:
+                    first5[found, 0] = i
+                    first5[found, 1] = j
+                    found += 1
+        return correct, total, first5
+else:
+    pairwise_agreement = _pairwise_agreement_py
+
+
+# n! as floats for the exact Kendall p-value (inf beyond 170)
+_FACTORIALS = np.array([float(math.factorial(i)) for i in range(171)] + [np.inf], dtype=np.float64)
+
+
+def _kendall_tau_b_py(x, y, factorials, pvalue):
+    """
+    SciPy fallback for kendall_tau_b: tau-b with a two-sided p-value.
+
+    Args:
+        x: First score vector
+        y: Second score vector
+        factorials: Float factorial table (see _FACTORIALS)
+        pvalue: If False, skip the p-value and return NaN in its place
+
+    Returns:
+        Tuple of (tau, p_value); NaN when undefined
+    """
+    from scipy import stats
+    res = stats.kendalltau(x, y)
+    return float(res[0]), (float(res[1]) if pvalue else np.nan)
+
+
+def _kendall_p_exact_py(n, c, factorials):
+    """Two-sided exact p-value for c concordant (or discordant) pairs without ties."""
+    c = min(c, (n * (n - 1)) // 2 - c)
+    if n == 1 or n == 2:
+        prob = 1.0
+    elif c == 0:
+        prob = 2.0 / factorials[n] if n < 171 else 0.0
+    elif c == 1:
+        prob = 2.0 / factorials[n - 1] if n < 172 else 0.0
+    elif 4 * c == n * (n - 1):
+        prob = 1.0
+    else:
+        new = np.zeros(c + 1)
+        new[0] = 1.0
+        new[1] = 1.0
+        for j in range(3, n + 1):
+            acc = 0.0
+            for t in range(c + 1):
+                acc += new[t]
+                new[t] = acc
+            if n >= 171:
+                for t in range(c + 1):
+                    new[t] /= j
+            if j <= c:
+                # Descending so each source entry is read before it is updated
+                for t in range(c - j, -1, -1):
+                    new[j + t] -= new[t]
+        total = 0.0
+        for t in range(c + 1):
+            total += new[t]
+        prob = 2.0 * total / factorials[n] if n < 171 else total
+    return min(max(prob, 0.0), 1.0)
+
+
+def _kendall_tau_b_kernel(x, y, factorials, pvalue):
+    n = x.shape[0]
+    if n == 0:
+        return np.nan, np.nan
+    for i in range(n):
+        if np.isnan(x[i]) or np.isnan(y[i]):
+            return np.nan, np.nan
+    
+    # Lexicographic order on (x, y): stable sort by y, then stable sort by x
+    by_y = np.argsort(y, kind='mergesort')
+    order = by_y[np.argsort(x[by_y], kind='mergesort')]
+    xs = x[order]
+    ys = y[order].copy()
+    
+    # Ties in x and joint (x, y) ties are consecutive runs in this order
+    xtie = 0
+    x0 = 0.0
+    x1 = 0.0
+    ntie = 0
+    run = 1
+    joint = 1
+    for i in range(1, n + 1):
+        if i < n and xs[i] == xs[i - 1]:
+            run += 1
+            if ys[i] == ys[i - 1]:
+                joint += 1
+            else:
+                ntie += joint * (joint - 1) // 2
+                joint = 1
+        else:
+            if run > 1:
+                xtie += run * (run - 1) // 2
+                x0 += run * (run - 1.0) * (run - 2)
+                x1 += run * (run - 1.0) * (2 * run + 5)
+            ntie += joint * (joint - 1) // 2
+            run = 1
+            joint = 1
+    
+    # Discordant pairs = strict inversions of y (Knight's bottom-up merge sort)
+    dis = 0
+    buf = np.empty_like(ys)
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i = lo
+            j = mid
+            k = lo
+            while i < mid and j < hi:
+                if ys[j] < ys[i]:
+                    buf[k] = ys[j]
+                    dis += mid - i
+                    j += 1
+                else:
+                    buf[k] = ys[i]
+                    i += 1
+                k += 1
+            while i < mid:
+                buf[k] = ys[i]
+                i += 1
+                k += 1
+            while j < hi:
+                buf[k] = ys[j]
+                j += 1
+                k += 1
+        ys, buf = buf, ys
+        width *= 2
+    
+    # y is now sorted, so its ties are consecutive runs too
+    ytie = 0
+    y0 = 0.0
+    y1 = 0.0
+    run = 1
+    for i in range(1, n + 1):
+        if i < n and ys[i] == ys[i - 1]:
+            run += 1
+        else:
+            if run > 1:
+                ytie += run * (run - 1) // 2
+                y0 += run * (run - 1.0) * (run - 2)
+                y1 += run * (run - 1.0) * (2 * run + 5)
+            run = 1
+    
+    tot = (n * (n - 1)) // 2
+    if xtie == tot or ytie == tot:
+        return np.nan, np.nan
+    
+    con_minus_dis = tot - xtie - ytie + ntie - 2 * dis
+    tau = con_minus_dis / np.sqrt(float(tot - xtie)) / np.sqrt(float(tot - ytie))
+    tau = min(1.0, max(-1.0, tau))
+    if not pvalue:
+        return tau, np.nan
+    
+    if xtie == 0 and ytie == 0 and (n <= 33 or min(dis, tot - dis) <= 1):
+        return tau, _kendall_p_exact(n, tot - dis, factorials)
+    
+    # con_minus_dis is approximately normal with this tie-corrected variance
+    m = n * (n - 1.0)
+    var = ((m * (2 * n + 5) - int(x1) - int(y1)) / 18
+           + (2 * xtie * ytie) / m + int(x0) * int(y0) / (9 * m * (n - 2)))
+    z = abs(con_minus_dis / np.sqrt(var))
+    # Two-sided normal tail, 2 * ndtr(-z), evaluated as in Cephes
+    w = z * 0.7071067811865476
+    if w < 0.7071067811865476:
+        half = 0.5 - 0.5 * math.erf(w)
+    else:
+        half = 0.5 * math.erfc(w)
+    return tau, 2 * half
+
+
+if _NUMBA_AVAILABLE:
+    _kendall_p_exact = njit(cache=True, nogil=True)(_kendall_p_exact_py)
+    kendall_tau_b = njit(cache=True, nogil=True)(_kendall_tau_b_kernel)
+else:
+    _kendall_p_exact = _kendall_p_exact_py
+    kendall_tau_b = _kendall_tau_b_py
+
+
+def _kendall_tau_b_rows_py(x, y, lengths, factorials, pvalue):
+    """
+    Kendall tau-b for each row of two padded score matrices.
+    
+    Args:
+        x: First score matrix, one ranking per row, valid entries first
+        y: Second score matrix with the same layout
+        lengths: Number of valid entries per row
+        factorials: Float factorial table (see _FACTORIALS)
+        pvalue: If False, skip the p-values (NaN in their place)
+        
+    Returns:
+        Array of shape (rows, 2) holding (tau, p_value) per row
+    """
+    out = np.empty((x.shape[0], 2), dtype=np.float64)
+    for r in prange(x.shape[0]):
+        n = lengths[r]
+        tau, p_value = kendall_tau_b(x[r, :n], y[r, :n], factorials, pvalue)
+        out[r, 0] = tau
+        out[r, 1] = p_value
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    kendall_tau_b_rows = njit(cache=True, parallel=True)(_kendall_tau_b_rows_py)
+else:
+    kendall_tau_b_rows = _kendall_tau_b_rows_py
+
+
+def warm_up():
+    """Trigger JIT compilation (or cache load) with dummy inputs."""
+    top3_abs_indices(np.zeros(5, dtype=np.float64), 0.0)
+    pairwise_agreement(np.zeros(3, dtype=np.float64), np.zeros(3, dtype=np.float64), 0.05)
+    kendall_tau_b(np.arange(3, dtype=np.float64), np.arange(3, dtype=np.float64), _FACTORIALS, True)
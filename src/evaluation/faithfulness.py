@@ -2,7 +2,106 @@
 Faithfulness evaluation for explanations.
 Verifies that explanations accurately reflect actual scoring decisions.
 """
-from typing import Dict, List, Any, Tuple
+import bisect
+import heapq
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from math import fabs
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Final, List, Any, Mapping, Optional, Tuple
+
+# NumPy and Numba are imported on first use, see FaithfulnessEvaluator._numeric
+if TYPE_CHECKING:
+    import numpy as np
+
+# Allowed absolute difference between reported and actual scores
+_TOL: Final[float] = 1e-4
+
+# Penalty applied per failed check, and whether the failure marks the explanation unfaithful
+_CHECK_PENALTIES = {
+    'score_delta_verification': (0.2, True),
+    'component_deltas_verification': (0.2, True),
+    'top_reasons_verification': (0.3, True),
+    # We allow some flexibility for evidence - not a hard failure
+    'evidence_correspondence_verification': (0.2, False),
+    'ranking_consistency_verification': (0.1, True)
+}
+
+# Interpretation bands: a score at or above a threshold moves up one label
+_INTERPRETATION_THRESHOLDS = (0.50, 0.70, 0.85, 0.95)
+_INTERPRETATION_LABELS = (
+    "Unfaithful - significant discrepancies in explanations",
+    "Somewhat faithful - multiple issues detected",
+    "Moderately faithful - some issues detected",
+    "Faithful - minor discrepancies only",
+    "Highly faithful - explanations accurately reflect scoring"
+)
+
+# Shared read-only results for passing checks; diagnostics are only built on failure
+_PASS_SCORE_DELTA = MappingProxyType({'check': 'score_delta_verification', 'passed': True, 'issue': None})
+_PASS_COMPONENT_DELTAS = MappingProxyType({'check': 'component_deltas_verification', 'passed': True, 'issue': None})
+_PASS_TOP_REASONS = MappingProxyType({'check': 'top_reasons_verification', 'passed': True, 'issue': None})
+_PASS_EVIDENCE = MappingProxyType({'check': 'evidence_correspondence_verification', 'passed': True, 'issue': None})
+_PASS_RANKING = MappingProxyType({'check': 'ranking_consistency_verification', 'passed': True, 'issue': None})
+
+# Pass results in the order returned by FaithfulnessEvaluator._detail_checks
+_PASS_DETAIL_CHECKS = (_PASS_COMPONENT_DELTAS, _PASS_TOP_REASONS, _PASS_EVIDENCE)
+
+# Component deltas as a packed record: interned component id plus the reported numbers
+COMPONENT_DELTA_FIELDS = [
+    ('comp_id', 'i4'),
+    ('delta', 'f8'),
+    ('weighted', 'f8'),
+    ('weight', 'f8')
+]
+
+# Evidence spans are joined with a character that never occurs in resume text
+_SPAN_SEPARATOR = '\x00'
+
+
+def _cited_in_spans(cited: str, spans_set: frozenset, spans: Tuple[str, ...], joined: str) -> bool:
+    """Check whether cited evidence matches an actual span exactly or partially."""
+    if cited in spans_set:
+        return True
+    if not spans:
+        return False
+    # Cited text contained in some span: one scan over the joined spans
+    if _SPAN_SEPARATOR not in cited and cited in joined:
+        return True
+    # Some span contained in the cited text
+    return any(span in cited for span in spans)
+
+
+def _abs_weighted_delta(comp_delta: Dict[str, Any]) -> float:
+    """Absolute weighted impact of a component delta."""
+    weighted = comp_delta['weighted_delta']
+    return -weighted if weighted < 0 else weighted
+
+
+@dataclass(slots=True, frozen=True)
+class ComparisonView:
+    """Read-only view of a comparison explanation, parsed once and shared by all checks."""
+    score_delta: float
+    final_score_a: float
+    final_score_b: float
+    component_deltas: Tuple[Dict[str, Any], ...]
+    top_3_reasons: Tuple[Dict[str, Any], ...]
+    candidate_a: Optional[str]
+    candidate_b: Optional[str]
+    
+    @classmethod
+    def from_dict(cls, comparison: Dict[str, Any]) -> 'ComparisonView':
+        """Build a view from a comparison dictionary, applying the usual defaults."""
+        return cls(
+            score_delta=comparison.get('score_delta', 0.0),
+            final_score_a=comparison.get('final_score_a', 0.0),
+            final_score_b=comparison.get('final_score_b', 0.0),
+            component_deltas=tuple(comparison.get('component_deltas', [])),
+            top_3_reasons=tuple(comparison.get('top_3_reasons', [])),
+            candidate_a=comparison.get('candidate_a'),
+            candidate_b=comparison.get('candidate_b')
+        )
 
 
 class FaithfulnessEvaluator:
@@ -11,6 +110,11 @@ class FaithfulnessEvaluator:
     Ensures that cited evidence truly contributed to score differences.
     """
     
+    # Numeric backends, loaded once per process by _numeric()
+    _np = None
+    _check_kernel = None
+    _component_delta_dt = None
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize faithfulness evaluator.
@@ -20,6 +124,42 @@ class FaithfulnessEvaluator:
         """
         self.config = config
         self.weights = config.get('weights', {})
+        
+        # Evidence span lookups, only populated while evaluate_global_faithfulness runs
+        self._span_cache = None
+        
+        # Interned component names, indexed by component id
+        self._components: List[str] = []
+        self._component_index: Dict[str, int] = {}
+        
+        # Per-candidate component scores, rebuilt by each evaluate_global_faithfulness call
+        self._component_vec_cache: Optional['np.ndarray'] = None
+    
+    @classmethod
+    def _numeric(cls):
+        """
+        Import NumPy and the component delta kernel on first use.
+        
+        Keeps evaluator construction (and CLI startup) free of the NumPy/Numba
+        import cost until a numeric check actually runs.
+        
+        Returns:
+            The numpy module
+        """
+        if cls._check_kernel is None:
+            import numpy as np
+            # Handle both relative and absolute imports
+            try:
+                from ._faith_numba import check_component_deltas, warm_up
+            except ImportError:
+                from src.evaluation._faith_numba import check_component_deltas, warm_up
+            
+            # Compile (or load the cached) kernel before the first real comparison
+            warm_up()
+            cls._np = np
+            cls._component_delta_dt = np.dtype(COMPONENT_DELTA_FIELDS)
+            cls._check_kernel = staticmethod(check_component_deltas)
+        return cls._np
     
     def evaluate_explanation_faithfulness(self,
                                          comparison: Dict[str, Any],
@@ -40,51 +180,40 @@ class FaithfulnessEvaluator:
         Returns:
             Dictionary with faithfulness metrics and issues
         """
+        view = ComparisonView.from_dict(comparison)
+        
+        checks = [
+            # Check 1: Score delta matches reported delta
+            self._verify_score_delta(view, scores_a, scores_b),
+            # Check 2: Component deltas are accurate
+            self._verify_component_deltas(view, scores_a, scores_b),
+            # Check 3: Top reasons reflect actual weighted impacts
+            self._verify_top_reasons(view, scores_a, scores_b),
+            # Check 4: Evidence corresponds to cited components
+            self._verify_evidence_correspondence(view, evidence_a, evidence_b),
+            # Check 5: Rankings are consistent with scores
+            self._verify_ranking_consistency(view)
+        ]
+        
+        # Passing checks are the shared read-only results; callers get plain dicts
+        return self._combine_checks([dict(check) for check in checks])
+    
+    def _combine_checks(self, checks: List[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Combine individual check results into a faithfulness score."""
         faithfulness_results = {
             'overall_faithful': True,
             'faithfulness_score': 1.0,
-            'checks': [],
+            'checks': checks,
             'issues': []
         }
         
-        # Check 1: Score delta matches reported delta
-        score_check = self._verify_score_delta(comparison, scores_a, scores_b)
-        faithfulness_results['checks'].append(score_check)
-        if not score_check['passed']:
-            faithfulness_results['issues'].append(score_check['issue'])
-            faithfulness_results['overall_faithful'] = False
-            faithfulness_results['faithfulness_score'] -= 0.2
-        
-        # Check 2: Component deltas are accurate
-        component_check = self._verify_component_deltas(comparison, scores_a, scores_b)
-        faithfulness_results['checks'].append(component_check)
-        if not component_check['passed']:
-            faithfulness_results['issues'].append(component_check['issue'])
-            faithfulness_results['overall_faithful'] = False
-            faithfulness_results['faithfulness_score'] -= 0.2
-        
-        # Check 3: Top reasons reflect actual weighted impacts
-        reasons_check = self._verify_top_reasons(comparison, scores_a, scores_b)
-        faithfulness_results['checks'].append(reasons_check)
-        if not reasons_check['passed']:
-            faithfulness_results['issues'].append(reasons_check['issue'])
-            faithfulness_results['overall_faithful'] = False
-            faithfulness_results['faithfulness_score'] -= 0.3
-        
-        # Check 4: Evidence corresponds to cited components
-        evidence_check = self._verify_evidence_correspondence(comparison, evidence_a, evidence_b)
-        faithfulness_results['checks'].append(evidence_check)
-        if not evidence_check['passed']:
-            faithfulness_results['issues'].append(evidence_check['issue'])
-            faithfulness_results['faithfulness_score'] -= 0.2
-        
-        # Check 5: Rankings are consistent with scores
-        ranking_check = self._verify_ranking_consistency(comparison)
-        faithfulness_results['checks'].append(ranking_check)
-        if not ranking_check['passed']:
-            faithfulness_results['issues'].append(ranking_check['issue'])
-            faithfulness_results['overall_faithful'] = False
-            faithfulness_results['faithfulness_score'] -= 0.1
+        for check in checks:
+            if not check['passed']:
+                penalty, hard_failure = _CHECK_PENALTIES[check['check']]
+                faithfulness_results['issues'].append(check['issue'])
+                if hard_failure:
+                    faithfulness_results['overall_faithful'] = False
+                faithfulness_results['faithfulness_score'] -= penalty
         
         # Ensure score doesn't go below 0
         faithfulness_results['faithfulness_score'] = max(0.0, faithfulness_results['faithfulness_score'])
@@ -97,87 +226,140 @@ class FaithfulnessEvaluator:
         return faithfulness_results
     
     def _verify_score_delta(self, 
-                           comparison: Dict[str, Any],
+                           comparison: ComparisonView,
                            scores_a: Dict[str, Any],
-                           scores_b: Dict[str, Any]) -> Dict[str, Any]:
+                           scores_b: Dict[str, Any]) -> Mapping[str, Any]:
         """Verify that reported score delta matches actual delta."""
-        reported_delta = comparison.get('score_delta', 0.0)
-        reported_score_a = comparison.get('final_score_a', 0.0)
-        reported_score_b = comparison.get('final_score_b', 0.0)
+        reported_delta = comparison.score_delta
+        reported_score_a = comparison.final_score_a
+        reported_score_b = comparison.final_score_b
         
         actual_score_a = scores_a.get('final_score', 0.0)
         actual_score_b = scores_b.get('final_score', 0.0)
         actual_delta = actual_score_a - actual_score_b
         
         # Allow small floating point tolerance
-        tolerance = 0.0001
-        
-        scores_match = (abs(reported_score_a - actual_score_a) < tolerance and
-                       abs(reported_score_b - actual_score_b) < tolerance)
-        delta_matches = abs(reported_delta - actual_delta) < tolerance
+        scores_match = (fabs(reported_score_a - actual_score_a) < _TOL and
+                       fabs(reported_score_b - actual_score_b) < _TOL)
+        delta_matches = fabs(reported_delta - actual_delta) < _TOL
         
         passed = scores_match and delta_matches
         
+        return self._score_delta_result(reported_delta, actual_delta, passed)
+    
+    def _score_delta_result(self, reported_delta: float, actual_delta: float, passed: bool) -> Mapping[str, Any]:
+        """Build the score delta check result."""
+        if passed:
+            return _PASS_SCORE_DELTA
+        
         return {
             'check': 'score_delta_verification',
-            'passed': passed,
+            'passed': False,
             'reported_delta': reported_delta,
             'actual_delta': round(actual_delta, 4),
             'error': abs(reported_delta - actual_delta),
-            'issue': f'Score delta mismatch: reported {reported_delta:.4f}, actual {actual_delta:.4f}' if not passed else None
+            'issue': f'Score delta mismatch: reported {reported_delta:.4f}, actual {actual_delta:.4f}'
         }
     
+    def _verify_scores_batch(self,
+                             reported_a: 'np.ndarray',
+                             reported_b: 'np.ndarray',
+                             reported_delta: 'np.ndarray',
+                             actual_a: 'np.ndarray',
+                             actual_b: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        """
+        Vectorized score delta and ranking consistency checks for many comparisons.
+        
+        Args:
+            reported_a: Reported final scores for candidate A
+            reported_b: Reported final scores for candidate B
+            reported_delta: Reported score deltas
+            actual_a: Actual final scores for candidate A
+            actual_b: Actual final scores for candidate B
+            
+        Returns:
+            Tuple of boolean arrays (scores_match, delta_matches, ranking_ok)
+        """
+        np = self._numeric()
+        scores_match = ((np.abs(reported_a - actual_a) < _TOL) &
+                        (np.abs(reported_b - actual_b) < _TOL))
+        delta_matches = np.abs(reported_delta - (actual_a - actual_b)) < _TOL
+        
+        # Same rules as _verify_ranking_consistency, applied to the reported scores
+        ranking_ok = (((reported_delta > 0) & (reported_a > reported_b)) |
+                      (~((reported_delta < 0) & (reported_b > reported_a)) & (np.abs(reported_delta) < _TOL)))
+        
+        return scores_match, delta_matches, ranking_ok
+    
     def _verify_component_deltas(self,
-                                 comparison: Dict[str, Any],
+                                 comparison: ComparisonView,
                                  scores_a: Dict[str, Any],
-                                 scores_b: Dict[str, Any]) -> Dict[str, Any]:
-        """Verify that component deltas are correctly calculated."""
-        component_deltas = comparison.get('component_deltas', [])
+                                 scores_b: Dict[str, Any],
+                                 vec_a: Optional['np.ndarray'] = None,
+                                 vec_b: Optional['np.ndarray'] = None) -> Mapping[str, Any]:
+        """
+        Verify that component deltas are correctly calculated.
+        
+        vec_a/vec_b are optional rows of the cached component matrix built by
+        _build_component_cache; when given, scores_a/scores_b are not read.
+        """
+        np = self._numeric()
+        component_deltas = comparison.component_deltas
         issues_found = []
-        tolerance = 0.0001
         
-        for comp_delta in component_deltas:
-            component = comp_delta['component']
-            reported_delta = comp_delta['delta']
-            reported_weighted = comp_delta['weighted_delta']
-            weight = comp_delta['weight']
-            
-            # Get actual component scores
-            actual_score_a = scores_a.get('component_scores', {}).get(component, 0.0)
-            actual_score_b = scores_b.get('component_scores', {}).get(component, 0.0)
-            actual_delta = actual_score_a - actual_score_b
-            actual_weighted = actual_delta * weight
-            
-            # Check delta
-            if abs(reported_delta - actual_delta) > tolerance:
+        deltas = self._component_delta_array(component_deltas)
+        comp_ids = deltas['comp_id']
+        reported_deltas = np.ascontiguousarray(deltas['delta'])
+        reported_weighted = np.ascontiguousarray(deltas['weighted'])
+        weights = np.ascontiguousarray(deltas['weight'])
+        
+        # Get actual component scores
+        if vec_a is not None and vec_b is not None:
+            # Ids registered after the cache was built fall through to its zero column
+            columns = np.minimum(comp_ids, vec_a.shape[0] - 1)
+            actual_a = vec_a[columns]
+            actual_b = vec_b[columns]
+        else:
+            component_scores_a = scores_a.get('component_scores', {})
+            component_scores_b = scores_b.get('component_scores', {})
+            actual_a = np.array([component_scores_a.get(self._components[c], 0.0) for c in comp_ids], dtype=np.float64)
+            actual_b = np.array([component_scores_b.get(self._components[c], 0.0) for c in comp_ids], dtype=np.float64)
+        
+        delta_bad, weighted_bad, actual_deltas, actual_weighted = self._check_kernel(
+            reported_deltas, reported_weighted, weights, actual_a, actual_b, _TOL
+        )
+        
+        # Only failing components need formatted messages
+        for i in np.flatnonzero(delta_bad | weighted_bad):
+            component = self._components[comp_ids[i]]
+            if delta_bad[i]:
                 issues_found.append(
-                    f'{component}: delta mismatch (reported {reported_delta:.4f}, actual {actual_delta:.4f})'
+                    f'{component}: delta mismatch (reported {reported_deltas[i]:.4f}, actual {actual_deltas[i]:.4f})'
                 )
-            
-            # Check weighted delta
-            if abs(reported_weighted - actual_weighted) > tolerance:
+            if weighted_bad[i]:
                 issues_found.append(
-                    f'{component}: weighted delta mismatch (reported {reported_weighted:.4f}, actual {actual_weighted:.4f})'
+                    f'{component}: weighted delta mismatch (reported {reported_weighted[i]:.4f}, actual {actual_weighted[i]:.4f})'
                 )
         
-        passed = len(issues_found) == 0
+        if not issues_found:
+            return _PASS_COMPONENT_DELTAS
         
         return {
             'check': 'component_deltas_verification',
-            'passed': passed,
+            'passed': False,
             'components_checked': len(component_deltas),
             'mismatches_found': len(issues_found),
-            'details': issues_found if issues_found else None,
-            'issue': f'Found {len(issues_found)} component delta mismatches' if not passed else None
+            'details': issues_found,
+            'issue': f'Found {len(issues_found)} component delta mismatches'
         }
     
     def _verify_top_reasons(self,
-                           comparison: Dict[str, Any],
+                           comparison: ComparisonView,
                            scores_a: Dict[str, Any],
-                           scores_b: Dict[str, Any]) -> Dict[str, Any]:
+                           scores_b: Dict[str, Any]) -> Mapping[str, Any]:
         """Verify that top reasons correspond to largest weighted impacts."""
-        top_reasons = comparison.get('top_3_reasons', [])
-        component_deltas = comparison.get('component_deltas', [])
+        top_reasons = comparison.top_3_reasons
+        component_deltas = comparison.component_deltas
         
         if not top_reasons or not component_deltas:
             return {
@@ -186,10 +368,8 @@ class FaithfulnessEvaluator:
                 'issue': 'Missing top reasons or component deltas'
             }
         
-        # Sort component deltas by absolute weighted impact
-        sorted_deltas = sorted(component_deltas, 
-                              key=lambda x: abs(x['weighted_delta']), 
-                              reverse=True)
+        # Only the top 3 weighted impacts are compared, so select them without a full sort
+        sorted_deltas = heapq.nlargest(3, component_deltas, key=_abs_weighted_delta)
         
         # Check if top 3 reasons match top 3 weighted impacts
         mismatches = []
@@ -206,116 +386,206 @@ class FaithfulnessEvaluator:
                     'expected_impact': sorted_deltas[i]['weighted_delta']
                 })
         
-        passed = len(mismatches) == 0
+        if not mismatches:
+            return _PASS_TOP_REASONS
         
         return {
             'check': 'top_reasons_verification',
-            'passed': passed,
+            'passed': False,
             'reasons_checked': len(top_reasons),
-            'mismatches': mismatches if mismatches else None,
-            'issue': f'Top reasons do not match largest weighted impacts: {len(mismatches)} mismatches' if not passed else None
+            'mismatches': mismatches,
+            'issue': f'Top reasons do not match largest weighted impacts: {len(mismatches)} mismatches'
         }
     
     def _verify_evidence_correspondence(self,
-                                       comparison: Dict[str, Any],
+                                       comparison: ComparisonView,
                                        evidence_a: Dict[str, Any],
-                                       evidence_b: Dict[str, Any]) -> Dict[str, Any]:
+                                       evidence_b: Dict[str, Any]) -> Mapping[str, Any]:
         """Verify that cited evidence exists in actual evidence."""
-        top_reasons = comparison.get('top_3_reasons', [])
+        top_reasons = comparison.top_3_reasons
         missing_evidence = []
+        total_checked = 0
         
         for reason in top_reasons:
             component = reason['component']
             cited_evidence_a = reason.get('evidence_a', [])
             cited_evidence_b = reason.get('evidence_b', [])
+            total_checked += len(cited_evidence_a) + len(cited_evidence_b)
             
             # Get actual evidence for component
             evidence_key = f"{component}_evidence"
             actual_evidence_a = evidence_a.get(evidence_key, [])
             actual_evidence_b = evidence_b.get(evidence_key, [])
             
-            # Extract actual evidence spans
-            actual_spans_a = [item.get('evidence_span', '') for item in actual_evidence_a if not item.get('missing')]
-            actual_spans_b = [item.get('evidence_span', '') for item in actual_evidence_b if not item.get('missing')]
+            # Extract actual evidence spans (cached per evidence list during global evaluation)
+            spans_a = self._actual_spans(actual_evidence_a)
+            spans_b = self._actual_spans(actual_evidence_b)
             
             # Check if cited evidence exists in actual evidence
             for cited in cited_evidence_a:
-                if cited != "No evidence available" and cited not in actual_spans_a:
-                    # Check partial match
-                    if not any(cited in span or span in cited for span in actual_spans_a):
-                        missing_evidence.append({
-                            'candidate': 'A',
-                            'component': component,
-                            'cited': cited,
-                            'reason': 'Not found in actual evidence'
-                        })
+                if cited != "No evidence available" and not _cited_in_spans(cited, *spans_a):
+                    missing_evidence.append({
+                        'candidate': 'A',
+                        'component': component,
+                        'cited': cited,
+                        'reason': 'Not found in actual evidence'
+                    })
             
             for cited in cited_evidence_b:
-                if cited != "No evidence available" and cited not in actual_spans_b:
-                    if not any(cited in span or span in cited for span in actual_spans_b):
-                        missing_evidence.append({
-                            'candidate': 'B',
-                            'component': component,
-                            'cited': cited,
-                            'reason': 'Not found in actual evidence'
-                        })
+                if cited != "No evidence available" and not _cited_in_spans(cited, *spans_b):
+                    missing_evidence.append({
+                        'candidate': 'B',
+                        'component': component,
+                        'cited': cited,
+                        'reason': 'Not found in actual evidence'
+                    })
         
         # We allow some flexibility here - not a hard failure
-        passed = len(missing_evidence) == 0
+        if not missing_evidence:
+            return _PASS_EVIDENCE
         
         return {
             'check': 'evidence_correspondence_verification',
-            'passed': passed,
-            'total_evidence_checked': sum(len(r.get('evidence_a', [])) + len(r.get('evidence_b', [])) for r in top_reasons),
+            'passed': False,
+            'total_evidence_checked': total_checked,
             'missing_count': len(missing_evidence),
-            'missing_details': missing_evidence[:5] if missing_evidence else None,  # Show first 5
-            'issue': f'{len(missing_evidence)} cited evidence items not found in actual evidence' if not passed else None
+            'missing_details': missing_evidence[:5],  # Show first 5
+            'issue': f'{len(missing_evidence)} cited evidence items not found in actual evidence'
         }
     
-    def _verify_ranking_consistency(self, comparison: Dict[str, Any]) -> Dict[str, Any]:
+    def _component_id(self, component: str) -> int:
+        """Return the id of a component name, registering (and interning) it if new."""
+        comp_id = self._component_index.get(component)
+        if comp_id is None:
+            comp_id = len(self._components)
+            self._components.append(sys.intern(component))
+            self._component_index[self._components[-1]] = comp_id
+        return comp_id
+    
+    def _component_delta_array(self, component_deltas: List[Dict[str, Any]]) -> 'np.ndarray':
+        """Pack a comparison's component deltas into a COMPONENT_DELTA_FIELDS record array."""
+        np = self._numeric()
+        return np.array(
+            [(self._component_id(d['component']), d['delta'], d['weighted_delta'], d['weight'])
+             for d in component_deltas],
+            dtype=self._component_delta_dt
+        )
+    
+    def _build_component_cache(self, all_scores: Dict[str, Dict[str, Any]]) -> 'np.ndarray':
+        """
+        Build a (candidates x components) matrix of actual component scores.
+        
+        Rows follow the iteration order of all_scores and columns follow component
+        ids. The last column is all zeros and is used for components a candidate
+        doesn't report.
+        """
+        np = self._numeric()
+        for component in sorted({c for s in all_scores.values() for c in s.get('component_scores', {})}):
+            self._component_id(component)
+        
+        vec = np.zeros((len(all_scores), len(self._components) + 1), dtype=np.float64)
+        for i, scores in enumerate(all_scores.values()):
+            for component, score in scores.get('component_scores', {}).items():
+                vec[i, self._component_index[component]] = score
+        
+        self._component_vec_cache = vec
+        return vec
+    
+    def _actual_spans(self, items: List[Dict[str, Any]]) -> Tuple[frozenset, Tuple[str, ...], str]:
+        """Collect non-missing evidence spans as a set, a tuple and a joined search string."""
+        cache = self._span_cache
+        if cache is not None:
+            entry = cache.get(id(items))
+            # Entry keeps a reference to the list, so a matching id can't be a recycled object
+            if entry is not None and entry[0] is items:
+                return entry[1]
+        
+        spans = tuple(item.get('evidence_span', '') for item in items if not item.get('missing'))
+        joined = _SPAN_SEPARATOR.join(span for span in spans if isinstance(span, str))
+        result = (frozenset(spans), spans, joined)
+        
+        if cache is not None:
+            cache[id(items)] = (items, result)
+        return result
+    
+    def _verify_ranking_consistency(self, comparison: ComparisonView) -> Mapping[str, Any]:
         """Verify that ranking is consistent with scores."""
-        score_a = comparison.get('final_score_a', 0.0)
-        score_b = comparison.get('final_score_b', 0.0)
-        score_delta = comparison.get('score_delta', 0.0)
-        
-        # Check if A is ranked higher (positive delta) when it has higher score
-        if score_delta > 0 and score_a > score_b:
-            passed = True
-        elif score_delta < 0 and score_b > score_a:
-            # This shouldn't happen if A is supposed to be higher
-            passed = False
-        elif abs(score_delta) < 0.0001:  # Essentially tied
-            passed = True
-        else:
-            passed = False
+        score_a = comparison.final_score_a
+        score_b = comparison.final_score_b
+        score_delta = comparison.score_delta
+        
+        # Consistent when A is ranked higher (positive delta) with a higher score, or
+        # when essentially tied unless B outscores A with a negative delta.
+        # Evaluated as flat boolean arithmetic rather than an if/elif chain.
+        consistent = (score_delta > 0) & (score_a > score_b)
+        inverted = (score_delta < 0) & (score_b > score_a)
+        passed = consistent | ((fabs(score_delta) < _TOL) & (not inverted))
+        
+        return self._ranking_result(score_a, score_b, score_delta, passed)
+    
+    def _ranking_result(self, score_a: float, score_b: float, score_delta: float, passed: bool) -> Mapping[str, Any]:
+        """Build the ranking consistency check result."""
+        if passed:
+            return _PASS_RANKING
         
         return {
             'check': 'ranking_consistency_verification',
-            'passed': passed,
+            'passed': False,
             'score_a': score_a,
             'score_b': score_b,
             'delta': score_delta,
             'consistent': score_delta > 0 and score_a > score_b,
-            'issue': 'Ranking inconsistent with scores' if not passed else None
+            'issue': 'Ranking inconsistent with scores'
         }
     
     def _interpret_faithfulness(self, score: float) -> str:
         """Interpret faithfulness score."""
-        if score >= 0.95:
-            return "Highly faithful - explanations accurately reflect scoring"
-        elif score >= 0.85:
-            return "Faithful - minor discrepancies only"
-        elif score >= 0.70:
-            return "Moderately faithful - some issues detected"
-        elif score >= 0.50:
-            return "Somewhat faithful - multiple issues detected"
-        else:
-            return "Unfaithful - significant discrepancies in explanations"
+        return _INTERPRETATION_LABELS[bisect.bisect_right(_INTERPRETATION_THRESHOLDS, score)]
+    
+    def _detail_checks(self,
+                       view: ComparisonView,
+                       scores_a: Dict[str, Any],
+                       scores_b: Dict[str, Any],
+                       evidence_a: Dict[str, Any],
+                       evidence_b: Dict[str, Any],
+                       vec_a: Optional['np.ndarray'] = None,
+                       vec_b: Optional['np.ndarray'] = None) -> Tuple[Mapping[str, Any], ...]:
+        """Run the component delta, top reason and evidence checks for one comparison."""
+        return (
+            self._verify_component_deltas(view, scores_a, scores_b, vec_a, vec_b),
+            self._verify_top_reasons(view, scores_a, scores_b),
+            self._verify_evidence_correspondence(view, evidence_a, evidence_b)
+        )
+    
+    def _detail_checks_parallel(self,
+                                batch: List[Tuple[ComparisonView, int, int]],
+                                score_list: List[Dict[str, Any]],
+                                all_evidence: Dict[str, Dict[str, Any]],
+                                max_workers: int) -> List[Tuple[Mapping[str, Any], ...]]:
+        """Run _detail_checks for a batch of comparisons in a process pool."""
+        tasks = [
+            (view, score_list[i], score_list[j],
+             all_evidence.get(view.candidate_a, {}), all_evidence.get(view.candidate_b, {}))
+            for view, i, j in batch
+        ]
+        chunksize = max(1, len(tasks) // (4 * max_workers))
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_faith_worker,
+                                 initargs=(self.config,)) as pool:
+            results = pool.map(_faith_worker, tasks, chunksize=chunksize)
+            # Workers send None for passing checks; swap the shared pass results back in
+            return [
+                tuple(pass_result if check is None else check
+                      for pass_result, check in zip(_PASS_DETAIL_CHECKS, result))
+                for result in results
+            ]
     
     def evaluate_global_faithfulness(self, 
                                     all_comparisons: List[Dict[str, Any]],
                                     all_scores: Dict[str, Dict[str, Any]],
-                                    all_evidence: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+                                    all_evidence: Dict[str, Dict[str, Any]],
+                                    max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Evaluate faithfulness across all comparisons.
         
@@ -323,53 +593,109 @@ class FaithfulnessEvaluator:
             all_comparisons: List of all comparison explanations
             all_scores: Dictionary mapping resume ID to scores
             all_evidence: Dictionary mapping resume ID to evidence
+            max_workers: If greater than 1, run the per-comparison checks in a
+                process pool with this many workers
             
         Returns:
             Dictionary with global faithfulness metrics
         """
+        np = self._numeric()
         individual_faithfulness = []
+        score_sum = 0.0
         total_checks = 0
         passed_checks = 0
-        all_issues = []
-        
+        total_issues = 0
+        sample_issues = []  # Only the first 10 issues are reported
+        
+        # Map candidate IDs to contiguous indices once instead of per comparison
+        # Note: We'd need to map candidate names to IDs
+        # For now, assume comparison has the IDs
+        id2idx = {cid: i for i, cid in enumerate(all_scores)}
+        score_list = list(all_scores.values())
+        final_scores = np.array([s.get('final_score', 0.0) for s in score_list], dtype=np.float64)
+        component_vec = self._build_component_cache(all_scores)
+        
+        batch = []
         for comparison in all_comparisons:
-            candidate_a = comparison.get('candidate_a')
-            candidate_b = comparison.get('candidate_b')
-            
-            # Get corresponding data
-            # Note: We'd need to map candidate names to IDs
-            # For now, assume comparison has the IDs
-            scores_a = all_scores.get(candidate_a, {})
-            scores_b = all_scores.get(candidate_b, {})
-            evidence_a = all_evidence.get(candidate_a, {})
-            evidence_b = all_evidence.get(candidate_b, {})
-            
-            if not scores_a or not scores_b:
+            view = ComparisonView.from_dict(comparison)
+            idx_a = id2idx.get(view.candidate_a)
+            idx_b = id2idx.get(view.candidate_b)
+            if idx_a is None or idx_b is None or not score_list[idx_a] or not score_list[idx_b]:
                 continue
-            
-            # Evaluate this comparison
-            faithfulness = self.evaluate_explanation_faithfulness(
-                comparison, scores_a, scores_b, evidence_a, evidence_b
-            )
-            
-            individual_faithfulness.append({
-                'comparison': f"{candidate_a} vs {candidate_b}",
-                'score': faithfulness['faithfulness_score'],
-                'passed': faithfulness['overall_faithful'],
-                'issues': faithfulness['issues']
-            })
-            
-            # Aggregate checks
-            for check in faithfulness['checks']:
-                total_checks += 1
-                if check['passed']:
-                    passed_checks += 1
-            
-            # Aggregate issues
-            all_issues.extend(faithfulness['issues'])
+            batch.append((view, idx_a, idx_b))
+        
+        # Score delta and ranking checks for the whole batch in one pass
+        idx_a = np.array([item[1] for item in batch], dtype=np.intp)
+        idx_b = np.array([item[2] for item in batch], dtype=np.intp)
+        reported_a = np.array([item[0].final_score_a for item in batch], dtype=np.float64)
+        reported_b = np.array([item[0].final_score_b for item in batch], dtype=np.float64)
+        reported_delta = np.array([item[0].score_delta for item in batch], dtype=np.float64)
+        
+        actual_a = final_scores[idx_a]
+        actual_b = final_scores[idx_b]
+        actual_delta = actual_a - actual_b
+        scores_match, delta_matches, ranking_ok = self._verify_scores_batch(
+            reported_a, reported_b, reported_delta, actual_a, actual_b
+        )
+        score_delta_ok = scores_match & delta_matches
+        
+        # Component, top reason and evidence checks are independent per comparison
+        parallel_checks = None
+        if max_workers and max_workers > 1 and len(batch) > 1:
+            parallel_checks = self._detail_checks_parallel(batch, score_list, all_evidence, max_workers)
+        
+        # Evidence dicts are shared across pairwise comparisons, so cache their spans for this run
+        self._span_cache = {}
+        try:
+            for k, (view, i, j) in enumerate(batch):
+                candidate_a = view.candidate_a
+                candidate_b = view.candidate_b
+                scores_a = score_list[i]
+                scores_b = score_list[j]
+                evidence_a = all_evidence.get(candidate_a, {})
+                evidence_b = all_evidence.get(candidate_b, {})
+                
+                if parallel_checks is not None:
+                    component_check, reasons_check, evidence_check = parallel_checks[k]
+                else:
+                    component_check, reasons_check, evidence_check = self._detail_checks(
+                        view, scores_a, scores_b, evidence_a, evidence_b, component_vec[i], component_vec[j]
+                    )
+                
+                # Evaluate this comparison
+                faithfulness = self._combine_checks([
+                    self._score_delta_result(view.score_delta, float(actual_delta[k]), bool(score_delta_ok[k])),
+                    component_check,
+                    reasons_check,
+                    evidence_check,
+                    self._ranking_result(view.final_score_a, view.final_score_b, view.score_delta,
+                                         bool(ranking_ok[k]))
+                ])
+                
+                individual_faithfulness.append({
+                    'comparison': f"{candidate_a} vs {candidate_b}",
+                    'score': faithfulness['faithfulness_score'],
+                    'passed': faithfulness['overall_faithful'],
+                    'issues': faithfulness['issues']
+                })
+                
+                # Aggregate checks
+                for check in faithfulness['checks']:
+                    total_checks += 1
+                    if check['passed']:
+                        passed_checks += 1
+                
+                # Aggregate scores and issues as we go
+                score_sum += faithfulness['faithfulness_score']
+                issues = faithfulness['issues']
+                total_issues += len(issues)
+                if len(sample_issues) < 10:
+                    sample_issues.extend(issues[:10 - len(sample_issues)])
+        finally:
+            self._span_cache = None
         
         # Calculate global metrics
-        avg_faithfulness = sum(f['score'] for f in individual_faithfulness) / len(individual_faithfulness) if individual_faithfulness else 0.0
+        avg_faithfulness = score_sum / len(individual_faithfulness) if individual_faithfulness else 0.0
         pass_rate = passed_checks / total_checks if total_checks > 0 else 0.0
         
         return {
@@ -379,8 +705,25 @@ class FaithfulnessEvaluator:
             'total_checks': total_checks,
             'passed_checks': passed_checks,
             'failed_checks': total_checks - passed_checks,
-            'total_issues': len(all_issues),
+            'total_issues': total_issues,
             'individual_scores': individual_faithfulness,
-            'sample_issues': all_issues[:10],  # Show first 10 issues
+            'sample_issues': sample_issues,  # Show first 10 issues
             'interpretation': self._interpret_faithfulness(avg_faithfulness)
         }
+
+
+# Evaluator used by process pool workers, created once per worker process
+_worker_evaluator = None
+
+
+def _init_faith_worker(config: Dict[str, Any]):
+    """Create the per-process evaluator for parallel faithfulness checks."""
+    global _worker_evaluator
+    _worker_evaluator = FaithfulnessEvaluator(config)
+
+
+def _faith_worker(task: Tuple[Any, ...]) -> Tuple[Optional[Dict[str, Any]], ...]:
+    """Run the per-comparison checks for one task, returning None for passing checks."""
+    checks = _worker_evaluator._detail_checks(*task)
+    # Shared pass results are read-only mappings that can't be pickled
+    return tuple(None if check['passed'] else check for check in checks)
@@ -1,10 +1,73 @@
 """
 Enhanced weighted evaluation with ranking, comparison, and evidence-backed explanations.
 """
-import json
+import heapq
+import io
+import operator
 import os
-from typing import Dict, List, Any, Tuple
-from .weighted_evaluate import WeightedResumeEvaluator
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
+from .weighted_evaluate import WeightedResumeEvaluator, _write_results
+
+# Bound percent formatters for the hot reason/report paths
+_PCT = "{:.1%}".format
+_PCT_SIGNED = "{:+.1%}".format
+_DELTA_ROW = "{:<15} {:>8.1%} {:>8.1%} {:>+8.1%} {:>+8.1%}\n".format
+
+# (highlights key, spans key) per evidence section. The names are built at
+# runtime, so intern them to match the literal keys used in _REASON_SPEC.
+_EVIDENCE_SECTION_KEYS = tuple(
+    (sys.intern(f'{section}_highlights'), sys.intern(f'{section}_spans'))
+    for section in ('education', 'experience', 'publications', 'awards')
+)
+
+
+def _intern(value: Any) -> Any:
+    """Intern small categorical strings so repeated values share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True, frozen=True)
+class EducationHighlight:
+    """Education entry evidence with its display span."""
+    degree: str
+    field: str
+    university: str
+    gpa: Optional[Any]
+    country: str
+    span: str
+
+
+@dataclass(slots=True, frozen=True)
+class ExperienceHighlight:
+    """Experience entry evidence with its display span."""
+    title: str
+    org: str
+    domain: str
+    duration_months: Optional[int]
+    span: str
+
+
+@dataclass(slots=True, frozen=True)
+class PublicationHighlight:
+    """Publication evidence with its display span."""
+    title: str
+    venue: str
+    journal_if: Optional[Any]
+    author_position: Optional[Any]
+    span: str
+
+
+@dataclass(slots=True, frozen=True)
+class AwardHighlight:
+    """Award evidence with its display span."""
+    title: str
+    issuer: str
+    year: Optional[Any]
+    span: str
 
 
 class RankedResumeEvaluator(WeightedResumeEvaluator):
@@ -13,14 +76,167 @@ class RankedResumeEvaluator(WeightedResumeEvaluator):
     with evidence-backed explanations.
     """
     
+    # Highlight builders keyed by the format name used in _REASON_SPEC
+    _HIGHLIGHT_FORMATS = {
+        'pct': lambda label, a, b: label + " (" + _PCT(a) + " vs " + _PCT(b) + ")",
+        'months': lambda label, a, b: label + " (" + str(a) + " months vs " + str(b) + " months)",
+        'count': lambda label, a, b: label + " (" + str(a) + " vs " + str(b) + ")",
+        'bonus': lambda label, a, b: label + " (" + _PCT(a) + ")",
+        'flag': lambda label, a, b: label,
+    }
+    
+    # Per-component reason layout: (field, label, format) highlights are emitted
+    # when A beats B on that field; 'always_highlight' reports them unconditionally
+    # and keeps them out of the reason sentence. 'evidence' names the cached span
+    # list from _extract_evidence; None cites the name only.
+    _REASON_SPEC = {
+        'education': {
+            'label': 'Education',
+            'title': 'Superior education credentials',
+            'evidence': 'education_spans',
+            'always_highlight': False,
+            'fields': (
+                ('gpa_score', 'Higher GPA score', 'pct'),
+                ('degree_level_score', 'More advanced degree level', 'pct'),
+                ('university_tier_score', 'Higher-tier university', 'pct'),
+            ),
+        },
+        'experience': {
+            'label': 'Experience',
+            'title': 'Stronger work experience',
+            'evidence': 'experience_spans',
+            'always_highlight': False,
+            'fields': (
+                ('total_months', 'More experience', 'months'),
+                ('domain_match_score', 'Higher domain relevance', 'pct'),
+                ('experience_bonus', 'Qualifies for experience bonus', 'bonus'),
+            ),
+        },
+        'publications': {
+            'label': 'Publications',
+            'title': 'Better publication record',
+            'evidence': 'publications_spans',
+            'always_highlight': False,
+            'fields': (
+                ('count', 'More publications', 'count'),
+                ('if_score', 'Higher impact factor', 'pct'),
+                ('author_position_score', 'Better author positions', 'pct'),
+                ('first_author_bonus', 'Has first-author publications', 'flag'),
+            ),
+        },
+        'coherence': {
+            'label': 'Coherence',
+            'title': 'More coherent career profile',
+            'evidence': None,
+            'always_highlight': False,
+            'fields': (
+                ('timeline_score', 'More consistent timeline', 'pct'),
+                ('field_alignment_score', 'Better field alignment', 'pct'),
+                ('progression_score', 'Stronger career progression', 'pct'),
+            ),
+        },
+        'awards': {
+            'label': 'Awards',
+            'title': 'More awards and certifications',
+            'evidence': 'awards_spans',
+            'always_highlight': True,
+            'fields': (
+                ('count', 'More awards/certifications', 'count'),
+            ),
+        },
+    }
+    
+    # Top-3 impact kernel, loaded and warmed once per process by _load_top3_kernel()
+    _top3_kernel = None
+    
     def __init__(self, generated_path: str, ground_truth_path: str, config_path: str = "evaluation_config.json"):
         super().__init__(generated_path, ground_truth_path, config_path)
+        self._load_top3_kernel()
         self.evidence = {}  # Store evidence for explanations
+        self._evidence_src = {}  # resume_key -> resume object its evidence was built from
+        
+        # Component order shared by delta tables and reasons; scores are keyed by weight name
+        self._components = ('education', 'experience', 'publications', 'coherence', 'awards')
+        self._weight_keys = ('education', 'experience', 'publications', 'coherence', 'awards_other')
+        self._component_getter = operator.itemgetter(*self._weight_keys)
+        self._weights_vec = np.array(
+            [self.weights.get(k, d) for k, d in zip(self._weight_keys, (0.30, 0.30, 0.25, 0.10, 0.05))],
+            dtype=np.float64
+        )
+        
+        # Weighted impacts below this are float noise and never become reasons
+        self._impact_threshold = float(self.policies.get('min_reason_impact', 0.005))
+        
+        # Component-score matrix for the most recent evaluate_all_with_ranking run
+        self._score_source = None
+        self._score_matrix = None
+        self._final_scores = None
+        self._key_to_idx = {}
+    
+    @classmethod
+    def _load_top3_kernel(cls):
+        """Import the top-3 impact kernel and compile (or load the cached) JIT code."""
+        if cls._top3_kernel is None:
+            from ._rank_numba import top3_abs_indices, warm_up
+            warm_up()
+            cls._top3_kernel = staticmethod(top3_abs_indices)
+    
+    def _cs_tuple(self, resume_result: Dict[str, Any]) -> Tuple[float, ...]:
+        """
+        Read a resume's component scores in component order in one pass.
+        
+        Args:
+            resume_result: Per-resume evaluation result
+            
+        Returns:
+            Tuple of component scores
+        """
+        return self._component_getter(resume_result['component_scores'])
+    
+    def _build_score_matrix(self, results: Dict[str, Any]):
+        """
+        Precompute an (N, components) score matrix and final-score vector.
+        
+        Args:
+            results: Full evaluation results
+        """
+        per_resume = results['per_resume']
+        keys = list(per_resume.keys())
+        self._key_to_idx = {key: i for i, key in enumerate(keys)}
+        self._score_matrix = np.array(
+            [self._cs_tuple(per_resume[key]) for key in keys], dtype=np.float64
+        ).reshape(len(keys), len(self._weight_keys))
+        self._final_scores = np.fromiter(
+            (per_resume[key]['final_score'] for key in keys), dtype=np.float64, count=len(keys)
+        )
+        self._score_source = per_resume
     
     def _extract_evidence(self, resume: Dict, resume_key: str) -> Dict[str, Any]:
         """
         Extract key evidence from resume for explanations.
         
+        Returns:
+            Dict with evidence spans and highlights
+        """
+        # Reuse evidence built from this very resume object (resumes are
+        # treated as immutable once loaded)
+        cached = self.evidence.get(resume_key)
+        if cached is not None and self._evidence_src.get(resume_key) is resume:
+            return cached
+        
+        evidence = self._build_evidence(resume)
+        self.evidence[resume_key] = evidence
+        self._evidence_src[resume_key] = resume
+        return evidence
+    
+    @staticmethod
+    def _build_evidence(resume: Dict) -> Dict[str, Any]:
+        """
+        Build the evidence dict for a resume without touching evaluator state.
+        
+        Args:
+            resume: Generated resume data
+            
         Returns:
             Dict with evidence spans and highlights
         """
@@ -34,63 +250,66 @@ class RankedResumeEvaluator(WeightedResumeEvaluator):
         
         # Education evidence
         for edu in resume.get('education', []):
-            highlight = {
-                'degree': edu.get('degree', ''),
-                'field': edu.get('field', ''),
-                'university': edu.get('university', ''),
-                'gpa': edu.get('gpa'),
-                'country': edu.get('country', ''),
-                'span': f"{edu.get('degree', '')} in {edu.get('field', '')} from {edu.get('university', '')}"
-            }
+            span = f"{edu.get('degree', '')} in {edu.get('field', '')} from {edu.get('university', '')}"
             if edu.get('gpa'):
-                highlight['span'] += f" (GPA: {edu.get('gpa')})"
-            evidence['education_highlights'].append(highlight)
+                span += f" (GPA: {edu.get('gpa')})"
+            evidence['education_highlights'].append(EducationHighlight(
+                degree=_intern(edu.get('degree', '')),
+                field=edu.get('field', ''),
+                university=edu.get('university', ''),
+                gpa=edu.get('gpa'),
+                country=_intern(edu.get('country', '')),
+                span=span
+            ))
         
         # Experience evidence
         for exp in resume.get('experience', []):
             months = exp.get('duration_months', 0)
-            highlight = {
-                'title': exp.get('title', ''),
-                'org': exp.get('org', ''),
-                'domain': exp.get('domain', ''),
-                'duration_months': months,
-                'span': f"{exp.get('title', '')} at {exp.get('org', '')} ({months} months)"
-            }
+            span = f"{exp.get('title', '')} at {exp.get('org', '')} ({months} months)"
             if exp.get('domain'):
-                highlight['span'] += f" - {exp.get('domain')}"
-            evidence['experience_highlights'].append(highlight)
+                span += f" - {exp.get('domain')}"
+            evidence['experience_highlights'].append(ExperienceHighlight(
+                title=exp.get('title', ''),
+                org=exp.get('org', ''),
+                domain=_intern(exp.get('domain', '')),
+                duration_months=months,
+                span=span
+            ))
         
         # Publications evidence
         for pub in resume.get('publications', []):
-            highlight = {
-                'title': pub.get('title', ''),
-                'venue': pub.get('venue', ''),
-                'journal_if': pub.get('journal_if'),
-                'author_position': pub.get('author_position'),
-                'span': f"\"{pub.get('title', '')}\" in {pub.get('venue', '')}"
-            }
+            span = f"\"{pub.get('title', '')}\" in {pub.get('venue', '')}"
             if pub.get('journal_if'):
-                highlight['span'] += f" (IF: {pub.get('journal_if')})"
+                span += f" (IF: {pub.get('journal_if')})"
             if pub.get('author_position'):
                 pos_str = 'First' if pub.get('author_position') in [1, '1'] else f"{pub.get('author_position')}"
-                highlight['span'] += f" [{pos_str} author]"
-            evidence['publications_highlights'].append(highlight)
+                span += f" [{pos_str} author]"
+            evidence['publications_highlights'].append(PublicationHighlight(
+                title=pub.get('title', ''),
+                venue=pub.get('venue', ''),
+                journal_if=pub.get('journal_if'),
+                author_position=pub.get('author_position'),
+                span=span
+            ))
         
         # Awards evidence
         for award in resume.get('awards', []):
-            highlight = {
-                'title': award.get('title', ''),
-                'issuer': award.get('issuer', ''),
-                'year': award.get('year'),
-                'span': award.get('title', '')
-            }
+            span = award.get('title', '')
             if award.get('issuer'):
-                highlight['span'] += f" from {award.get('issuer')}"
+                span += f" from {award.get('issuer')}"
             if award.get('year'):
-                highlight['span'] += f" ({award.get('year')})"
-            evidence['awards_highlights'].append(highlight)
+                span += f" ({award.get('year')})"
+            evidence['awards_highlights'].append(AwardHighlight(
+                title=award.get('title', ''),
+                issuer=award.get('issuer', ''),
+                year=award.get('year'),
+                span=span
+            ))
+        
+        # Cache span lists once so pairwise comparisons reuse them
+        for highlights_key, spans_key in _EVIDENCE_SECTION_KEYS:
+            evidence[spans_key] = [h.span for h in evidence[highlights_key]]
         
-        self.evidence[resume_key] = evidence
         return evidence
     
     def rank_resumes(self, results: Dict[str, Any]) -> List[Tuple[str, float, str]]:
@@ -100,17 +319,33 @@ class RankedResumeEvaluator(WeightedResumeEvaluator):
         Returns:
             List of tuples: (resume_key, score, grade)
         """
-        rankings = []
-        for resume_key, resume_result in results['per_resume'].items():
-            rankings.append((
-                resume_key,
-                resume_result['final_score'],
-                resume_result['grade']
-            ))
+        per_resume = results['per_resume']
+        keys = list(per_resume.keys())
+        if per_resume is self._score_source:
+            scores = self._final_scores
+        else:
+            scores = np.fromiter((per_resume[k]['final_score'] for k in keys), dtype=np.float64, count=len(keys))
+        
+        # Sort by score descending; stable so ties keep evaluation order
+        order = np.argsort(-scores, kind='stable')
+        return [(keys[i], float(scores[i]), per_resume[keys[i]]['grade']) for i in order.tolist()]
+    
+    def top_k_rankings(self, results: Dict[str, Any], k: int = 5) -> List[Tuple[str, float, str]]:
+        """
+        Return only the k best-ranked resumes without sorting the full pool.
         
-        # Sort by score descending
-        rankings.sort(key=lambda x: x[1], reverse=True)
-        return rankings
+        Args:
+            results: Full evaluation results
+            k: Number of top candidates to return
+            
+        Returns:
+            List of tuples: (resume_key, score, grade), same order as rank_resumes
+        """
+        return heapq.nlargest(
+            k,
+            ((key, r['final_score'], r['grade']) for key, r in results['per_resume'].items()),
+            key=operator.itemgetter(1)
+        )
     
     def compare_resumes(self, resume_a_key: str, resume_b_key: str, results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -130,52 +365,64 @@ class RankedResumeEvaluator(WeightedResumeEvaluator):
         if not resume_a or not resume_b:
             return {'error': 'One or both resumes not found'}
         
+        # Calculate deltas for each component in one vectorized pass,
+        # slicing the precomputed score matrix when it covers these results
+        if results['per_resume'] is self._score_source:
+            scores_a = self._score_matrix[self._key_to_idx[resume_a_key]]
+            scores_b = self._score_matrix[self._key_to_idx[resume_b_key]]
+        else:
+            scores_a = np.array(self._cs_tuple(resume_a), dtype=np.float64)
+            scores_b = np.array(self._cs_tuple(resume_b), dtype=np.float64)
+        delta = scores_a - scores_b
+        weighted = delta * self._weights_vec
+        
+        return self._build_comparison(resume_a_key, resume_b_key, resume_a, resume_b,
+                                      scores_a, scores_b, delta, weighted)
+    
+    def _build_comparison(self, resume_a_key: str, resume_b_key: str,
+                          resume_a: Dict, resume_b: Dict,
+                          scores_a: np.ndarray, scores_b: np.ndarray,
+                          delta: np.ndarray, weighted: np.ndarray) -> Dict[str, Any]:
+        """
+        Assemble a comparison dict from precomputed component vectors.
+        
+        Args:
+            resume_a_key: Key for first resume (higher ranked)
+            resume_b_key: Key for second resume (lower ranked)
+            resume_a: Evaluation result for resume A
+            resume_b: Evaluation result for resume B
+            scores_a: Component scores for resume A
+            scores_b: Component scores for resume B
+            delta: Component score deltas (A - B)
+            weighted: Weighted component deltas
+            
+        Returns:
+            Dict with comparison details and top-3 reasons
+        """
         # Get evidence
         evidence_a = self.evidence.get(resume_a_key, {})
         evidence_b = self.evidence.get(resume_b_key, {})
         
-        # Calculate deltas for each component
+        final_delta = resume_a['final_score'] - resume_b['final_score']
         deltas = {
             'final_score': {
                 'resume_a': resume_a['final_score'],
                 'resume_b': resume_b['final_score'],
-                'delta': resume_a['final_score'] - resume_b['final_score'],
-                'delta_pct': (resume_a['final_score'] - resume_b['final_score']) * 100
-            },
-            'education': {
-                'resume_a': resume_a['component_scores']['education'],
-                'resume_b': resume_b['component_scores']['education'],
-                'delta': resume_a['component_scores']['education'] - resume_b['component_scores']['education'],
-                'weighted_impact': (resume_a['component_scores']['education'] - resume_b['component_scores']['education']) * self.weights.get('education', 0.30)
-            },
-            'experience': {
-                'resume_a': resume_a['component_scores']['experience'],
-                'resume_b': resume_b['component_scores']['experience'],
-                'delta': resume_a['component_scores']['experience'] - resume_b['component_scores']['experience'],
-                'weighted_impact': (resume_a['component_scores']['experience'] - resume_b['component_scores']['experience']) * self.weights.get('experience', 0.30)
-            },
-            'publications': {
-                'resume_a': resume_a['component_scores']['publications'],
-                'resume_b': resume_b['component_scores']['publications'],
-                'delta': resume_a['component_scores']['publications'] - resume_b['component_scores']['publications'],
-                'weighted_impact': (resume_a['component_scores']['publications'] - resume_b['component_scores']['publications']) * self.weights.get('publications', 0.25)
-            },
-            'coherence': {
-                'resume_a': resume_a['component_scores']['coherence'],
-                'resume_b': resume_b['component_scores']['coherence'],
-                'delta': resume_a['component_scores']['coherence'] - resume_b['component_scores']['coherence'],
-                'weighted_impact': (resume_a['component_scores']['coherence'] - resume_b['component_scores']['coherence']) * self.weights.get('coherence', 0.10)
-            },
-            'awards': {
-                'resume_a': resume_a['component_scores']['awards'],
-                'resume_b': resume_b['component_scores']['awards'],
-                'delta': resume_a['component_scores']['awards'] - resume_b['component_scores']['awards'],
-                'weighted_impact': (resume_a['component_scores']['awards'] - resume_b['component_scores']['awards']) * self.weights.get('awards_other', 0.05)
+                'delta': final_delta,
+                'delta_pct': final_delta * 100
             }
         }
+        for component, s_a, s_b, d, w in zip(self._components, scores_a.tolist(), scores_b.tolist(),
+                                             delta.tolist(), weighted.tolist()):
+            deltas[component] = {
+                'resume_a': s_a,
+                'resume_b': s_b,
+                'delta': d,
+                'weighted_impact': w
+            }
         
         # Generate top-3 reasons with evidence
-        reasons = self._generate_top_reasons(resume_a, resume_b, evidence_a, evidence_b, deltas)
+        reasons = self._generate_top_reasons(resume_a, resume_b, evidence_a, evidence_b, deltas, weighted)
         
         return {
             'resume_a': {
@@ -196,378 +443,270 @@ class RankedResumeEvaluator(WeightedResumeEvaluator):
     
     def _generate_top_reasons(self, resume_a: Dict, resume_b: Dict, 
                              evidence_a: Dict, evidence_b: Dict,
-                             deltas: Dict) -> List[Dict[str, Any]]:
+                             deltas: Dict, weighted: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         Generate top-3 evidence-backed reasons why Resume A > Resume B.
         
+        Args:
+            resume_a: Evaluation result for resume A
+            resume_b: Evaluation result for resume B
+            evidence_a: Extracted evidence for resume A
+            evidence_b: Extracted evidence for resume B
+            deltas: Per-component delta table
+            weighted: Weighted impacts in component order (rebuilt from
+                deltas when omitted)
+            
         Returns:
             List of reason dicts with evidence spans
         """
-        reasons = []
+        if weighted is None:
+            weighted = np.fromiter(
+                (deltas[c]['weighted_impact'] for c in self._components),
+                dtype=np.float64, count=len(self._components)
+            )
         
-        # Collect all component impacts
-        impacts = []
-        
-        # Education
-        if deltas['education']['weighted_impact'] != 0:
-            impacts.append({
-                'component': 'education',
-                'impact': abs(deltas['education']['weighted_impact']),
-                'delta': deltas['education']['delta'],
-                'weighted_impact': deltas['education']['weighted_impact']
-            })
-        
-        # Experience
-        if deltas['experience']['weighted_impact'] != 0:
-            impacts.append({
-                'component': 'experience',
-                'impact': abs(deltas['experience']['weighted_impact']),
-                'delta': deltas['experience']['delta'],
-                'weighted_impact': deltas['experience']['weighted_impact']
-            })
-        
-        # Publications
-        if deltas['publications']['weighted_impact'] != 0:
-            impacts.append({
-                'component': 'publications',
-                'impact': abs(deltas['publications']['weighted_impact']),
-                'delta': deltas['publications']['delta'],
-                'weighted_impact': deltas['publications']['weighted_impact']
-            })
-        
-        # Coherence
-        if deltas['coherence']['weighted_impact'] != 0:
-            impacts.append({
-                'component': 'coherence',
-                'impact': abs(deltas['coherence']['weighted_impact']),
-                'delta': deltas['coherence']['delta'],
-                'weighted_impact': deltas['coherence']['weighted_impact']
-            })
-        
-        # Awards
-        if deltas['awards']['weighted_impact'] != 0:
-            impacts.append({
-                'component': 'awards',
-                'impact': abs(deltas['awards']['weighted_impact']),
-                'delta': deltas['awards']['delta'],
-                'weighted_impact': deltas['awards']['weighted_impact']
-            })
-        
-        # Sort by impact (absolute value)
-        impacts.sort(key=lambda x: x['impact'], reverse=True)
+        # Largest significant impacts by absolute value; stable for ties
+        top = self._top3_kernel(weighted, self._impact_threshold)
         
         # Generate top-3 reasons with evidence
-        for i, impact in enumerate(impacts[:3], 1):
-            component = impact['component']
-            reason = self._generate_reason_text(
+        components = self._components
+        reasons = []
+        for i in top.tolist():
+            component = components[i]
+            reasons.append(self._generate_reason_text(
                 component,
                 resume_a[component],
                 resume_b[component],
                 evidence_a,
                 evidence_b,
-                impact['weighted_impact']
-            )
-            reasons.append(reason)
-        
+                deltas[component]['weighted_impact']
+            ))
         return reasons
     
     def _generate_reason_text(self, component: str, data_a: Dict, data_b: Dict,
                              evidence_a: Dict, evidence_b: Dict,
                              weighted_impact: float) -> Dict[str, Any]:
         """Generate detailed reason text with evidence for a component."""
-        
-        if component == 'education':
-            return self._reason_education(data_a, data_b, evidence_a, evidence_b, weighted_impact)
-        elif component == 'experience':
-            return self._reason_experience(data_a, data_b, evidence_a, evidence_b, weighted_impact)
-        elif component == 'publications':
-            return self._reason_publications(data_a, data_b, evidence_a, evidence_b, weighted_impact)
-        elif component == 'coherence':
-            return self._reason_coherence(data_a, data_b, evidence_a, evidence_b, weighted_impact)
-        elif component == 'awards':
-            return self._reason_awards(data_a, data_b, evidence_a, evidence_b, weighted_impact)
-        
-        return {'reason': 'Unknown component', 'evidence': [], 'impact': weighted_impact}
+        spec = self._REASON_SPEC.get(component)
+        if spec is None:
+            return {'reason': 'Unknown component', 'evidence': [], 'impact': weighted_impact}
+        return self._reason_generic(spec, data_a, data_b, evidence_a, evidence_b, weighted_impact)
     
-    def _reason_education(self, data_a: Dict, data_b: Dict, 
-                         evidence_a: Dict, evidence_b: Dict,
-                         weighted_impact: float) -> Dict[str, Any]:
-        """Generate education comparison reason."""
-        score_a = data_a['weighted_score']
-        score_b = data_b['weighted_score']
-        
-        highlights = []
-        
-        # GPA comparison
-        if data_a['gpa_score'] > data_b['gpa_score']:
-            highlights.append(f"Higher GPA score ({data_a['gpa_score']:.1%} vs {data_b['gpa_score']:.1%})")
-        
-        # Degree level
-        if data_a['degree_level_score'] > data_b['degree_level_score']:
-            highlights.append(f"More advanced degree level ({data_a['degree_level_score']:.1%} vs {data_b['degree_level_score']:.1%})")
-        
-        # University tier
-        if data_a['university_tier_score'] > data_b['university_tier_score']:
-            highlights.append(f"Higher-tier university ({data_a['university_tier_score']:.1%} vs {data_b['university_tier_score']:.1%})")
-        
-        # Get education spans
-        edu_spans_a = [edu['span'] for edu in evidence_a.get('education_highlights', [])]
-        edu_spans_b = [edu['span'] for edu in evidence_b.get('education_highlights', [])]
-        
-        reason_text = f"Superior education credentials ({score_a:.1%} vs {score_b:.1%})"
-        if highlights:
-            reason_text += f": {'; '.join(highlights)}"
-        
-        return {
-            'component': 'Education',
-            'reason': reason_text,
-            'resume_a_score': score_a,
-            'resume_b_score': score_b,
-            'weighted_impact': weighted_impact,
-            'evidence_a': edu_spans_a,
-            'evidence_b': edu_spans_b,
-            'highlights': highlights
-        }
-    
-    def _reason_experience(self, data_a: Dict, data_b: Dict,
-                          evidence_a: Dict, evidence_b: Dict,
-                          weighted_impact: float) -> Dict[str, Any]:
-        """Generate experience comparison reason."""
-        score_a = data_a['weighted_score']
-        score_b = data_b['weighted_score']
-        
-        highlights = []
-        
-        # Total months
-        months_a = data_a['total_months']
-        months_b = data_b['total_months']
-        if months_a > months_b:
-            highlights.append(f"More experience ({months_a} months vs {months_b} months)")
-        
-        # Domain relevance
-        if data_a['domain_match_score'] > data_b['domain_match_score']:
-            highlights.append(f"Higher domain relevance ({data_a['domain_match_score']:.1%} vs {data_b['domain_match_score']:.1%})")
-        
-        # Experience bonus
-        if data_a['experience_bonus'] > data_b['experience_bonus']:
-            highlights.append(f"Qualifies for experience bonus ({data_a['experience_bonus']:.1%})")
-        
-        # Get experience spans
-        exp_spans_a = [exp['span'] for exp in evidence_a.get('experience_highlights', [])]
-        exp_spans_b = [exp['span'] for exp in evidence_b.get('experience_highlights', [])]
-        
-        reason_text = f"Stronger work experience ({score_a:.1%} vs {score_b:.1%})"
-        if highlights:
-            reason_text += f": {'; '.join(highlights)}"
-        
-        return {
-            'component': 'Experience',
-            'reason': reason_text,
-            'resume_a_score': score_a,
-            'resume_b_score': score_b,
-            'weighted_impact': weighted_impact,
-            'evidence_a': exp_spans_a,
-            'evidence_b': exp_spans_b,
-            'highlights': highlights
-        }
-    
-    def _reason_publications(self, data_a: Dict, data_b: Dict,
-                            evidence_a: Dict, evidence_b: Dict,
-                            weighted_impact: float) -> Dict[str, Any]:
-        """Generate publications comparison reason."""
-        score_a = data_a['weighted_score']
-        score_b = data_b['weighted_score']
-        
-        highlights = []
-        
-        # Count
-        count_a = data_a['count']
-        count_b = data_b['count']
-        if count_a > count_b:
-            highlights.append(f"More publications ({count_a} vs {count_b})")
-        
-        # Impact factor
-        if data_a['if_score'] > data_b['if_score']:
-            highlights.append(f"Higher impact factor ({data_a['if_score']:.1%} vs {data_b['if_score']:.1%})")
-        
-        # Author position
-        if data_a['author_position_score'] > data_b['author_position_score']:
-            highlights.append(f"Better author positions ({data_a['author_position_score']:.1%} vs {data_b['author_position_score']:.1%})")
-        
-        # First author bonus
-        if data_a['first_author_bonus'] > data_b['first_author_bonus']:
-            highlights.append("Has first-author publications")
-        
-        # Get publication spans
-        pub_spans_a = [pub['span'] for pub in evidence_a.get('publications_highlights', [])]
-        pub_spans_b = [pub['span'] for pub in evidence_b.get('publications_highlights', [])]
-        
-        reason_text = f"Better publication record ({score_a:.1%} vs {score_b:.1%})"
-        if highlights:
-            reason_text += f": {'; '.join(highlights)}"
+    def _reason_generic(self, spec: Dict[str, Any], data_a: Dict, data_b: Dict,
+                        evidence_a: Dict, evidence_b: Dict,
+                        weighted_impact: float) -> Dict[str, Any]:
+        """
+        Generate a component comparison reason from its _REASON_SPEC entry.
         
-        return {
-            'component': 'Publications',
-            'reason': reason_text,
-            'resume_a_score': score_a,
-            'resume_b_score': score_b,
-            'weighted_impact': weighted_impact,
-            'evidence_a': pub_spans_a,
-            'evidence_b': pub_spans_b,
-            'highlights': highlights
-        }
-    
-    def _reason_coherence(self, data_a: Dict, data_b: Dict,
-                         evidence_a: Dict, evidence_b: Dict,
-                         weighted_impact: float) -> Dict[str, Any]:
-        """Generate coherence comparison reason."""
+        Args:
+            spec: Reason specification for the component
+            data_a: Component evaluation for resume A
+            data_b: Component evaluation for resume B
+            evidence_a: Extracted evidence for resume A
+            evidence_b: Extracted evidence for resume B
+            weighted_impact: Weighted score delta for the component
+            
+        Returns:
+            Reason dict with evidence spans and highlights
+        """
         score_a = data_a['weighted_score']
         score_b = data_b['weighted_score']
+        always = spec['always_highlight']
         
         highlights = []
-        
-        if data_a['section_coherence'] > data_b['section_coherence']:
-            highlights.append(f"Better section completeness ({data_a['section_coherence']:.1%} vs {data_b['section_coherence']:.1%})")
-        
-        if data_a['name_accuracy'] > data_b['name_accuracy']:
-            highlights.append(f"More accurate name extraction ({data_a['name_accuracy']:.1%} vs {data_b['name_accuracy']:.1%})")
-        
-        reason_text = f"Higher extraction accuracy ({score_a:.1%} vs {score_b:.1%})"
-        if highlights:
+        for field, label, fmt in spec['fields']:
+            a = data_a[field]
+            b = data_b[field]
+            if always or a > b:
+                highlights.append(self._HIGHLIGHT_FORMATS[fmt](label, a, b))
+        
+        evidence_key = spec['evidence']
+        if evidence_key:
+            spans_a = evidence_a.get(evidence_key, [])
+            spans_b = evidence_b.get(evidence_key, [])
+        else:
+            spans_a = [f"Name: {evidence_a.get('name', 'Unknown')}"]
+            spans_b = [f"Name: {evidence_b.get('name', 'Unknown')}"]
+        
+        reason_text = spec['title'] + " (" + _PCT(score_a) + " vs " + _PCT(score_b) + ")"
+        if highlights and not always:
             reason_text += f": {'; '.join(highlights)}"
         
         return {
-            'component': 'Coherence',
+            'component': spec['label'],
             'reason': reason_text,
             'resume_a_score': score_a,
             'resume_b_score': score_b,
             'weighted_impact': weighted_impact,
-            'evidence_a': [f"Name: {evidence_a.get('name', 'Unknown')}"],
-            'evidence_b': [f"Name: {evidence_b.get('name', 'Unknown')}"],
+            'evidence_a': spans_a,
+            'evidence_b': spans_b,
             'highlights': highlights
         }
     
-    def _reason_awards(self, data_a: Dict, data_b: Dict,
-                      evidence_a: Dict, evidence_b: Dict,
-                      weighted_impact: float) -> Dict[str, Any]:
-        """Generate awards comparison reason."""
-        score_a = data_a['weighted_score']
-        score_b = data_b['weighted_score']
-        count_a = data_a['count']
-        count_b = data_b['count']
-        
-        highlights = [f"More awards/certifications ({count_a} vs {count_b})"]
-        
-        # Get award spans
-        award_spans_a = [awd['span'] for awd in evidence_a.get('awards_highlights', [])]
-        award_spans_b = [awd['span'] for awd in evidence_b.get('awards_highlights', [])]
-        
-        reason_text = f"More awards and certifications ({score_a:.1%} vs {score_b:.1%})"
-        
-        return {
-            'component': 'Awards',
-            'reason': reason_text,
-            'resume_a_score': score_a,
-            'resume_b_score': score_b,
-            'weighted_impact': weighted_impact,
-            'evidence_a': award_spans_a,
-            'evidence_b': award_spans_b,
-            'highlights': highlights
-        }
-    
-    def evaluate_all_with_ranking(self) -> Dict[str, Any]:
+    def evaluate_all_with_ranking(self, full_rankings: bool = True,
+                                  max_workers: Optional[int] = None,
+                                  lazy_comparisons: bool = False) -> Dict[str, Any]:
         """
         Evaluate all resumes, rank them, and generate comparisons.
         
+        Args:
+            full_rankings: Rank the whole pool; when False only the top
+                candidates used for comparisons are selected and stored
+            max_workers: Extract evidence on a thread pool of this size
+                (default: serial)
+            lazy_comparisons: Store only the (resume_a, resume_b) key pairs in
+                'comparison_pairs'; build them with iter_comparisons or
+                materialize_comparisons when needed
+            
         Returns:
             Dict with evaluations, rankings, and pairwise comparisons
         """
         # First, extract evidence for all resumes
-        for key in self.generated_map.keys():
-            resume = self.generated_map[key]
-            self._extract_evidence(resume, key)
+        if max_workers:
+            pending = [
+                (key, resume) for key, resume in self.generated_map.items()
+                if key not in self.evidence or self._evidence_src.get(key) is not resume
+            ]
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                items = list(ex.map(
+                    lambda kv: (kv[0], self._build_evidence(kv[1])),
+                    pending
+                ))
+            self.evidence.update(items)
+            self._evidence_src.update(pending)
+        else:
+            for key in self.generated_map.keys():
+                resume = self.generated_map[key]
+                self._extract_evidence(resume, key)
         
         # Run standard evaluation
         results = self.evaluate_all()
-        
-        # Rank resumes
-        rankings = self.rank_resumes(results)
+        self._build_score_matrix(results)
+        
+        # Rank resumes; comparisons only need the top 5
+        if full_rankings:
+            rankings = self.rank_resumes(results)
+            top = rankings[:5]
+        else:
+            rankings = top = self.top_k_rankings(results, 5)
         results['rankings'] = rankings
         
-        # Generate pairwise comparisons for top candidates
-        comparisons = []
-        for i in range(min(3, len(rankings))):  # Top 3 candidates
-            for j in range(i + 1, min(5, len(rankings))):  # Compare with next few
-                resume_a_key = rankings[i][0]
-                resume_b_key = rankings[j][0]
-                comparison = self.compare_resumes(resume_a_key, resume_b_key, results)
-                comparisons.append(comparison)
+        # Pair top candidates: top 3 against the next few
+        index_pairs = [(i, j) for i in range(min(3, len(top))) for j in range(i + 1, len(top))]
+        
+        if lazy_comparisons:
+            results['comparison_pairs'] = [(top[i][0], top[j][0]) for i, j in index_pairs]
+        else:
+            # Broadcast the whole (K, K, components) delta grid for the top rows once
+            per_resume = results['per_resume']
+            top_scores = self._score_matrix[[self._key_to_idx[key] for key, _, _ in top]]
+            grid_delta = top_scores[:, None, :] - top_scores[None, :, :]
+            grid_weighted = grid_delta * self._weights_vec
+            results['comparisons'] = [
+                self._build_comparison(
+                    top[i][0], top[j][0], per_resume[top[i][0]], per_resume[top[j][0]],
+                    top_scores[i], top_scores[j], grid_delta[i, j], grid_weighted[i, j]
+                )
+                for i, j in index_pairs
+            ]
         
-        results['comparisons'] = comparisons
+        return results
+    
+    def iter_comparisons(self, results: Dict[str, Any]):
+        """
+        Yield pairwise comparisons, building them on demand for lazy results.
+        
+        Args:
+            results: Results from evaluate_all_with_ranking
+            
+        Returns:
+            Iterator of comparison dicts
+        """
+        if 'comparisons' in results:
+            yield from results['comparisons']
+            return
+        for resume_a_key, resume_b_key in results.get('comparison_pairs', []):
+            yield self.compare_resumes(resume_a_key, resume_b_key, results)
+    
+    def materialize_comparisons(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the full 'comparisons' list, e.g. before serializing lazy results.
         
+        Args:
+            results: Results from evaluate_all_with_ranking
+            
+        Returns:
+            The same results dict with 'comparisons' populated
+        """
+        if 'comparisons' not in results:
+            results['comparisons'] = list(self.iter_comparisons(results))
         return results
     
     def print_ranking_report(self, results: Dict[str, Any]):
         """Print ranking and comparison report."""
-        print("\n" + "=" * 80)
-        print("CANDIDATE RANKINGS")
-        print("=" * 80)
-        print()
+        # Build the whole report in memory and write it to stdout once
+        buf = io.StringIO()
+        write = buf.write
+        rule = "=" * 80
+        thin_rule = "-" * 80
+        
+        write(f"\n{rule}\n")
+        write("CANDIDATE RANKINGS\n")
+        write(f"{rule}\n")
+        write("\n")
         
         rankings = results.get('rankings', [])
-        print(f"{'Rank':<6} {'Score':<8} {'Grade':<7} {'Candidate'}")
-        print("-" * 80)
+        write(f"{'Rank':<6} {'Score':<8} {'Grade':<7} {'Candidate'}\n")
+        write(f"{thin_rule}\n")
         for rank, (key, score, grade) in enumerate(rankings, 1):
             name = self.evidence.get(key, {}).get('name', key)
-            print(f"{rank:<6} {score:>6.1%} {grade:<7} {name}")
-        
-        print("\n" + "=" * 80)
-        print("PAIRWISE COMPARISONS - WHY A > B")
-        print("=" * 80)
-        
-        comparisons = results.get('comparisons', [])
-        for i, comp in enumerate(comparisons, 1):
-            print(f"\n{'=' * 80}")
-            print(f"Comparison #{i}: {comp['resume_a']['name']} vs {comp['resume_b']['name']}")
-            print(f"{'=' * 80}")
-            print(f"{comp['resume_a']['name']}: {comp['resume_a']['score']:.1%} (Grade {comp['resume_a']['grade']})")
-            print(f"{comp['resume_b']['name']}: {comp['resume_b']['score']:.1%} (Grade {comp['resume_b']['grade']})")
-            print(f"Score Difference: +{comp['deltas']['final_score']['delta_pct']:.1f} percentage points")
-            print()
+            write(f"{rank:<6} {score:>6.1%} {grade:<7} {name}\n")
+        
+        write(f"\n{rule}\n")
+        write("PAIRWISE COMPARISONS - WHY A > B\n")
+        write(f"{rule}\n")
+        
+        for i, comp in enumerate(self.iter_comparisons(results), 1):
+            write(f"\n{rule}\n")
+            write(f"Comparison #{i}: {comp['resume_a']['name']} vs {comp['resume_b']['name']}\n")
+            write(f"{rule}\n")
+            write(f"{comp['resume_a']['name']}: {comp['resume_a']['score']:.1%} (Grade {comp['resume_a']['grade']})\n")
+            write(f"{comp['resume_b']['name']}: {comp['resume_b']['score']:.1%} (Grade {comp['resume_b']['grade']})\n")
+            write(f"Score Difference: +{comp['deltas']['final_score']['delta_pct']:.1f} percentage points\n")
+            write("\n")
             
             # Delta table
-            print("Component Breakdown:")
-            print(f"{'Component':<15} {'A Score':<10} {'B Score':<10} {'Delta':<10} {'Impact'}")
-            print("-" * 80)
-            for component in ['education', 'experience', 'publications', 'coherence', 'awards']:
+            write("Component Breakdown:\n")
+            write(f"{'Component':<15} {'A Score':<10} {'B Score':<10} {'Delta':<10} {'Impact'}\n")
+            write(f"{thin_rule}\n")
+            for component in self._components:
                 delta = comp['deltas'][component]
-                print(f"{component.title():<15} {delta['resume_a']:>8.1%} {delta['resume_b']:>8.1%} "
-                      f"{delta['delta']:>+8.1%} {delta['weighted_impact']:>+8.1%}")
-            print()
+                write(_DELTA_ROW(component.title(), delta['resume_a'], delta['resume_b'],
+                                 delta['delta'], delta['weighted_impact']))
+            write("\n")
             
             # Top reasons
-            print("Top 3 Reasons Why A > B:")
-            print("-" * 80)
+            write("Top 3 Reasons Why A > B:\n")
+            write(f"{thin_rule}\n")
             for j, reason in enumerate(comp['top_reasons'], 1):
-                print(f"\n{j}. {reason['component'].upper()}")
-                print(f"   {reason['reason']}")
-                print(f"   Weighted Impact: {reason['weighted_impact']:+.1%}")
+                write(f"\n{j}. {reason['component'].upper()}\n")
+                write(f"   {reason['reason']}\n")
+                write("   Weighted Impact: " + _PCT_SIGNED(reason['weighted_impact']) + "\n")
                 
                 if reason.get('evidence_a'):
-                    print(f"   Evidence (A):")
+                    write("   Evidence (A):\n")
                     for evidence in reason['evidence_a'][:3]:  # Show top 3
-                        print(f"     • {evidence}")
+                        write(f"     • {evidence}\n")
                 
                 if reason.get('evidence_b'):
-                    print(f"   Evidence (B):")
+                    write("   Evidence (B):\n")
                     for evidence in reason['evidence_b'][:3]:  # Show top 3
-                        print(f"     • {evidence}")
-
+                        write(f"     • {evidence}\n")
+        
+        sys.stdout.write(buf.getvalue())
 
 def main():
     """Main function for ranked evaluation."""
-    import sys
-    
     if len(sys.argv) < 3:
         print("Usage: python ranked_evaluate.py <generated_json> <ground_truth_json> [config_json]")
         print("\nExample:")
@@ -590,8 +729,7 @@ def main():
     
     # Save results
     output_path = "ranked_evaluation_results.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    _write_results(results, output_path)
     
     print(f"\n{'=' * 80}")
     print(f"Detailed results saved to: {output_path}")
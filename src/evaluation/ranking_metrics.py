@@ -2,29 +2,168 @@
 Ranking metrics evaluation: Kendall's tau, Spearman's rho, pairwise accuracy, nDCG@k.
 Compares system rankings against ground truth rankings.
 """
-from typing import Dict, List, Any, Tuple
-import math
-from scipy import stats
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from scipy import special, stats
 import numpy as np
 
 
+# DCG position discounts 1 / log2(rank + 1) for ranks 1..len; grown on demand by _discounts()
+_DISCOUNTS = 1.0 / np.log2(np.arange(2, 4098, dtype=np.float64))
+
+
+def _discounts(k: int) -> np.ndarray:
+    """Return the DCG discounts for ranks 1..k from the shared table."""
+    global _DISCOUNTS
+    if k > _DISCOUNTS.shape[0]:
+        _DISCOUNTS = 1.0 / np.log2(np.arange(2, 2 * k + 2, dtype=np.float64))
+    return _DISCOUNTS[:k]
+
+
+# Interpretation tables: ascending lower bounds, and one more label than bounds
+# (labels[0] applies below the first bound)
+_TAU_BANDS = ((0, 0.3, 0.5, 0.7, 0.9), (
+    "Negative correlation (disagreement)",
+    "Very weak or no agreement",
+    "Weak agreement",
+    "Moderate agreement",
+    "Strong agreement",
+    "Excellent agreement",
+))
+_RHO_BANDS = ((0, 0.3, 0.5, 0.7, 0.9), (
+    "Negative correlation",
+    "Very weak or no correlation",
+    "Weak positive correlation",
+    "Moderate positive correlation",
+    "Strong positive correlation",
+    "Very strong positive correlation",
+))
+_PAIRWISE_BANDS = ((0.5, 0.65, 0.75, 0.85, 0.95), (
+    "Poor pairwise agreement",
+    "Fair pairwise agreement",
+    "Moderate pairwise agreement",
+    "Good pairwise agreement",
+    "Very good pairwise agreement",
+    "Excellent pairwise agreement",
+))
+_NDCG_BANDS = ((0.5, 0.65, 0.75, 0.85, 0.95), (
+    "Poor ranking quality",
+    "Fair ranking quality",
+    "Moderate ranking quality",
+    "Good ranking quality",
+    "Very good ranking quality",
+    "Excellent ranking quality",
+))
+
+
+def _band_label(value: float, bands: Tuple[Tuple[float, ...], Tuple[str, ...]]) -> str:
+    """Return the label of the highest band whose lower bound value reaches (NaN gets the lowest)."""
+    bounds, labels = bands
+    if not value >= bounds[0]:
+        return labels[0]
+    return labels[bisect_right(bounds, value)]
+
+
+# Reported precision per result key; metrics are computed at full precision and
+# rounded once by _round_metrics() when the result is complete
+_ROUNDING = {
+    'tau': 4, 'rho': 4, 'p_value': 6, 'accuracy': 4,
+    'ndcg': 4, 'dcg': 4, 'idcg': 4, 'system_score': 4, 'gt_score': 4,
+}
+
+
+def _round_metrics(obj: Any) -> None:
+    """Round, in place, every float stored under a _ROUNDING key in nested dicts and lists."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, float):
+                if key in _ROUNDING:
+                    obj[key] = round(float(value), _ROUNDING[key])
+            elif isinstance(value, (dict, list)):
+                _round_metrics(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            if isinstance(item, (dict, list)):
+                _round_metrics(item)
+
+
+def _common_ids(system_scores: Dict[str, float], ground_truth_scores: Dict[str, float]) -> List[str]:
+    """
+    Resume IDs scored by both dictionaries, in the insertion order of the smaller one.
+    
+    One membership test per key of the smaller dict, without building
+    intermediate sets, and a deterministic order (unlike a set intersection).
+    """
+    if len(system_scores) <= len(ground_truth_scores):
+        return [rid for rid in system_scores if rid in ground_truth_scores]
+    return [rid for rid in ground_truth_scores if rid in system_scores]
+
+
+# Thread pool shared by every evaluator with ranking_metrics.parallel set,
+# created on first use; concurrent.futures joins its threads at interpreter exit
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Return the shared metric thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=4)
+    return _executor
+
+
 class RankingMetricsEvaluator:
     """
     Evaluates ranking quality using standard IR metrics.
     Compares system-generated rankings to ground truth rankings.
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    # Kendall tau-b and pairwise agreement kernels plus the factorial table,
+    # loaded once per process by _load_kernels()
+    _kendall_kernel = None
+    _pairwise_kernel = None
+    _factorials = None
+    
+    def __init__(self, config: Dict[str, Any], compute_pvalues: Optional[bool] = None):
         """
         Initialize ranking metrics evaluator.
         
         Args:
             config: Evaluation configuration dictionary
+            compute_pvalues: Whether to compute p-values (and 'significant') for tau
+                and rho; defaults to ranking_metrics.compute_pvalues, else True
         """
         self.config = config
         self.ranking_config = config.get('ranking_metrics', {})
-        self.ndcg_k_values = self.ranking_config.get('ndcg_k_values', [3, 5, 10])
+        if compute_pvalues is None:
+            compute_pvalues = self.ranking_config.get('compute_pvalues', True)
+        self.compute_pvalues = compute_pvalues
+        self.ndcg_k_values = tuple(self.ranking_config.get('ndcg_k_values', [3, 5, 10]))
         self.pairwise_threshold = self.ranking_config.get('pairwise_threshold', 0.05)
+        # Single precision for the memory-bound pairwise system scores and nDCG
+        # arrays; ground truth pair selection and rank correlations (and their
+        # p-values) always use float64
+        self.score_dtype = np.float32 if self.ranking_config.get('use_float32', False) else np.float64
+        # DCG is never needed past the largest cutoff, so the discounts are sized once here
+        self.max_k = max((0,) + self.ndcg_k_values)
+        self._ndcg_discounts = _discounts(self.max_k).astype(self.score_dtype)
+        # Optional thread pool (shared by all evaluators) for computing the independent
+        # metrics concurrently; below parallel_min_candidates the submission
+        # overhead outweighs the gain
+        self.parallel_min_candidates = self.ranking_config.get('parallel_min_candidates', 20)
+        self._executor = _shared_executor() if self.ranking_config.get('parallel', False) else None
+        self._load_kernels()
+    
+    @classmethod
+    def _load_kernels(cls):
+        """Import the ranking kernels and compile (or load the cached) JIT code."""
+        if cls._kendall_kernel is None:
+            from ._rank_numba import kendall_tau_b, pairwise_agreement, warm_up, _FACTORIALS
+            warm_up()
+            cls._factorials = _FACTORIALS
+            cls._pairwise_kernel = staticmethod(pairwise_agreement)
+            cls._kendall_kernel = staticmethod(kendall_tau_b)
     
     def evaluate_ranking(self, 
                         system_scores: Dict[str, float],
@@ -40,7 +179,7 @@ class RankingMetricsEvaluator:
             Dictionary with all ranking metrics
         """
         # Get common resume IDs
-        common_ids = set(system_scores.keys()) & set(ground_truth_scores.keys())
+        common_ids = _common_ids(system_scores, ground_truth_scores)
         
         if len(common_ids) < 2:
             return {
@@ -49,51 +188,190 @@ class RankingMetricsEvaluator:
             }
         
         # Convert to lists maintaining correspondence
-        common_ids = list(common_ids)
         system_scores_list = [system_scores[rid] for rid in common_ids]
         gt_scores_list = [ground_truth_scores[rid] for rid in common_ids]
         
-        # Calculate all metrics
+        # Convert and rank once; ranks are shared by the rank-correlation metrics
+        sys_arr = np.asarray(system_scores_list, dtype=np.float64)
+        gt_arr = np.asarray(gt_scores_list, dtype=np.float64)
+        
+        return self._evaluate_arrays(
+            common_ids, system_scores_list, gt_scores_list, sys_arr, gt_arr,
+            stats.rankdata(sys_arr), stats.rankdata(gt_arr),
+            np.argsort(-sys_arr, kind='stable')
+        )
+    
+    def evaluate_ranking_batch(self,
+                               system_scores_list: List[Dict[str, float]],
+                               ground_truth_scores_list: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate many rankings (e.g. one per job) at once.
+        
+        Candidates of all jobs are packed into padded (jobs x candidates) score
+        matrices, so ranking, sorting and Kendall's tau run once over all rows
+        instead of once per job. Each result matches evaluate_ranking().
+        
+        Args:
+            system_scores_list: Per job, dictionary mapping resume ID to system score
+            ground_truth_scores_list: Per job, dictionary mapping resume ID to ground truth score
+            
+        Returns:
+            List of ranking metric dictionaries, in input order
+        """
+        results = [None] * len(system_scores_list)
+        
+        # Common IDs per job; jobs with too few candidates are reported individually
+        jobs = []
+        for row, (system_scores, ground_truth_scores) in enumerate(
+                zip(system_scores_list, ground_truth_scores_list)):
+            common_ids = _common_ids(system_scores, ground_truth_scores)
+            if len(common_ids) < 2:
+                results[row] = self.evaluate_ranking(system_scores, ground_truth_scores)
+            else:
+                jobs.append((row, common_ids,
+                             [system_scores[rid] for rid in common_ids],
+                             [ground_truth_scores[rid] for rid in common_ids]))
+        
+        if not jobs:
+            return results
+        
+        # Structure-of-arrays layout: one row per job, valid candidates first, NaN padding
+        lengths = np.array([len(job[1]) for job in jobs], dtype=np.int64)
+        max_n = int(lengths.max())
+        sys_mat = np.full((len(jobs), max_n), np.nan)
+        gt_mat = np.full((len(jobs), max_n), np.nan)
+        for r, (_, _, sys_list, gt_list) in enumerate(jobs):
+            sys_mat[r, :lengths[r]] = sys_list
+            gt_mat[r, :lengths[r]] = gt_list
+        
+        # Padding is left unranked, and sorts after every valid score (NaN
+        # sorts last and the stable sort keeps it behind any real NaN scores).
+        # Rows holding real NaNs are caught by the Spearman NaN check before
+        # their ranks are used.
+        sys_ranks = stats.rankdata(sys_mat, axis=1, nan_policy='omit')
+        gt_ranks = stats.rankdata(gt_mat, axis=1, nan_policy='omit')
+        sys_ranked = np.argsort(-sys_mat, axis=1, kind='stable')
+        
+        from ._rank_numba import kendall_tau_b_rows
+        kendall = kendall_tau_b_rows(sys_mat, gt_mat, lengths, self._factorials, self.compute_pvalues)
+        
+        for r, (row, common_ids, sys_list, gt_list) in enumerate(jobs):
+            n = lengths[r]
+            results[row] = self._evaluate_arrays(
+                common_ids, sys_list, gt_list, sys_mat[r, :n], gt_mat[r, :n],
+                sys_ranks[r, :n], gt_ranks[r, :n], sys_ranked[r, :n],
+                kendall=(kendall[r, 0], kendall[r, 1])
+            )
+        
+        return results
+    
+    def _evaluate_arrays(self,
+                         common_ids: List[str],
+                         system_scores_list: List[float],
+                         gt_scores_list: List[float],
+                         sys_arr: np.ndarray,
+                         gt_arr: np.ndarray,
+                         sys_rank: np.ndarray,
+                         gt_rank: np.ndarray,
+                         sys_ranked: np.ndarray,
+                         kendall: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+        """
+        Compute all ranking metrics for one aligned set of candidates.
+        
+        Args:
+            common_ids: Resume IDs
+            system_scores_list: System scores, aligned with common_ids
+            gt_scores_list: Ground truth scores, aligned with common_ids
+            sys_arr: system_scores_list as an array
+            gt_arr: gt_scores_list as an array
+            sys_rank: Average ranks of sys_arr
+            gt_rank: Average ranks of gt_arr
+            sys_ranked: Indices in descending system-score order (stable)
+            kendall: Precomputed (tau, p_value), if already available
+            
+        Returns:
+            Dictionary with all ranking metrics
+        """
+        # Calculate all metrics; they share no mutable state, so larger pools can
+        # run them concurrently (the kernels and NumPy release the GIL)
+        if self._executor is not None and len(common_ids) >= self.parallel_min_candidates:
+            futures = (
+                self._executor.submit(self._calculate_kendall_tau, sys_arr, gt_arr, kendall),
+                self._executor.submit(self._calculate_spearman_rho, sys_arr, gt_arr, sys_rank, gt_rank),
+                self._executor.submit(self._calculate_pairwise_accuracy,
+                                      system_scores_list, gt_scores_list, common_ids),
+                self._executor.submit(self._calculate_ndcg_all, system_scores_list, gt_scores_list,
+                                      common_ids, gt_arr, sys_ranked)
+            )
+            kendall_tau, spearman_rho, pairwise_accuracy, ndcg = (
+                future.result() for future in futures
+            )
+        else:
+            kendall_tau = self._calculate_kendall_tau(sys_arr, gt_arr, kendall)
+            spearman_rho = self._calculate_spearman_rho(sys_arr, gt_arr, sys_rank, gt_rank)
+            pairwise_accuracy = self._calculate_pairwise_accuracy(
+                system_scores_list, gt_scores_list, common_ids
+            )
+            ndcg = self._calculate_ndcg_all(
+                system_scores_list, gt_scores_list, common_ids, gt_arr, sys_ranked
+            )
+        
         results = {
             'num_candidates': len(common_ids),
             'candidate_ids': common_ids,
-            'kendall_tau': self._calculate_kendall_tau(system_scores_list, gt_scores_list),
-            'spearman_rho': self._calculate_spearman_rho(system_scores_list, gt_scores_list),
-            'pairwise_accuracy': self._calculate_pairwise_accuracy(
-                system_scores_list, gt_scores_list, common_ids
-            ),
-            'ndcg': {}
+            'kendall_tau': kendall_tau,
+            'spearman_rho': spearman_rho,
+            'pairwise_accuracy': pairwise_accuracy,
+            'ndcg': ndcg
         }
         
-        # Calculate nDCG@k for different k values
-        for k in self.ndcg_k_values:
-            if k <= len(common_ids):
-                results['ndcg'][f'nDCG@{k}'] = self._calculate_ndcg_at_k(
-                    system_scores_list, gt_scores_list, common_ids, k
-                )
-        
-        # Add interpretation
-        results['interpretation'] = self._interpret_metrics(results)
+        # Add interpretation, from the rounded values that are reported
+        _round_metrics(results)
+        results['interpretation'] = self._interpret_metrics(
+            kendall_tau.get('tau'),
+            spearman_rho.get('rho'),
+            pairwise_accuracy['accuracy'],
+            np.mean([v['ndcg'] for v in ndcg.values()]) if ndcg else None
+        )
         
         return results
     
-    def _calculate_kendall_tau(self, system_scores: List[float], gt_scores: List[float]) -> Dict[str, Any]:
+    def _calculate_kendall_tau(self,
+                               system_scores: np.ndarray,
+                               gt_scores: np.ndarray,
+                               precomputed: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
         """
         Calculate Kendall's tau rank correlation coefficient.
         
         Measures the ordinal association between two rankings.
         Range: [-1, 1], where 1 = perfect agreement, 0 = no correlation, -1 = perfect disagreement
         
+        Args:
+            system_scores: System-generated scores
+            gt_scores: Ground truth scores
+            precomputed: (tau, p_value) from the batched kernel, used for n >= 5
+            
         Returns:
-            Dictionary with tau value, p-value, and interpretation
+            Dictionary with tau value, p-value, and interpretation (p_value and
+            significant are None when p-values are disabled)
         """
         try:
-            tau, p_value = stats.kendalltau(system_scores, gt_scores)
+            if not self.compute_pvalues:
+                # tau alone: the kernel stops before the p-value step
+                tau, _ = precomputed or self._kendall_kernel(system_scores, gt_scores, self._factorials, False)
+                p_value = None
+            elif len(system_scores) < 5:
+                tau, p_value = stats.kendalltau(system_scores, gt_scores)
+            elif precomputed is not None:
+                tau, p_value = precomputed
+            else:
+                # Knight's O(n log n) tau-b with the same exact/asymptotic p-values as SciPy
+                tau, p_value = self._kendall_kernel(system_scores, gt_scores, self._factorials, True)
             
             return {
-                'tau': round(float(tau), 4),
-                'p_value': round(float(p_value), 6),
-                'significant': p_value < 0.05,
+                'tau': float(tau),
+                'p_value': None if p_value is None else float(p_value),
+                'significant': None if p_value is None else p_value < 0.05,
                 'interpretation': self._interpret_tau(tau)
             }
         except Exception as e:
@@ -102,23 +380,48 @@ class RankingMetricsEvaluator:
                 'error': str(e)
             }
     
-    def _calculate_spearman_rho(self, system_scores: List[float], gt_scores: List[float]) -> Dict[str, Any]:
+    def _calculate_spearman_rho(self,
+                                system_scores: np.ndarray,
+                                gt_scores: np.ndarray,
+                                system_ranks: np.ndarray,
+                                gt_ranks: np.ndarray) -> Dict[str, Any]:
         """
         Calculate Spearman's rho rank correlation coefficient.
         
         Measures the monotonic relationship between two rankings.
         Range: [-1, 1], where 1 = perfect positive correlation
         
+        Args:
+            system_scores: System-generated scores
+            gt_scores: Ground truth scores
+            system_ranks: Average ranks of system_scores
+            gt_ranks: Average ranks of gt_scores
+            
         Returns:
-            Dictionary with rho value, p-value, and interpretation
+            Dictionary with rho value, p-value, and interpretation (p_value and
+            significant are None when p-values are disabled)
         """
         try:
-            rho, p_value = stats.spearmanr(system_scores, gt_scores)
+            n = system_scores.shape[0]
+            if (n <= 1 or (system_scores == system_scores[0]).all() or (gt_scores == gt_scores[0]).all()
+                    or np.isnan(system_scores).any() or np.isnan(gt_scores).any()):
+                # Undefined for constant or NaN input, as in scipy.stats.spearmanr
+                rho = p_value = np.nan
+            else:
+                # Pearson correlation of the ranks with a two-sided t-test
+                rho = np.corrcoef(system_ranks, gt_ranks)[1, 0]
+                if self.compute_pvalues:
+                    dof = n - 2
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        t = rho * np.sqrt(max(dof / ((rho + 1.0) * (1.0 - rho)), 0))
+                    p_value = special.stdtr(dof, -abs(t)) * 2
+            if not self.compute_pvalues:
+                p_value = None
             
             return {
-                'rho': round(float(rho), 4),
-                'p_value': round(float(p_value), 6),
-                'significant': p_value < 0.05,
+                'rho': float(rho),
+                'p_value': None if p_value is None else float(p_value),
+                'significant': None if p_value is None else p_value < 0.05,
                 'interpretation': self._interpret_rho(rho)
             }
         except Exception as e:
@@ -139,52 +442,115 @@ class RankingMetricsEvaluator:
         Returns:
             Dictionary with accuracy, agreement counts, and sample disagreements
         """
-        n = len(system_scores)
-        total_pairs = 0
-        correct_pairs = 0
+        sys_arr = np.asarray(system_scores, dtype=self.score_dtype)
+        # Ground truth stays float64 so the pairs skipped by the threshold test
+        # (and their order) do not depend on score_dtype
+        gt_arr = np.asarray(gt_scores, dtype=np.float64)
+        
+        # One fused pass over all i < j pairs: pairs with very similar ground truth
+        # scores (within threshold) are skipped, the rest are checked for preserved
+        # order, and the first five disagreements are kept as index pairs
+        correct_pairs, total_pairs, first5 = self._pairwise_kernel(
+            sys_arr, gt_arr, float(self.pairwise_threshold)
+        )
+        correct_pairs, total_pairs = int(correct_pairs), int(total_pairs)
+        
+        # Only the recorded disagreements are turned into dicts
         disagreements = []
-        
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Skip pairs with very similar ground truth scores (within threshold)
-                if abs(gt_scores[i] - gt_scores[j]) < self.pairwise_threshold:
-                    continue
-                
-                total_pairs += 1
-                
-                # Check if order is preserved
-                gt_order = gt_scores[i] > gt_scores[j]
-                sys_order = system_scores[i] > system_scores[j]
-                
-                if gt_order == sys_order:
-                    correct_pairs += 1
-                else:
-                    # Record disagreement
-                    disagreements.append({
-                        'candidate_1': ids[i],
-                        'candidate_2': ids[j],
-                        'gt_scores': [gt_scores[i], gt_scores[j]],
-                        'system_scores': [system_scores[i], system_scores[j]],
-                        'gt_winner': ids[i] if gt_order else ids[j],
-                        'system_winner': ids[i] if sys_order else ids[j]
-                    })
+        for i, j in first5.tolist():
+            if i < 0:
+                break
+            gt_order = gt_arr[i] > gt_arr[j]
+            sys_order = sys_arr[i] > sys_arr[j]
+            disagreements.append({
+                'candidate_1': ids[i],
+                'candidate_2': ids[j],
+                'gt_scores': [gt_scores[i], gt_scores[j]],
+                'system_scores': [system_scores[i], system_scores[j]],
+                'gt_winner': ids[i] if gt_order else ids[j],
+                'system_winner': ids[i] if sys_order else ids[j]
+            })
         
         accuracy = correct_pairs / total_pairs if total_pairs > 0 else 0.0
         
         return {
-            'accuracy': round(accuracy, 4),
+            'accuracy': accuracy,
             'correct_pairs': correct_pairs,
             'total_pairs': total_pairs,
             'incorrect_pairs': total_pairs - correct_pairs,
-            'sample_disagreements': disagreements[:5],  # Show first 5 disagreements
+            'sample_disagreements': disagreements,  # First 5 disagreements
             'interpretation': self._interpret_pairwise_accuracy(accuracy)
         }
     
+    def _calculate_ndcg_all(self,
+                            system_scores: List[float],
+                            gt_scores: List[float],
+                            ids: List[str],
+                            gt_arr: np.ndarray,
+                            sys_ranked: np.ndarray) -> Dict[str, Any]:
+        """
+        Calculate nDCG@k for every configured k that fits the candidate count.
+        
+        Both orders are sorted once and every k reads DCG and IDCG from the
+        cumulative discounted gains.
+        
+        Args:
+            system_scores: System-generated scores
+            gt_scores: Ground truth scores (used as relevance)
+            ids: Resume IDs
+            gt_arr: gt_scores as an array
+            sys_ranked: Indices in descending system-score order (stable)
+            
+        Returns:
+            nDCG results keyed 'nDCG@k'
+        """
+        gains = gt_arr.astype(self.score_dtype, copy=False)
+        m = min(gains.shape[0], self.max_k)
+        sys_cumdcg = np.cumsum(gains[sys_ranked[:m]] * self._ndcg_discounts[:m])
+        ideal_ranks, ideal_cumdcg = self._precompute_ideal(gains)
+        ndcg = {}
+        for k in self.ndcg_k_values:
+            if k <= len(ids):
+                ndcg_at_k = self._calculate_ndcg_at_k(
+                    system_scores, gt_scores, ids, k,
+                    sys_ranked[:k].tolist(),
+                    float(sys_cumdcg[k - 1]) if k > 0 else 0.0,
+                    float(ideal_cumdcg[k - 1]) if k > 0 else 0.0,
+                    ideal_ranks
+                )
+                ndcg[f'nDCG@{k}'] = ndcg_at_k
+        return ndcg
+    
+    def _precompute_ideal(self, gt_scores: np.ndarray) -> Tuple[List[int], np.ndarray]:
+        """
+        Sort ground truth once into the ideal ranking shared by every nDCG@k.
+        
+        Args:
+            gt_scores: Ground truth scores (used as relevance)
+            
+        Returns:
+            Tuple of (1-based ideal rank per candidate, cumulative ideal DCG up to
+            max_k where entry k - 1 is IDCG@k)
+        """
+        n = gt_scores.shape[0]
+        ideal_indices = np.argsort(-gt_scores, kind='stable')
+        m = min(n, self.max_k)
+        ideal_cumdcg = np.cumsum(gt_scores[ideal_indices[:m]] * self._ndcg_discounts[:m])
+        
+        # Inverse permutation: ideal_indices[r] = i  <=>  ideal_ranks[i] = r + 1
+        ideal_ranks = np.empty(n, dtype=np.int64)
+        ideal_ranks[ideal_indices] = np.arange(1, n + 1)
+        return ideal_ranks.tolist(), ideal_cumdcg
+    
     def _calculate_ndcg_at_k(self, 
                             system_scores: List[float], 
                             gt_scores: List[float],
                             ids: List[str],
-                            k: int) -> Dict[str, Any]:
+                            k: int,
+                            top_k_indices: List[int],
+                            dcg: float,
+                            idcg: float,
+                            ideal_ranks: List[int]) -> Dict[str, Any]:
         """
         Calculate Normalized Discounted Cumulative Gain at k (nDCG@k).
         
@@ -196,36 +562,14 @@ class RankingMetricsEvaluator:
             gt_scores: Ground truth scores (used as relevance)
             ids: Resume IDs
             k: Cutoff position
+            top_k_indices: Indices of the top k candidates by system score
+            dcg: DCG@k of the system ranking, rel_i / log2(i + 1) summed over the top k
+            idcg: IDCG@k (DCG@k of the perfect ranking)
+            ideal_ranks: 1-based ideal (ground truth) rank of every candidate
             
         Returns:
             Dictionary with nDCG@k value and details
         """
-        # Create ranking based on system scores
-        ranked_indices = sorted(range(len(system_scores)), 
-                               key=lambda i: system_scores[i], 
-                               reverse=True)
-        
-        # Get top k
-        top_k_indices = ranked_indices[:k]
-        
-        # Calculate DCG@k using ground truth scores as relevance
-        dcg = 0.0
-        for rank_pos, idx in enumerate(top_k_indices, start=1):
-            relevance = gt_scores[idx]
-            # DCG formula: rel_i / log2(i + 1)
-            dcg += relevance / math.log2(rank_pos + 1)
-        
-        # Calculate IDCG@k (ideal DCG with perfect ranking)
-        ideal_indices = sorted(range(len(gt_scores)), 
-                              key=lambda i: gt_scores[i], 
-                              reverse=True)
-        ideal_top_k = ideal_indices[:k]
-        
-        idcg = 0.0
-        for rank_pos, idx in enumerate(ideal_top_k, start=1):
-            relevance = gt_scores[idx]
-            idcg += relevance / math.log2(rank_pos + 1)
-        
         # Calculate nDCG
         ndcg = dcg / idcg if idcg > 0 else 0.0
         
@@ -235,15 +579,15 @@ class RankingMetricsEvaluator:
             top_k_details.append({
                 'rank': rank_pos,
                 'candidate': ids[idx],
-                'system_score': round(system_scores[idx], 4),
-                'gt_score': round(gt_scores[idx], 4),
-                'ideal_rank': ideal_indices.index(idx) + 1
+                'system_score': system_scores[idx],
+                'gt_score': gt_scores[idx],
+                'ideal_rank': ideal_ranks[idx]
             })
         
         return {
-            'ndcg': round(ndcg, 4),
-            'dcg': round(dcg, 4),
-            'idcg': round(idcg, 4),
+            'ndcg': ndcg,
+            'dcg': dcg,
+            'idcg': idcg,
             'k': k,
             'top_k_ranking': top_k_details,
             'interpretation': self._interpret_ndcg(ndcg)
@@ -251,66 +595,37 @@ class RankingMetricsEvaluator:
     
     def _interpret_tau(self, tau: float) -> str:
         """Interpret Kendall's tau value."""
-        if tau >= 0.9:
-            return "Excellent agreement"
-        elif tau >= 0.7:
-            return "Strong agreement"
-        elif tau >= 0.5:
-            return "Moderate agreement"
-        elif tau >= 0.3:
-            return "Weak agreement"
-        elif tau >= 0:
-            return "Very weak or no agreement"
-        else:
-            return "Negative correlation (disagreement)"
+        return _band_label(tau, _TAU_BANDS)
     
     def _interpret_rho(self, rho: float) -> str:
         """Interpret Spearman's rho value."""
-        if rho >= 0.9:
-            return "Very strong positive correlation"
-        elif rho >= 0.7:
-            return "Strong positive correlation"
-        elif rho >= 0.5:
-            return "Moderate positive correlation"
-        elif rho >= 0.3:
-            return "Weak positive correlation"
-        elif rho >= 0:
-            return "Very weak or no correlation"
-        else:
-            return "Negative correlation"
+        return _band_label(rho, _RHO_BANDS)
     
     def _interpret_pairwise_accuracy(self, accuracy: float) -> str:
         """Interpret pairwise accuracy."""
-        if accuracy >= 0.95:
-            return "Excellent pairwise agreement"
-        elif accuracy >= 0.85:
-            return "Very good pairwise agreement"
-        elif accuracy >= 0.75:
-            return "Good pairwise agreement"
-        elif accuracy >= 0.65:
-            return "Moderate pairwise agreement"
-        elif accuracy >= 0.5:
-            return "Fair pairwise agreement"
-        else:
-            return "Poor pairwise agreement"
+        return _band_label(accuracy, _PAIRWISE_BANDS)
     
     def _interpret_ndcg(self, ndcg: float) -> str:
         """Interpret nDCG value."""
-        if ndcg >= 0.95:
-            return "Excellent ranking quality"
-        elif ndcg >= 0.85:
-            return "Very good ranking quality"
-        elif ndcg >= 0.75:
-            return "Good ranking quality"
-        elif ndcg >= 0.65:
-            return "Moderate ranking quality"
-        elif ndcg >= 0.5:
-            return "Fair ranking quality"
-        else:
-            return "Poor ranking quality"
+        return _band_label(ndcg, _NDCG_BANDS)
     
-    def _interpret_metrics(self, results: Dict[str, Any]) -> Dict[str, str]:
-        """Generate overall interpretation of all metrics."""
+    def _interpret_metrics(self,
+                           tau: Optional[float],
+                           rho: Optional[float],
+                           pairwise_acc: Optional[float],
+                           avg_ndcg: Optional[float]) -> Dict[str, str]:
+        """
+        Generate overall interpretation of all metrics.
+        
+        Args:
+            tau: Kendall's tau (None if it could not be computed)
+            rho: Spearman's rho (None if it could not be computed)
+            pairwise_acc: Pairwise ranking accuracy
+            avg_ndcg: Mean nDCG over the evaluated k values (None if there were none)
+            
+        Returns:
+            Dictionary with summary, strengths and weaknesses
+        """
         interpretations = {
             'summary': '',
             'strengths': [],
@@ -318,30 +633,25 @@ class RankingMetricsEvaluator:
         }
         
         # Analyze tau
-        tau = results.get('kendall_tau', {}).get('tau')
         if tau and tau >= 0.7:
             interpretations['strengths'].append('Strong rank correlation (Kendall\'s tau)')
         elif tau and tau < 0.5:
             interpretations['weaknesses'].append('Weak rank correlation (Kendall\'s tau)')
         
         # Analyze rho
-        rho = results.get('spearman_rho', {}).get('rho')
         if rho and rho >= 0.7:
             interpretations['strengths'].append('Strong monotonic relationship (Spearman\'s rho)')
         elif rho and rho < 0.5:
             interpretations['weaknesses'].append('Weak monotonic relationship (Spearman\'s rho)')
         
         # Analyze pairwise accuracy
-        pairwise = results.get('pairwise_accuracy', {}).get('accuracy')
-        if pairwise and pairwise >= 0.85:
+        if pairwise_acc and pairwise_acc >= 0.85:
             interpretations['strengths'].append('High pairwise ranking accuracy')
-        elif pairwise and pairwise < 0.7:
+        elif pairwise_acc and pairwise_acc < 0.7:
             interpretations['weaknesses'].append('Low pairwise ranking accuracy')
         
         # Analyze nDCG
-        ndcg_results = results.get('ndcg', {})
-        if ndcg_results:
-            avg_ndcg = np.mean([v['ndcg'] for v in ndcg_results.values() if isinstance(v, dict)])
+        if avg_ndcg is not None:
             if avg_ndcg >= 0.85:
                 interpretations['strengths'].append('High nDCG scores across all k values')
             elif avg_ndcg < 0.7:
@@ -372,15 +682,57 @@ def calculate_ranking_metrics_from_results(system_results: Dict[str, Any],
     Returns:
         Dictionary with ranking metrics
     """
-    evaluator = RankingMetricsEvaluator(config)
+    evaluator = _evaluator_for(config)
+    
+    return evaluator.evaluate_ranking(_final_scores(system_results), _final_scores(ground_truth_results))
+
+
+def batch_evaluate_ranking(system_results_list: List[Dict[str, Any]],
+                           gt_results_list: List[Dict[str, Any]],
+                           config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Batch version of calculate_ranking_metrics_from_results for many jobs.
     
-    # Extract scores
-    system_scores = {}
-    for resume_key, resume_data in system_results.get('per_resume', {}).items():
-        system_scores[resume_key] = resume_data.get('final_score', 0.0)
+    Args:
+        system_results_list: System evaluation results per job
+        gt_results_list: Ground truth evaluation results per job, aligned with system_results_list
+        config: Configuration dictionary
+        
+    Returns:
+        List of ranking metric dictionaries, one per job
+    """
+    evaluator = _evaluator_for(config)
     
-    gt_scores = {}
-    for resume_key, resume_data in ground_truth_results.get('per_resume', {}).items():
-        gt_scores[resume_key] = resume_data.get('final_score', 0.0)
+    return evaluator.evaluate_ranking_batch(
+        [_final_scores(results) for results in system_results_list],
+        [_final_scores(results) for results in gt_results_list]
+    )
+
+
+# Evaluators built by the helpers above, keyed by id(config); the stored config
+# reference keeps the id from being reused while its entry is cached
+_EVALUATORS: Dict[int, Tuple[Dict[str, Any], RankingMetricsEvaluator]] = {}
+_EVALUATOR_CACHE_SIZE = 16
+
+
+def _evaluator_for(config: Dict[str, Any]) -> RankingMetricsEvaluator:
+    """
+    Return a cached evaluator for this config object, building it on first use.
     
-    return evaluator.evaluate_ranking(system_scores, gt_scores)
+    The config is parsed once per object, so it should not be mutated after
+    its first use with these helpers.
+    """
+    cached = _EVALUATORS.get(id(config))
+    if cached is None or cached[0] is not config:
+        if len(_EVALUATORS) >= _EVALUATOR_CACHE_SIZE:
+            _EVALUATORS.pop(next(iter(_EVALUATORS)))
+        cached = _EVALUATORS[id(config)] = (config, RankingMetricsEvaluator(config))
+    return cached[1]
+
+
+def _final_scores(results: Dict[str, Any]) -> Dict[str, float]:
+    """Extract resume ID -> final score from per-resume evaluation results."""
+    scores = {}
+    for resume_key, resume_data in results.get('per_resume', {}).items():
+        scores[resume_key] = resume_data.get('final_score', 0.0)
+    return scores
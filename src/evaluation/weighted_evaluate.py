@@ -2,15 +2,176 @@
 Weighted evaluation system for resume parsing with configurable weights and policies.
 Calculates scores based on education, experience, publications, coherence, and awards.
 """
+import io
 import json
 import os
-from typing import Dict, List, Any, Tuple
+import sys
+import copy
+from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import re
-from datetime import datetime
+from datetime import datetime, MINYEAR, MAXYEAR
 from dateutil import parser as date_parser
+import numpy as np
 from .coherence import CoherenceEvaluator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+_WS_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> str:
+    """Lowercase, strip and collapse whitespace; cached since the same names recur across resumes."""
+    return _WS_RE.sub(' ', text.lower().strip())
+
+
+# Common resume date forms: "2019", "2019-05", "05/2019", "May 2019" / "September 2019"
+_FAST_DATE_RE = re.compile(
+    r'\s*(?:(?P<y1>[1-9]\d{3})(?:-(?P<m1>\d{1,2}))?'
+    r'|(?P<m2>\d{1,2})/(?P<y2>[1-9]\d{3})'
+    r'|(?P<name>[A-Za-z]{3,9})\s+(?P<y3>[1-9]\d{3}))\s*$'
+)
+
+# Month names and abbreviations as accepted by dateutil
+_MONTHS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9, 'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11, 'dec': 12, 'december': 12,
+}
+
+
+def _fast_year_month(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Read (year, month) from a common date form without dateutil.
+    
+    Args:
+        text: Date string
+        
+    Returns:
+        (year, month) with month 0 when only a year is given, or None when
+        the text needs the full parser
+    """
+    m = _FAST_DATE_RE.match(text)
+    if m is None:
+        return None
+    if m.group('y1'):
+        if m.group('m1') is None:
+            return int(m.group('y1')), 0
+        year, month = m.group('y1'), int(m.group('m1'))
+    elif m.group('y2'):
+        year, month = m.group('y2'), int(m.group('m2'))
+    else:
+        year, month = m.group('y3'), _MONTHS.get(m.group('name').lower(), 0)
+    if not 1 <= month <= 12:
+        return None
+    return int(year), month
+
+
+def _calendar_year(value: Any) -> int:
+    """Year of a numeric date value; raises ValueError outside datetime's range, as datetime() would."""
+    year = int(value)
+    if not MINYEAR <= year <= MAXYEAR:
+        raise ValueError(f"year {year} is out of range")
+    return year
+
+
+def _months_between(start_year: int, start_month: int, end_year: int, end_month: int) -> int:
+    """Whole months from start to end, clamped at 0."""
+    return max(0, (end_year - start_year) * 12 + (end_month - start_month))
+
+
+def _write_results(results: Dict[str, Any], output_path: str):
+    """
+    Write results as indented JSON, using orjson when it is installed.
+    
+    Args:
+        results: Evaluation results to serialize
+        output_path: Destination file path
+    """
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+# University tiers (can be extended)
+_UNIVERSITY_TIERS = {
+    'tier1': ('MIT', 'Stanford', 'Harvard', 'Cambridge', 'Oxford', 'Caltech', 'Princeton'),
+    'tier2': ('National University of Sciences and Technology', 'NUST', 'IIT', 'Carnegie Mellon',
+              'UC Berkeley', 'Cornell', 'Yale', 'Columbia', 'ETH Zurich'),
+    'tier3': ()  # Default tier
+}
+
+# Degree levels
+_DEGREE_LEVELS = {
+    'PhD': 1.0,
+    'Ph.D': 1.0,
+    'Doctorate': 1.0,
+    'Master': 0.8,
+    'MS': 0.8,
+    'M.S.': 0.8,
+    'MBA': 0.8,
+    'Bachelor': 0.6,
+    'BS': 0.6,
+    'B.S.': 0.6,
+    'BA': 0.6,
+    'BE': 0.6
+}
+
+# Normalized degree names, matched in order against every education entry
+_DEGREE_LEVELS_NORM = tuple((_normalize_text(k), v) for k, v in _DEGREE_LEVELS.items())
+
+
+def _build_tier_matcher(tiers: Tuple[Tuple[Tuple[str, ...], float], ...]):
+    """
+    Build a single-pass matcher for the tier names.
+    
+    Args:
+        tiers: (normalized names, score) pairs, best tier first
+        
+    Returns:
+        Tuple of (automaton, patterns): an Aho-Corasick automaton when
+        pyahocorasick is installed, otherwise None and one regex alternation
+        per tier
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        # The best tier goes in last so it wins for a name listed in several tiers
+        for names, score in reversed(tiers):
+            for name in names:
+                automaton.add_word(name, score)
+        automaton.make_automaton()
+        return automaton, []
+    
+    return None, [
+        (re.compile('|'.join(map(re.escape, names))), score)
+        for names, score in tiers if names
+    ]
+
+
+_TIER_AUTOMATON, _TIER_PATTERNS = _build_tier_matcher((
+    (tuple(_normalize_text(u) for u in _UNIVERSITY_TIERS['tier1']), 1.0),
+    (tuple(_normalize_text(u) for u in _UNIVERSITY_TIERS['tier2']), 0.7),
+))
+
 
 class WeightedResumeEvaluator:
     """
@@ -18,6 +179,15 @@ class WeightedResumeEvaluator:
     and quality metrics defined in configuration.
     """
     
+    # Venue keywords for top-tier journals and for established publishers
+    _VENUE_TOP = ('nature', 'science', 'cell', 'nejm')
+    _VENUE_PUB = ('ieee', 'acm', 'springer')
+    # Author position -> score; other non-empty positions score 0.4
+    _AUTHOR_POS_SCORES = {1: 1.0, '1': 1.0, 'first': 1.0, 2: 0.7, '2': 0.7}
+    # Fields counted by the missing-values penalty
+    _EDU_FIELDS = ('degree', 'field', 'university', 'start', 'end')
+    _EXP_FIELDS = ('title', 'org', 'start', 'end', 'domain')
+    
     def __init__(self, generated_path: str, ground_truth_path: str, config_path: str = "evaluation_config.json"):
         """
         Initialize weighted evaluator.
@@ -36,58 +206,74 @@ class WeightedResumeEvaluator:
         self.subweights = self.config.get('subweights', {})
         self.policies = self.config.get('policies', {})
         
+        # Scalar weights and policies used by the per-resume scorers, resolved once
+        edu_subweights = self.subweights.get('education', {})
+        self._edu_gpa_w = edu_subweights.get('gpa', 0.5)
+        self._edu_degree_w = edu_subweights.get('degree_level', 0.2)
+        self._edu_uni_w = edu_subweights.get('university_tier', 0.3)
+        pub_subweights = self.subweights.get('publications', {})
+        self._pub_if_w = pub_subweights.get('if', 0.5)
+        self._pub_pos_w = pub_subweights.get('author_position', 0.3)
+        self._pub_venue_w = pub_subweights.get('venue_quality', 0.2)
+        self._target_domain = self.policies.get('domain', '').lower()
+        self._min_months_bonus = self.policies.get('min_months_experience_for_bonus', 24)
+        self._first_author_bonus = self.policies.get('first_author_bonus', 0.15)
+        self._missing_penalty = self.policies.get('missing_values_penalty', 0.10)
+        self._w_education = self.weights.get('education', 0.30)
+        self._w_experience = self.weights.get('experience', 0.30)
+        self._w_publications = self.weights.get('publications', 0.25)
+        self._w_coherence = self.weights.get('coherence', 0.10)
+        self._w_awards = self.weights.get('awards_other', 0.05)
+        
         # Map resumes
         self.generated_map = self._create_resume_map(self.generated)
         self.ground_truth_map = self._create_resume_map(self.ground_truth)
+        # Every resume key, in input order: generated first, then ground-truth-only
+        self._all_keys = tuple(dict.fromkeys([*self.generated_map, *self.ground_truth_map]))
         
         # Initialize coherence evaluator
         self.coherence_evaluator = CoherenceEvaluator(self.config)
         
-        # University tiers (can be extended)
-        self.university_tiers = {
-            'tier1': ['MIT', 'Stanford', 'Harvard', 'Cambridge', 'Oxford', 'Caltech', 'Princeton'],
-            'tier2': ['National University of Sciences and Technology', 'NUST', 'IIT', 'Carnegie Mellon', 
-                     'UC Berkeley', 'Cornell', 'Yale', 'Columbia', 'ETH Zurich'],
-            'tier3': []  # Default tier
-        }
-        
-        # Degree levels
-        self.degree_levels = {
-            'PhD': 1.0,
-            'Ph.D': 1.0,
-            'Doctorate': 1.0,
-            'Master': 0.8,
-            'MS': 0.8,
-            'M.S.': 0.8,
-            'MBA': 0.8,
-            'Bachelor': 0.6,
-            'BS': 0.6,
-            'B.S.': 0.6,
-            'BA': 0.6,
-            'BE': 0.6
-        }
+        # Shared module-level tables; matching uses their normalized forms
+        self.university_tiers = _UNIVERSITY_TIERS
+        self.degree_levels = _DEGREE_LEVELS
+        
+        # Memoized scorer results; the same institutions, degrees and date pairs
+        # recur across resumes
+        self._tier_score_cache = {}  # normalized university -> tier score
+        self._degree_score_cache = {}  # normalized degree -> level score
+        self._venue_score_cache = {}  # normalized venue -> quality score
+        self._duration_cache = {}  # (start, end, current year, current month) -> months
+        # Per-resume evaluations; weights and policies are fixed at construction
+        self._resume_eval_cache = {}  # resume key -> evaluate_resume result
     
     def _load_json(self, path: str) -> Any:
-        """Load JSON file."""
+        """Load JSON file, using orjson when it is installed."""
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                data = f.read()
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # orjson is strict (e.g. no NaN literals); let the stdlib parser decide
+                return json.loads(data)
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
     def _create_resume_map(self, resumes: List[Dict]) -> Dict[str, Dict]:
         """Create a mapping of resume identifiers to resume data."""
-        resume_map = {}
-        for resume in resumes:
-            key = resume.get('filename', resume.get('name', ''))
-            if key:
-                resume_map[key] = resume
-        return resume_map
+        return {
+            key: resume
+            for resume in resumes
+            for key in (resume.get('filename', resume.get('name', '')),)
+            if key
+        }
     
     def _normalize_string(self, text: Any) -> str:
         """Normalize string for comparison."""
         if text is None:
             return ""
-        text = str(text).lower().strip()
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        return _normalize_text(text if isinstance(text, str) else str(text))
     
     def _calculate_string_similarity(self, gen: Any, truth: Any) -> float:
         """Calculate similarity between two strings (0-1)."""
@@ -119,16 +305,20 @@ class WeightedResumeEvaluator:
             return 0.3
         
         uni_normalized = self._normalize_string(university)
-        
-        # Check tier 1
-        for tier1_uni in self.university_tiers['tier1']:
-            if self._normalize_string(tier1_uni) in uni_normalized:
-                return 1.0
-        
-        # Check tier 2
-        for tier2_uni in self.university_tiers['tier2']:
-            if self._normalize_string(tier2_uni) in uni_normalized:
-                return 0.7
+        score = self._tier_score_cache.get(uni_normalized)
+        if score is None:
+            score = self._tier_score_cache[uni_normalized] = self._match_university_tier(uni_normalized)
+        return score
+    
+    def _match_university_tier(self, uni_normalized: str) -> float:
+        """Match a normalized university name against the tier lists (substring match)."""
+        if _TIER_AUTOMATON is not None:
+            # Best tier among all names found in the string, default tier 3
+            return max((score for _, score in _TIER_AUTOMATON.iter(uni_normalized)), default=0.4)
+        
+        for pattern, score in _TIER_PATTERNS:
+            if pattern.search(uni_normalized):
+                return score
         
         # Default tier 3
         return 0.4
@@ -139,9 +329,15 @@ class WeightedResumeEvaluator:
             return 0.0
         
         degree_normalized = self._normalize_string(degree)
-        
-        for degree_type, score in self.degree_levels.items():
-            if self._normalize_string(degree_type) in degree_normalized:
+        score = self._degree_score_cache.get(degree_normalized)
+        if score is None:
+            score = self._degree_score_cache[degree_normalized] = self._match_degree_level(degree_normalized)
+        return score
+    
+    def _match_degree_level(self, degree_normalized: str) -> float:
+        """Match a normalized degree against the degree levels."""
+        for degree_type, score in _DEGREE_LEVELS_NORM:
+            if degree_type in degree_normalized:
                 return score
         
         return 0.3  # Unknown degree type
@@ -193,11 +389,10 @@ class WeightedResumeEvaluator:
             best_scores['university_tier'] = max(best_scores['university_tier'], uni_score)
         
         # Calculate weighted score
-        edu_subweights = self.subweights.get('education', {})
         weighted_score = (
-            best_scores['gpa'] * edu_subweights.get('gpa', 0.5) +
-            best_scores['degree_level'] * edu_subweights.get('degree_level', 0.2) +
-            best_scores['university_tier'] * edu_subweights.get('university_tier', 0.3)
+            best_scores['gpa'] * self._edu_gpa_w +
+            best_scores['degree_level'] * self._edu_degree_w +
+            best_scores['university_tier'] * self._edu_uni_w
         )
         
         return {
@@ -212,28 +407,42 @@ class WeightedResumeEvaluator:
         if not start:
             return 0
         
+        # Open-ended ranges and bare years depend on today, so the month is part of the key
+        now = datetime.now()
+        key = (start, end, now.year, now.month)
+        try:
+            months = self._duration_cache.get(key)
+        except TypeError:  # unhashable date values
+            return self._compute_duration_months(start, end)
+        if months is None:
+            months = self._duration_cache[key] = self._compute_duration_months(start, end)
+        return months
+    
+    def _compute_duration_months(self, start: Any, end: Any) -> int:
+        """Uncached body of _calculate_duration_months (start is non-empty)."""
         try:
             # Handle "currently working"
             if end and isinstance(end, str) and "current" in end.lower():
-                end_date = datetime.now()
+                now = datetime.now()
+                end_year, end_month = now.year, now.month
             elif end:
                 # Try to parse end date
                 if isinstance(end, (int, float)):
-                    end_date = datetime(int(end), 12, 31)
+                    end_year, end_month = _calendar_year(end), 12
                 else:
-                    end_date = date_parser.parse(str(end), fuzzy=True)
+                    end_year, end_month = self._parse_year_month(end)
             else:
-                end_date = datetime.now()
+                now = datetime.now()
+                end_year, end_month = now.year, now.month
             
             # Parse start date
             if isinstance(start, (int, float)):
-                start_date = datetime(int(start), 1, 1)
+                start_year, start_month = _calendar_year(start), 1
             else:
-                start_date = date_parser.parse(str(start), fuzzy=True)
+                start_year, start_month = self._parse_year_month(start)
             
             # Calculate months
-            months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-            return max(0, months)
+            return _months_between(start_year, start_month, end_year, end_month)
         except Exception:
             # Fallback: estimate years if we have numeric values
             try:
@@ -248,6 +457,22 @@ class WeightedResumeEvaluator:
             except Exception:
                 return 0
     
+    def _parse_year_month(self, value: Any) -> Tuple[int, int]:
+        """
+        Parse a resume date to (year, month), trying the common forms before
+        dateutil's fuzzy parser.
+        
+        A bare year takes the current month, as dateutil fills missing fields
+        from today.
+        """
+        text = str(value)
+        year_month = _fast_year_month(text)
+        if year_month is None:
+            parsed = date_parser.parse(text, fuzzy=True)
+            return parsed.year, parsed.month
+        year, month = year_month
+        return year, month or datetime.now().month
+    
     def _evaluate_experience_quality(self, experience_list: List[Dict]) -> Dict[str, float]:
         """
         Evaluate experience quality.
@@ -267,7 +492,7 @@ class WeightedResumeEvaluator:
         total_months = 0
         relevant_months = 0
         domain_match_scores = []
-        target_domain = self.policies.get('domain', '').lower()
+        target_domain = self._target_domain
         
         for exp in experience_list:
             # Try to get duration_months, or calculate from start/end
@@ -291,8 +516,7 @@ class WeightedResumeEvaluator:
         avg_domain_score = sum(domain_match_scores) / len(domain_match_scores) if domain_match_scores else 0.0
         
         # Experience bonus for long tenure
-        min_months = self.policies.get('min_months_experience_for_bonus', 24)
-        experience_bonus = 0.15 if total_months >= min_months else 0.0
+        experience_bonus = 0.15 if total_months >= self._min_months_bonus else 0.0
         
         # Weighted score (months normalized + domain relevance + bonus)
         months_score = min(1.0, total_months / 60)  # Normalize to 5 years max
@@ -324,61 +548,50 @@ class WeightedResumeEvaluator:
                 'weighted_score': 0.0
             }
         
-        if_scores = []
-        author_position_scores = []
-        venue_scores = []
-        has_first_author = False
+        # One row per publication: (impact factor, author position score, venue score).
+        # Averaging over rows (axis 0) adds them in order, like sum() / len().
+        pub_scores = np.zeros((len(publications_list), 3), dtype=np.float64)
         
-        pub_subweights = self.subweights.get('publications', {})
-        
-        for pub in publications_list:
-            # Impact factor score (normalize to 0-1, assuming max IF of 50)
+        for i, pub in enumerate(publications_list):
+            # Impact factor (unparseable values count as 0)
             journal_if = pub.get('journal_if')
             if journal_if:
                 try:
-                    if_score = min(1.0, float(journal_if) / 50.0)
-                    if_scores.append(if_score)
+                    pub_scores[i, 0] = float(journal_if)
                 except (ValueError, TypeError):
-                    if_scores.append(0.0)
-            else:
-                if_scores.append(0.0)
+                    pass
             
             # Author position score
             author_pos = pub.get('author_position')
-            if author_pos == 1 or author_pos == '1' or str(author_pos).lower() == 'first':
-                author_position_scores.append(1.0)
-                has_first_author = True
-            elif author_pos == 2 or author_pos == '2':
-                author_position_scores.append(0.7)
-            elif author_pos:
-                author_position_scores.append(0.4)
-            else:
-                author_position_scores.append(0.0)
+            try:
+                pos_score = self._AUTHOR_POS_SCORES.get(author_pos)
+            except TypeError:  # unhashable value
+                pos_score = None
+            if pos_score is None:
+                if isinstance(author_pos, str):
+                    pos_score = self._AUTHOR_POS_SCORES.get(author_pos.lower(), 0.4 if author_pos else 0.0)
+                else:
+                    pos_score = 0.4 if author_pos else 0.0
+            pub_scores[i, 1] = pos_score
             
             # Venue quality (simplified - can be extended with venue rankings)
-            venue = self._normalize_string(pub.get('venue', ''))
-            if any(term in venue for term in ['nature', 'science', 'cell', 'nejm']):
-                venue_scores.append(1.0)
-            elif any(term in venue for term in ['ieee', 'acm', 'springer']):
-                venue_scores.append(0.7)
-            elif venue:
-                venue_scores.append(0.4)
-            else:
-                venue_scores.append(0.0)
+            pub_scores[i, 2] = self._get_venue_score(self._normalize_string(pub.get('venue', '')))
+        
+        # Impact factor score (normalize to 0-1, assuming max IF of 50); fmin maps NaN to 1.0 like min()
+        pub_scores[:, 0] = np.fmin(pub_scores[:, 0] / 50.0, 1.0)
+        has_first_author = bool((pub_scores[:, 1] == 1.0).any())
         
         # Calculate averages
-        avg_if = sum(if_scores) / len(if_scores) if if_scores else 0.0
-        avg_author_pos = sum(author_position_scores) / len(author_position_scores) if author_position_scores else 0.0
-        avg_venue = sum(venue_scores) / len(venue_scores) if venue_scores else 0.0
+        avg_if, avg_author_pos, avg_venue = pub_scores.mean(axis=0).tolist()
         
         # First author bonus
-        first_author_bonus = self.policies.get('first_author_bonus', 0.15) if has_first_author else 0.0
+        first_author_bonus = self._first_author_bonus if has_first_author else 0.0
         
         # Weighted score
         weighted_score = (
-            avg_if * pub_subweights.get('if', 0.5) +
-            avg_author_pos * pub_subweights.get('author_position', 0.3) +
-            avg_venue * pub_subweights.get('venue_quality', 0.2)
+            avg_if * self._pub_if_w +
+            avg_author_pos * self._pub_pos_w +
+            avg_venue * self._pub_venue_w
         ) * (1 + first_author_bonus)
         weighted_score = min(1.0, weighted_score)
         
@@ -391,6 +604,21 @@ class WeightedResumeEvaluator:
             'weighted_score': weighted_score
         }
     
+    def _get_venue_score(self, venue: str) -> float:
+        """Score a normalized venue name: top journals, established publishers, other, missing."""
+        score = self._venue_score_cache.get(venue)
+        if score is None:
+            if any(term in venue for term in self._VENUE_TOP):
+                score = 1.0
+            elif any(term in venue for term in self._VENUE_PUB):
+                score = 0.7
+            elif venue:
+                score = 0.4
+            else:
+                score = 0.0
+            self._venue_score_cache[venue] = score
+        return score
+    
     def _evaluate_awards_quality(self, awards_list: List[Dict]) -> Dict[str, float]:
         """
         Evaluate awards and certifications.
@@ -418,6 +646,11 @@ class WeightedResumeEvaluator:
         """
         Evaluate coherence using CoherenceEvaluator module.
         
+        Args:
+            resume: Generated resume
+            ground_truth: Ground truth resume; currently unused, since coherence
+                is judged on the generated resume alone
+        
         Returns:
             Dict with coherence metrics
         """
@@ -439,43 +672,50 @@ class WeightedResumeEvaluator:
         Returns:
             Penalty value (0-1, where higher is more penalty)
         """
-        missing_count = 0
-        total_expected = 0
-        
-        # Check education fields
-        for edu in resume.get('education', []):
-            fields = ['degree', 'field', 'university', 'start', 'end']
-            for field in fields:
-                total_expected += 1
-                if not edu.get(field):
-                    missing_count += 1
-        
-        # Check experience fields
-        for exp in resume.get('experience', []):
-            fields = ['title', 'org', 'start', 'end', 'domain']
-            for field in fields:
-                total_expected += 1
-                if not exp.get(field):
-                    missing_count += 1
+        education = resume.get('education', [])
+        experience = resume.get('experience', [])
+        total_expected = len(education) * len(self._EDU_FIELDS) + len(experience) * len(self._EXP_FIELDS)
         
         if total_expected == 0:
             return 0.0
         
+        # Check education and experience fields
+        missing_count = (
+            sum(not edu.get(field) for edu in education for field in self._EDU_FIELDS) +
+            sum(not exp.get(field) for exp in experience for field in self._EXP_FIELDS)
+        )
+        
         missing_ratio = missing_count / total_expected
-        penalty = missing_ratio * self.policies.get('missing_values_penalty', 0.10)
+        penalty = missing_ratio * self._missing_penalty
         
         return penalty
     
     def evaluate_resume(self, resume_key: str) -> Dict[str, Any]:
         """
-        Evaluate a single resume with weighted scoring.
+        Evaluate a single resume with weighted scoring. Results are cached per
+        key, so repeated calls (and repeated evaluate_all runs) return the same dict.
         
         Returns:
             Dict with detailed scores and final weighted score
         """
-        gen = self.generated_map.get(resume_key, {})
-        truth = self.ground_truth_map.get(resume_key, {})
+        resume_eval = self._resume_eval_cache.get(resume_key)
+        if resume_eval is None:
+            gen = self.generated_map.get(resume_key, {})
+            truth = self.ground_truth_map.get(resume_key, {})
+            resume_eval = self._resume_eval_cache[resume_key] = self._evaluate_resume_data(gen, truth)
+        return resume_eval
+    
+    def _evaluate_resume_data(self, gen: Dict, truth: Dict) -> Dict[str, Any]:
+        """
+        Evaluate one generated resume against its ground truth.
         
+        Args:
+            gen: Generated resume (empty dict if missing)
+            truth: Ground truth resume (empty dict if missing)
+            
+        Returns:
+            Dict with detailed scores and final weighted score
+        """
         # Evaluate each component
         education_eval = self._evaluate_education_quality(gen.get('education', []))
         experience_eval = self._evaluate_experience_quality(gen.get('experience', []))
@@ -488,11 +728,11 @@ class WeightedResumeEvaluator:
         
         # Calculate final weighted score
         final_score = (
-            education_eval['weighted_score'] * self.weights.get('education', 0.30) +
-            experience_eval['weighted_score'] * self.weights.get('experience', 0.30) +
-            publications_eval['weighted_score'] * self.weights.get('publications', 0.25) +
-            coherence_eval['weighted_score'] * self.weights.get('coherence', 0.10) +
-            awards_eval['weighted_score'] * self.weights.get('awards_other', 0.05)
+            education_eval['weighted_score'] * self._w_education +
+            experience_eval['weighted_score'] * self._w_experience +
+            publications_eval['weighted_score'] * self._w_publications +
+            coherence_eval['weighted_score'] * self._w_coherence +
+            awards_eval['weighted_score'] * self._w_awards
         )
         
         # Apply missing values penalty
@@ -536,10 +776,30 @@ class WeightedResumeEvaluator:
         else:
             return 'F'
     
-    def evaluate_all(self) -> Dict[str, Any]:
+    def _evaluate_resumes_parallel(self, keys: List[str], max_workers: int) -> List[Dict[str, Any]]:
+        """Run _evaluate_resume_data for each key in a process pool, in key order."""
+        tasks = [(self.generated_map.get(key, {}), self.ground_truth_map.get(key, {})) for key in keys]
+        chunksize = max(1, len(tasks) // (4 * max_workers))
+        
+        # Workers get the scoring state only; resumes travel with the tasks
+        scorer = copy.copy(self)
+        scorer.generated = scorer.ground_truth = []
+        scorer.generated_map = scorer.ground_truth_map = {}
+        scorer._resume_eval_cache = {}
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_weighted_worker,
+                                 initargs=(scorer,)) as pool:
+            return list(pool.map(_weighted_worker, tasks, chunksize=chunksize))
+    
+    def evaluate_all(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Evaluate all resumes.
         
+        Args:
+            max_workers: If greater than 1, evaluate the resumes in a process
+                pool of this size
+        
         Returns:
             Dict with per-resume and aggregate results
         """
@@ -555,119 +815,155 @@ class WeightedResumeEvaluator:
             }
         }
         
-        all_keys = set(self.generated_map.keys()) | set(self.ground_truth_map.keys())
+        all_keys = self._all_keys
+        
+        if max_workers and max_workers > 1:
+            pending = [key for key in all_keys if key not in self._resume_eval_cache]
+            if len(pending) > 1:
+                evaluated = self._evaluate_resumes_parallel(pending, max_workers)
+                self._resume_eval_cache.update(zip(pending, evaluated))
+        resume_evals = [self.evaluate_resume(key) for key in all_keys]
         
-        for key in all_keys:
-            resume_eval = self.evaluate_resume(key)
+        # Single pass: per-resume values go to the lists (kept for the JSON report)
+        # and into running totals for the averages
+        aggregate = results['aggregate']
+        agg_keys = list(aggregate.keys())
+        totals = np.zeros(len(agg_keys), dtype=np.float64)
+        
+        for key, resume_eval in zip(all_keys, resume_evals):
             results['per_resume'][key] = resume_eval
             
-            # Aggregate
-            results['aggregate']['education'].append(resume_eval['component_scores']['education'])
-            results['aggregate']['experience'].append(resume_eval['component_scores']['experience'])
-            results['aggregate']['publications'].append(resume_eval['component_scores']['publications'])
-            results['aggregate']['awards'].append(resume_eval['component_scores']['awards_other'])
-            results['aggregate']['coherence'].append(resume_eval['component_scores']['coherence'])
-            results['aggregate']['final_scores'].append(resume_eval['final_score'])
-        
-        # Calculate averages
-        keys_to_average = list(results['aggregate'].keys())  # Create a list to avoid dict size change during iteration
-        for key in keys_to_average:
-            values = results['aggregate'][key]
-            results['aggregate'][f'{key}_avg'] = sum(values) / len(values) if values else 0.0
+            component_scores = resume_eval['component_scores']
+            row = (
+                component_scores['education'],
+                component_scores['experience'],
+                component_scores['publications'],
+                component_scores['awards_other'],
+                component_scores['coherence'],
+                resume_eval['final_score']
+            )
+            totals += row
+            for agg_key, value in zip(agg_keys, row):
+                aggregate[agg_key].append(value)
+        
+        count = len(all_keys)
+        for j, key in enumerate(agg_keys):
+            aggregate[f'{key}_avg'] = float(totals[j]) / count if count else 0.0
         
         return results
     
     def print_report(self, results: Dict[str, Any]):
         """Print formatted weighted evaluation report."""
-        print("=" * 80)
-        print("WEIGHTED RESUME PARSING EVALUATION REPORT")
-        print("=" * 80)
-        print()
-        
-        print("Configuration:")
-        print(f"  Weights: Education={self.weights.get('education'):.0%}, "
+        # Build the whole report in memory and write it to stdout once
+        buf = io.StringIO()
+        write = buf.write
+        rule = "=" * 80
+        thin_rule = "-" * 80
+        
+        write(f"{rule}\n")
+        write("WEIGHTED RESUME PARSING EVALUATION REPORT\n")
+        write(f"{rule}\n")
+        write("\n")
+        
+        write("Configuration:\n")
+        write(f"  Weights: Education={self.weights.get('education'):.0%}, "
               f"Experience={self.weights.get('experience'):.0%}, "
-              f"Publications={self.weights.get('publications'):.0%}")
-        print(f"  Target Domain: {self.policies.get('domain', 'N/A')}")
-        print(f"  Min Experience for Bonus: {self.policies.get('min_months_experience_for_bonus', 0)} months")
-        print()
-        
-        print("-" * 80)
-        print("AGGREGATE SCORES")
-        print("-" * 80)
+              f"Publications={self.weights.get('publications'):.0%}\n")
+        write(f"  Target Domain: {self.policies.get('domain', 'N/A')}\n")
+        write(f"  Min Experience for Bonus: {self.policies.get('min_months_experience_for_bonus', 0)} months\n")
+        write("\n")
+        
+        write(f"{thin_rule}\n")
+        write("AGGREGATE SCORES\n")
+        write(f"{thin_rule}\n")
         agg = results['aggregate']
-        print(f"Education:     {agg['education_avg']:.1%} (weight: {self.weights.get('education'):.0%})")
-        print(f"Experience:    {agg['experience_avg']:.1%} (weight: {self.weights.get('experience'):.0%})")
-        print(f"Publications:  {agg['publications_avg']:.1%} (weight: {self.weights.get('publications'):.0%})")
-        print(f"Coherence:     {agg['coherence_avg']:.1%} (weight: {self.weights.get('coherence'):.0%})")
-        print(f"Awards:        {agg['awards_avg']:.1%} (weight: {self.weights.get('awards_other'):.0%})")
-        print()
-        print(f"Overall Score: {agg['final_scores_avg']:.1%} (Grade: {self._get_grade(agg['final_scores_avg'])})")
-        print()
-        
-        print("-" * 80)
-        print("PER-RESUME DETAILED RESULTS")
-        print("-" * 80)
+        write(f"Education:     {agg['education_avg']:.1%} (weight: {self.weights.get('education'):.0%})\n")
+        write(f"Experience:    {agg['experience_avg']:.1%} (weight: {self.weights.get('experience'):.0%})\n")
+        write(f"Publications:  {agg['publications_avg']:.1%} (weight: {self.weights.get('publications'):.0%})\n")
+        write(f"Coherence:     {agg['coherence_avg']:.1%} (weight: {self.weights.get('coherence'):.0%})\n")
+        write(f"Awards:        {agg['awards_avg']:.1%} (weight: {self.weights.get('awards_other'):.0%})\n")
+        write("\n")
+        write(f"Overall Score: {agg['final_scores_avg']:.1%} (Grade: {self._get_grade(agg['final_scores_avg'])})\n")
+        write("\n")
+        
+        write(f"{thin_rule}\n")
+        write("PER-RESUME DETAILED RESULTS\n")
+        write(f"{thin_rule}\n")
         
         for resume_key, resume_result in results['per_resume'].items():
-            print(f"\n{'=' * 80}")
-            print(f"Resume: {resume_key}")
-            print(f"{'=' * 80}")
-            print(f"Final Score: {resume_result['final_score']:.1%} (Grade: {resume_result['grade']})")
-            print()
+            write(f"\n{rule}\n")
+            write(f"Resume: {resume_key}\n")
+            write(f"{rule}\n")
+            write(f"Final Score: {resume_result['final_score']:.1%} (Grade: {resume_result['grade']})\n")
+            write("\n")
             
             # Education
             edu = resume_result['education']
-            print(f"Education ({edu['weighted_score']:.1%}):")
-            print(f"  GPA Score:        {edu['gpa_score']:.1%}")
-            print(f"  Degree Level:     {edu['degree_level_score']:.1%}")
-            print(f"  University Tier:  {edu['university_tier_score']:.1%}")
-            print()
+            write(f"Education ({edu['weighted_score']:.1%}):\n")
+            write(f"  GPA Score:        {edu['gpa_score']:.1%}\n")
+            write(f"  Degree Level:     {edu['degree_level_score']:.1%}\n")
+            write(f"  University Tier:  {edu['university_tier_score']:.1%}\n")
+            write("\n")
             
             # Experience
             exp = resume_result['experience']
-            print(f"Experience ({exp['weighted_score']:.1%}):")
-            print(f"  Total Months:     {exp['total_months']}")
-            print(f"  Relevant Months:  {exp['relevant_months']}")
-            print(f"  Domain Match:     {exp['domain_match_score']:.1%}")
-            print(f"  Experience Bonus: {exp['experience_bonus']:.1%}")
-            print()
+            write(f"Experience ({exp['weighted_score']:.1%}):\n")
+            write(f"  Total Months:     {exp['total_months']}\n")
+            write(f"  Relevant Months:  {exp['relevant_months']}\n")
+            write(f"  Domain Match:     {exp['domain_match_score']:.1%}\n")
+            write(f"  Experience Bonus: {exp['experience_bonus']:.1%}\n")
+            write("\n")
             
             # Publications
             pub = resume_result['publications']
-            print(f"Publications ({pub['weighted_score']:.1%}):")
-            print(f"  Count:            {pub['count']}")
-            print(f"  IF Score:         {pub['if_score']:.1%}")
-            print(f"  Author Position:  {pub['author_position_score']:.1%}")
-            print(f"  Venue Quality:    {pub['venue_quality_score']:.1%}")
-            print(f"  First Author Bonus: {pub['first_author_bonus']:.1%}")
-            print()
+            write(f"Publications ({pub['weighted_score']:.1%}):\n")
+            write(f"  Count:            {pub['count']}\n")
+            write(f"  IF Score:         {pub['if_score']:.1%}\n")
+            write(f"  Author Position:  {pub['author_position_score']:.1%}\n")
+            write(f"  Venue Quality:    {pub['venue_quality_score']:.1%}\n")
+            write(f"  First Author Bonus: {pub['first_author_bonus']:.1%}\n")
+            write("\n")
             
             # Awards
             awd = resume_result['awards']
-            print(f"Awards ({awd['weighted_score']:.1%}):")
-            print(f"  Count:            {awd['count']}")
-            print()
+            write(f"Awards ({awd['weighted_score']:.1%}):\n")
+            write(f"  Count:            {awd['count']}\n")
+            write("\n")
             
             # Coherence
             coh = resume_result['coherence']
-            print(f"Coherence ({coh['weighted_score']:.1%}):")
-            print(f"  Timeline Score:    {coh.get('timeline_score', 0):.1%}")
-            print(f"  Field Alignment:   {coh.get('field_alignment_score', 0):.1%}")
-            print(f"  Progression Score: {coh.get('progression_score', 0):.1%}")
-            print()
+            write(f"Coherence ({coh['weighted_score']:.1%}):\n")
+            write(f"  Timeline Score:    {coh.get('timeline_score', 0):.1%}\n")
+            write(f"  Field Alignment:   {coh.get('field_alignment_score', 0):.1%}\n")
+            write(f"  Progression Score: {coh.get('progression_score', 0):.1%}\n")
+            write("\n")
             
             # Penalty
-            print(f"Missing Values Penalty: -{resume_result['missing_penalty']:.1%}")
+            write(f"Missing Values Penalty: -{resume_result['missing_penalty']:.1%}\n")
+        
+        write("\n")
+        write(f"{rule}\n")
         
-        print()
-        print("=" * 80)
+        sys.stdout.write(buf.getvalue())
+
+
+# Evaluator used by process pool workers, set once per worker process
+_worker_evaluator = None
+
+
+def _init_weighted_worker(evaluator: 'WeightedResumeEvaluator'):
+    """Install the per-process evaluator for parallel resume evaluation."""
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+
+
+def _weighted_worker(task: Tuple[Dict, Dict]) -> Dict[str, Any]:
+    """Evaluate one (generated, ground truth) resume pair."""
+    return _worker_evaluator._evaluate_resume_data(*task)
 
 
 def main():
     """Main function to run weighted evaluation."""
-    import sys
-    
     if len(sys.argv) < 3:
         print("Usage: python weighted_evaluate.py <generated_json> <ground_truth_json> [config_json]")
         print("\nExample:")
@@ -698,8 +994,7 @@ def main():
     
     # Save detailed results
     output_path = "weighted_evaluation_results.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    _write_results(results, output_path)
     
     print(f"\nDetailed results saved to: {output_path}")
 
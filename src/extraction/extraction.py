@@ -1,41 +1,281 @@
 """
 File extraction utilities (PDF, DOCX, OCR for images).
 """
+import hashlib
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 import fitz
 from docx import Document
 from PIL import Image
 import pytesseract
 import cv2
-import numpy as np
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
 
 # Handle both relative and absolute imports
 try:
-    from .image_processing import preprocess_image_for_ocr
+    from .image_processing import preprocess_image_for_ocr, denoise_image
     from ..logging_utils import log_step
+    from ..config import EXTRACTION_CACHE_DIR
 except ImportError:
-    from src.extraction.image_processing import preprocess_image_for_ocr
+    from src.extraction.image_processing import preprocess_image_for_ocr, denoise_image
     from src.logging_utils import log_step
+    from src.config import EXTRACTION_CACHE_DIR
 
 # On macOS/Linux, tesseract is usually installed via package manager and available on PATH
 # On Windows, you may need to set: pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
+# Process pool for OCR of scanned PDF pages (half the CPUs), created on first use
+_OCR_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+_ocr_pool = None
+
+# Most page images given to one Tesseract run; very long file lists can hang it
+_OCR_BATCH_LIMIT = 50
+
+# With tesserocr installed, each process keeps one Tesseract API instance alive
+# instead of starting a tesseract subprocess per call: (pid, PyTessBaseAPI)
+_tess_api = None
+
+# Scanned PDF pages are rendered at OCR_DPI; pages whose mean word confidence
+# falls below OCR_MIN_CONFIDENCE are rendered again at OCR_RETRY_DPI and re-OCRed
+OCR_DPI = int(os.environ.get("OCR_DPI", "200"))
+OCR_RETRY_DPI = 300
+OCR_MIN_CONFIDENCE = float(os.environ.get("OCR_MIN_CONFIDENCE", "60"))
+
+# PDF pages whose stripped text layer is shorter than this are treated as images
+# and OCRed; kept low since sparse pages (e.g. contact details only) still carry
+# a real text layer
+PDF_MIN_PAGE_CHARS = int(os.environ.get("PDF_MIN_PAGE_CHARS", "20"))
+
+# Bump when a change to the extraction code should invalidate cached text
+_CACHE_FORMAT_VERSION = 1
+
+# Producer/creator metadata of PDFs exported from authoring tools; when every page
+# of such a file has a text layer, it is used as is without per-page OCR checks
+_DIGITAL_PRODUCER_RE = re.compile(
+    r"LaTeX|pdfTeX|XeTeX|LuaTeX|Microsoft.{0,10}Word|LibreOffice|OpenOffice|Skia/PDF|Chrom(e|ium)",
+    re.IGNORECASE,
+)
+
+
+def _cache_path(path, high_quality=False):
+    """
+    Path of the cached extracted text for a file.
+    
+    The key hashes the file contents together with every setting that changes
+    the extracted text (see _cache_settings), so changing one of them misses
+    the old entries instead of returning stale text.
+    
+    Args:
+        path: Path to the source file
+        high_quality: Whether the text is extracted in high quality mode
+        
+    Returns:
+        str: Path of the cache file (which may not exist yet)
+    """
+    key = hashlib.blake2b(f"{_cache_settings(high_quality)}|{file_digest(path)}".encode(), digest_size=16)
+    return os.path.join(EXTRACTION_CACHE_DIR, f"{key.hexdigest()}.txt")
+
+
+def file_digest(path):
+    """
+    Hash of a file's full contents.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        str: Hex blake2b digest (16 bytes)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_settings(high_quality):
+    """Extraction settings that are part of the cache key, as one string."""
+    backend = "tesserocr" if tesserocr is not None else "tesseract"
+    return (f"v{_CACHE_FORMAT_VERSION}|{backend}|hq={high_quality}|dpi={OCR_DPI}|retry_dpi={OCR_RETRY_DPI}"
+            f"|min_conf={OCR_MIN_CONFIDENCE}|min_chars={PDF_MIN_PAGE_CHARS}")
+
+
+def _read_cache(cache_path):
+    """Return the cached text at cache_path, or None if there is none."""
+    try:
+        with open(cache_path, "rb") as f:
+            return f.read().decode("utf-8")
+    except OSError:
+        return None
+
+
+def _write_cache(cache_path, text):
+    """Store extracted text in the cache; failures only cost the cache entry."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(text.encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
 
-def extract_text_image(path, filename=""):
+def _init_ocr_worker():
+    """Run Tesseract and OpenCV single-threaded; the pool provides the parallelism."""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    cv2.setNumThreads(1)
+
+
+def _get_ocr_pool():
+    """Return the shared OCR process pool."""
+    global _ocr_pool
+    if _ocr_pool is None:
+        _ocr_pool = ProcessPoolExecutor(max_workers=_OCR_WORKERS, initializer=_init_ocr_worker)
+    return _ocr_pool
+
+
+def _get_tess_api():
+    """Return this process's tesserocr API, configured like the CLI calls (--oem 3 --psm 3)."""
+    global _tess_api
+    # Forked pool workers must not share the parent's instance
+    if _tess_api is None or _tess_api[0] != os.getpid():
+        api = tesserocr.PyTessBaseAPI(lang='eng', psm=tesserocr.PSM.AUTO, oem=tesserocr.OEM.DEFAULT)
+        _tess_api = (os.getpid(), api)
+    return _tess_api[1]
+
+
+def _tesserocr_page(image):
+    """
+    OCR one image with the in-process Tesseract API.
+    
+    Args:
+        image: PIL image
+        
+    Returns:
+        tuple: (text ending with the CLI's form-feed page separator, mean word confidence)
+    """
+    api = _get_tess_api()
+    api.SetImage(image)
+    return api.GetUTF8Text() + "\f", float(api.MeanTextConf())
+
+
+def _run_tesseract(input_path, page_count):
+    """
+    Run Tesseract once, producing text and word confidences.
+    
+    Args:
+        input_path: Image path, or a .txt list of image paths
+        page_count: Number of images in the input
+        
+    Returns:
+        tuple: (text, mean word confidence per page); pages without words get 0
+    """
+    output_base = os.path.splitext(input_path)[0] + "_ocr"
+    custom_config = r'--oem 3 --psm 3 -c tessedit_create_tsv=1'
+    pytesseract.pytesseract.run_tesseract(input_path, output_base, 'txt', 'eng', custom_config)
+    
+    with open(output_base + ".txt", "rb") as f:
+        text = f.read().decode("utf-8")
+    
+    # TSV columns: level, page_num, ..., conf, text; level 5 rows are words
+    confidences = [[] for _ in range(page_count)]
+    with open(output_base + ".tsv", "rb") as f:
+        for line in f.read().decode("utf-8").splitlines()[1:]:
+            fields = line.split("\t")
+            if len(fields) < 11 or fields[0] != "5":
+                continue
+            page_index = int(fields[1]) - 1
+            conf = float(fields[10])
+            if conf >= 0 and 0 <= page_index < page_count:
+                confidences[page_index].append(conf)
+    
+    return text, [sum(c) / len(c) if c else 0.0 for c in confidences]
+
+
+def _ocr_pdf_pages(page_paths, high_quality=False, denoise=None):
+    """
+    Preprocess rendered PDF pages and OCR them in a single Tesseract run.
+    
+    Args:
+        page_paths: Paths of the rendered grayscale page images (PGM), in page order
+        high_quality: Use the slower non-local means denoising
+        denoise: Per page flags; False skips denoising a page (default: denoise all)
+        
+    Returns:
+        list: (text, mean word confidence) per page
+    """
+    if denoise is None:
+        denoise = [True] * len(page_paths)
+    
+    processed_paths = []
+    results = []
+    for page_path, noisy in zip(page_paths, denoise):
+        # Apply preprocessing (pages are rendered in grayscale already)
+        gray = cv2.imread(page_path, cv2.IMREAD_GRAYSCALE)
+        if noisy:
+            gray = denoise_image(gray, high_quality)
+        
+        if tesserocr is not None:
+            results.append(_tesserocr_page(Image.fromarray(gray)))
+            continue
+        
+        processed_path = os.path.splitext(page_path)[0] + ".png"
+        cv2.imwrite(processed_path, gray)
+        processed_paths.append(processed_path)
+    
+    if tesserocr is not None:
+        return results
+    
+    if len(processed_paths) > 1:
+        # Tesseract reads a .txt input as a list of images, one path per line
+        list_path = os.path.splitext(page_paths[0])[0] + ".txt"
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(processed_paths) + "\n")
+        text, confidences = _run_tesseract(list_path, len(processed_paths))
+        
+        # Every page ends with Tesseract's form-feed page separator
+        pages = text.split("\f")
+        if len(pages) == len(processed_paths) + 1:
+            return [(page + "\f", conf) for page, conf in zip(pages, confidences)]
+    
+    # Single page, or the batched output could not be split back into pages
+    for path in processed_paths:
+        text, (conf,) = _run_tesseract(path, 1)
+        results.append((text, conf))
+    return results
+
+
+def extract_text_image(path, filename="", high_quality=False):
     """
     Extract text from image files (PNG, JPG, JPEG) using OCR with preprocessing.
     
     Args:
         path: Path to the image file
         filename: Optional filename for logging
+        high_quality: Use the slower non-local means denoising
         
     Returns:
         str: Extracted text
     """
     try:
+        cache_path = _cache_path(path, high_quality)
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            log_step(f"{filename}: Loaded {len(cached)} characters from extraction cache")
+            return cached
+        
         log_step(f"{filename}: Starting image preprocessing for OCR")
         
         # Preprocess image for better OCR
-        processed_img = preprocess_image_for_ocr(path)
+        processed_img = preprocess_image_for_ocr(path, high_quality)
         
         log_step(f"{filename}: Image preprocessing completed, running OCR")
         
@@ -45,10 +285,14 @@ def extract_text_image(path, filename=""):
         custom_config = r'--oem 3 --psm 3'
         
         # Extract text with multiple languages support
-        text = pytesseract.image_to_string(processed_img, lang='eng', config=custom_config)
+        if tesserocr is not None:
+            text, _ = _tesserocr_page(processed_img)
+        else:
+            text = pytesseract.image_to_string(processed_img, lang='eng', config=custom_config)
         
         log_step(f"{filename}: OCR completed, extracted {len(text)} characters")
         
+        _write_cache(cache_path, text)
         return text
     except Exception as e:
         error_msg = f"Error extracting text from image {path}: {str(e)}"
@@ -56,57 +300,129 @@ def extract_text_image(path, filename=""):
         return f"ERROR: {error_msg}"
 
 
-def extract_text_pdf(path, filename=""):
+def extract_text_pdf(path, filename="", high_quality=False):
     """
     Extract text from PDF files. Uses OCR for image-based pages.
     
     Args:
         path: Path to the PDF file
         filename: Optional filename for logging
+        high_quality: Use the slower non-local means denoising for OCR pages
         
     Returns:
         str: Extracted text
     """
     try:
+        cache_path = _cache_path(path, high_quality)
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            log_step(f"{filename}: Loaded {len(cached)} characters from extraction cache")
+            return cached
+        
         doc = fitz.open(path)
-        full_text = ""
         total_pages = len(doc)
         
         log_step(f"{filename}: Processing PDF with {total_pages} pages")
         
-        for page_num, page in enumerate(doc, 1):
-            t = page.get_text()
-            # Ensure t is a string
-            if isinstance(t, list):
-                t = "\n".join(str(item) for item in t)
-            
-            if isinstance(t, str) and t.strip() and len(t.strip()) > 50:
-                # Page has sufficient text content
-                full_text += t
-                log_step(f"{filename}: Page {page_num}/{total_pages} - text extracted directly")
+        metadata = doc.metadata or {}
+        producer = f"{metadata.get('producer') or ''} {metadata.get('creator') or ''}".strip()
+        if _DIGITAL_PRODUCER_RE.search(producer):
+            # Authoring tools can still wrap scans (an image pasted into Word, a
+            # scan printed from Chrome), so every page must carry a text layer
+            layer_texts = [page.get_text() for page in doc]
+            if all(t.strip() and len(t.strip()) >= PDF_MIN_PAGE_CHARS for t in layer_texts):
+                log_step(f"{filename}: Born-digital PDF ({producer}), extracting text layer without OCR")
+                text = "".join(layer_texts)
+                _write_cache(cache_path, text)
+                return text
+            log_step(f"{filename}: PDF from {producer} has pages without a text layer, checking pages for OCR")
+        
+        # Scanned pages are rendered to a temporary directory and OCRed in batches,
+        # one Tesseract run per batch. Multi-page PDFs run the batches in the
+        # process pool while the remaining pages are scanned; with a pool the
+        # pages are spread over the workers.
+        pool = _get_ocr_pool() if total_pages > 1 and _OCR_WORKERS > 1 else None
+        if pool is not None:
+            batch_size = min(_OCR_BATCH_LIMIT, -(-total_pages // _OCR_WORKERS))
+        else:
+            batch_size = _OCR_BATCH_LIMIT
+        page_texts = []
+        pending = []  # (index in page_texts, page number, image path) of the open batch
+        ocr_batches = []  # (pending entries, future or results)
+        vector_renders = set()  # image paths of pages without embedded images
+        
+        def flush_batch():
+            paths = [image_path for _, _, image_path in pending]
+            denoise = [image_path not in vector_renders for image_path in paths]
+            if pool is not None:
+                result = pool.submit(_ocr_pdf_pages, paths, high_quality, denoise)
             else:
-                # Page is likely an image, use OCR
-                log_step(f"{filename}: Page {page_num}/{total_pages} - applying OCR")
-                pix = page.get_pixmap(dpi=300)
-                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-                
-                # Convert PIL to numpy array for preprocessing
-                img_array = np.array(img)
-                
-                # Apply preprocessing
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-                denoised = cv2.fastNlMeansDenoising(gray, None, h=10)
-                
-                # Convert back to PIL
-                processed_img = Image.fromarray(denoised)
+                result = _ocr_pdf_pages(paths, high_quality, denoise)
+            ocr_batches.append((pending[:], result))
+            pending.clear()
+        
+        def render(page, page_num, dpi, tmp_dir):
+            pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+            page_path = os.path.join(tmp_dir, f"page_{page_num:04d}_{dpi}.pgm")
+            pix.save(page_path)
+            # A page drawn only from vectors and fonts renders without sensor
+            # noise, so denoising it would be wasted work
+            if not page.get_images():
+                vector_renders.add(page_path)
+            return page_path
+        
+        def collect_batches():
+            batches = ocr_batches[:]
+            ocr_batches.clear()
+            for entries, result in batches:
+                for entry, page_result in zip(entries, result if pool is None else result.result()):
+                    yield entry, page_result
+        
+        with tempfile.TemporaryDirectory(prefix="pdf_ocr_") as tmp_dir:
+            for page_num, page in enumerate(doc, 1):
+                t = page.get_text()
+                # Ensure t is a string
+                if isinstance(t, list):
+                    t = "\n".join(str(item) for item in t)
                 
-                # OCR with custom config
-                custom_config = r'--oem 3 --psm 3'
-                ocr_text = pytesseract.image_to_string(processed_img, lang="eng", config=custom_config)
-                full_text += ocr_text
+                if isinstance(t, str) and t.strip() and len(t.strip()) >= PDF_MIN_PAGE_CHARS:
+                    # Page has sufficient text content
+                    page_texts.append(t)
+                    log_step(f"{filename}: Page {page_num}/{total_pages} - text extracted directly")
+                else:
+                    # Page is likely an image, use OCR
+                    log_step(f"{filename}: Page {page_num}/{total_pages} - applying OCR")
+                    pending.append((len(page_texts), page_num, render(page, page_num, OCR_DPI, tmp_dir)))
+                    page_texts.append("")
+                    if len(pending) == batch_size:
+                        flush_batch()
+            
+            if pending:
+                flush_batch()
+            
+            # Keep the text of confident pages; re-render the others at the retry DPI
+            for (index, page_num, _), (text, conf) in collect_batches():
+                page_texts[index] = text
+                if conf < OCR_MIN_CONFIDENCE and OCR_DPI < OCR_RETRY_DPI:
+                    log_step(f"{filename}: Page {page_num}/{total_pages} - OCR confidence {conf:.0f}, "
+                             f"retrying at {OCR_RETRY_DPI} DPI")
+                    page_path = render(doc[page_num - 1], page_num, OCR_RETRY_DPI, tmp_dir)
+                    pending.append((index, page_num, page_path))
+                    if len(pending) == batch_size:
+                        flush_batch()
+                else:
+                    log_step(f"{filename}: Page {page_num}/{total_pages} - OCR completed")
+            
+            if pending:
+                flush_batch()
+            
+            for (index, page_num, _), (text, _) in collect_batches():
+                page_texts[index] = text
                 log_step(f"{filename}: Page {page_num}/{total_pages} - OCR completed")
         
-        return full_text
+        text = "".join(page_texts)
+        _write_cache(cache_path, text)
+        return text
     except Exception as e:
         error_msg = f"Error extracting text from PDF {path}: {str(e)}"
         log_step(f"{filename}: {error_msg}")
@@ -126,7 +442,7 @@ def extract_text_docx(path, filename=""):
     """
     try:
         doc = Document(path)
-        text = "\n".join([p.text for p in doc.paragraphs])
+        text = "\n".join(p.text for p in doc.paragraphs)
         log_step(f"{filename}: Extracted {len(text)} characters from DOCX")
         return text
     except Exception as e:
@@ -2,6 +2,7 @@
 Logging utility for pipeline steps.
 """
 from datetime import datetime
+import atexit
 import os
 
 # Handle both relative and absolute imports
@@ -10,9 +11,31 @@ try:
 except ImportError:
     from src.config import LOG_FILE
 
+# Log file handle, opened on first use and kept open. It is line buffered, so
+# every line reaches the file in one append and pool workers sharing the file
+# never split each other's lines
+_log_file = None
+
+def _get_log_file():
+    """Open the log file for appending on first use"""
+    global _log_file
+    if _log_file is None:
+        os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+        _log_file = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+        atexit.register(_log_file.close)
+    return _log_file
+
+def flush_log():
+    """Write any pending log output to the log file"""
+    if _log_file is not None:
+        _log_file.flush()
+
+# Forked processes inherit the buffer; flushing first keeps them from writing
+# the parent's pending output a second time (fork does not exist on Windows)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=flush_log)
+
 def log_step(message: str):
     """Append message with timestamp to log file"""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
+    _get_log_file().write(f"[{timestamp}] {message}\n")
@@ -4,22 +4,84 @@ Text cleaning and PII redaction utilities.
 import re
 import unicodedata
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_EMAIL_RE = re.compile(r'\b[\w\.-]+@[\w\.-]+\.\w+\b')
+_PHONE_RE = re.compile(r'\b\d{10,}\b')
+_BLANKLINE_RE = re.compile(r'\n\s*\n')
+_WS_RE = re.compile(r'[ \t]+')
+
+# (pattern, replacement) pairs applied by redact_pii, in order
+_PII_PATTERNS = [
+    (_EMAIL_RE, '[REDACTED_EMAIL]'),
+    (_PHONE_RE, '[REDACTED_PHONE]'),
+]
+
+def _build_pii_database(patterns):
+    """
+    Compile the PII patterns into one Hyperscan database, used as a prefilter.
+    
+    Args:
+        patterns: (compiled regex, replacement) pairs
+        
+    Returns:
+        hyperscan.Database reporting at most one match per pattern id, or None
+        when hyperscan is not installed or cannot compile the patterns
+    """
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[regex.pattern.encode("utf-8") for regex, _ in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+_PII_DATABASE = _build_pii_database(_PII_PATTERNS)
+
+def _pii_candidates(text):
+    """Indices into _PII_PATTERNS that may match text (all of them without hyperscan)."""
+    if _PII_DATABASE is None:
+        return range(len(_PII_PATTERNS))
+    try:
+        data = text.encode("utf-8")
+    except UnicodeEncodeError:  # lone surrogates; let re handle it
+        return range(len(_PII_PATTERNS))
+    
+    found = set()
+    def on_match(pattern_id, start, end, flags, context):
+        found.add(pattern_id)
+    _PII_DATABASE.scan(data, match_event_handler=on_match)
+    return sorted(found)
+
 def redact_pii(text):
-    text = re.sub(r'\b[\w\.-]+@[\w\.-]+\.\w+\b', '[REDACTED_EMAIL]', text)
-    text = re.sub(r'\b\d{10,}\b', '[REDACTED_PHONE]', text)
+    # One multi-pattern scan finds which patterns occur at all; re then does
+    # the substitutions, so only texts that contain PII pay for them
+    for index in _pii_candidates(text):
+        regex, replacement = _PII_PATTERNS[index]
+        text = regex.sub(replacement, text)
     return text
 
+# Typographic quotes and dashes mapped to ASCII by normalize_text, in one pass
+_PUNCTUATION_TABLE = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"',
+    "\u2013": "-", "\u2014": "-"
+})
+
 def normalize_text(text):
     text = unicodedata.normalize("NFKC", text)
-    replacements = {
-        "\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"',
-        "\u2013": "-", "\u2014": "-"
-    }
-    for k, v in replacements.items():
-        text = text.replace(k, v)
-    return text
+    return text.translate(_PUNCTUATION_TABLE)
 
 def clean_whitespace(text):
-    text = re.sub(r'\n\s*\n', '\n', text)
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = _BLANKLINE_RE.sub('\n', text)
+    text = _WS_RE.sub(' ', text)
     return text.strip()
@@ -1,79 +1,175 @@
 """
 Gemini parsing and experience duration calculation.
 """
+import asyncio
+import copy
+import hashlib
 import json
+import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from dateutil import parser
 from google import genai
 from google.genai import types
 
 # Handle both relative and absolute imports
 try:
-    from ..config import GOOGLE_API_KEY
+    from ..config import GOOGLE_API_KEY, EXTRACTION_CACHE_DIR
+    from ..logging_utils import log_step
 except ImportError:
-    from src.config import GOOGLE_API_KEY
+    from src.config import GOOGLE_API_KEY, EXTRACTION_CACHE_DIR
+    from src.logging_utils import log_step
 
 client = genai.Client(api_key=GOOGLE_API_KEY)
 
+# CV text beyond this many characters is not sent to Gemini (0 sends everything);
+# the fields we extract sit near the top, long tails are mostly bibliographies
+GEMINI_MAX_INPUT_CHARS = int(os.environ.get("GEMINI_MAX_INPUT_CHARS", "20000"))
 
-def call_gemini_with_retry(prompt, model_primary="gemini-2.0-flash-lite", max_retries=3, wait_times=None):
+# Models tried by call_gemini_with_retry: the primary one with retries, then the fallback
+GEMINI_PRIMARY_MODEL = "gemini-2.0-flash-lite"
+GEMINI_FALLBACK_MODEL = "gemini-1.5-flash"
+# Seconds to wait before each retry of the primary model (the last one repeats)
+GEMINI_WAIT_TIMES = (1, 2, 4)
+
+# CV parse responses are cached on disk by model and prompt, so re-runs over the
+# same CVs make no API calls; only replies from the primary model that decode
+# as JSON are kept. Delete the directory to invalidate
+GEMINI_CACHE_DIR = os.path.join(EXTRACTION_CACHE_DIR, "gemini")
+
+
+def _response_cache_path(model, prompt):
+    """Cache file for the response to prompt from model."""
+    key = hashlib.sha1((model + prompt).encode("utf-8")).hexdigest()
+    return os.path.join(GEMINI_CACHE_DIR, f"{key}.txt")
+
+
+def _read_cached_response(cache_path):
+    """Return the cached response at cache_path, or None if there is none."""
+    try:
+        with open(cache_path, "rb") as f:
+            return f.read().decode("utf-8")
+    except OSError:
+        return None
+
+
+def _write_cached_response(cache_path, response):
+    """Store a response in the cache; failures only cost the cache entry."""
+    try:
+        os.makedirs(GEMINI_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(response.encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _gemini_attempts(model_primary, max_retries, wait_times):
+    """
+    Retry policy shared by the sync and async Gemini calls.
+
+    Returns:
+        list: (model, seconds to wait first) per attempt: max_retries tries of
+        model_primary, then one of GEMINI_FALLBACK_MODEL, which is always last
+    """
     if wait_times is None:
-        wait_times = [1, 2, 4]
-    attempts = 0
-    while attempts < max_retries:
+        wait_times = GEMINI_WAIT_TIMES
+    waits = [0] + [wait_times[min(i, len(wait_times)-1)] for i in range(max_retries)]
+    return [(model_primary, waits[i]) for i in range(max_retries)] + [(GEMINI_FALLBACK_MODEL, waits[max_retries])]
+
+
+def _gemini_retry_after(e, fallback):
+    """
+    Decide what follows a failed attempt.
+
+    Returns:
+        bool: True to move on to the next attempt, False to give up (the
+        fallback failed); other errors from the primary model are raised
+    """
+    if fallback:
+        print(f"Gemini fallback error: {e}")
+        return False
+    if "503" in str(e) or "overloaded" in str(e):
+        return True
+    print(f"Gemini API error: {e}")
+    raise e
+
+
+def call_gemini_with_retry(prompt, model_primary=GEMINI_PRIMARY_MODEL, max_retries=3, wait_times=None):
+    return _call_gemini(prompt, model_primary, max_retries, wait_times)[0]
+
+
+def _call_gemini(prompt, model_primary, max_retries, wait_times):
+    """call_gemini_with_retry returning (response, model that answered); (None, None) if none did."""
+    attempts = _gemini_attempts(model_primary, max_retries, wait_times)
+    for i, (model, wait) in enumerate(attempts):
+        if wait:
+            time.sleep(wait)
         try:
             resp = client.models.generate_content(
-                model=model_primary,
+                model=model,
                 contents=prompt,
                 config=types.GenerateContentConfig(temperature=0)
             )
-            if resp.text is not None:
-                return resp.text.strip()
-            else:
-                return ""
+            return (resp.text or "").strip(), model
         except Exception as e:
-            if "503" in str(e) or "overloaded" in str(e):
-                wait = wait_times[min(attempts, len(wait_times)-1)]
-                time.sleep(wait)
-                attempts += 1
-            else:
-                print(f"Gemini API error: {e}")
-                raise e
-    try:
-        resp = client.models.generate_content(
-            model="gemini-1.5-flash",
-            contents=prompt,
-            config=types.GenerateContentConfig(temperature=0)
-        )
-        if resp.text is not None:
-            return resp.text.strip()
-        else:
-            return ""
-    except Exception as e:
-        print(f"Gemini fallback error: {e}")
-        return None
+            if not _gemini_retry_after(e, fallback=i == len(attempts)-1):
+                return None, None
 
-def parse_cv_with_gemini(text):
-    prompt = f"""
+
+async def call_gemini_async(prompt, model_primary=GEMINI_PRIMARY_MODEL, max_retries=3, wait_times=None):
+    """Asynchronous call_gemini_with_retry (same retries and fallback)."""
+    return (await _call_gemini_async(prompt, model_primary, max_retries, wait_times))[0]
+
+
+async def _call_gemini_async(prompt, model_primary, max_retries, wait_times):
+    """call_gemini_async returning (response, model that answered); (None, None) if none did."""
+    attempts = _gemini_attempts(model_primary, max_retries, wait_times)
+    for i, (model, wait) in enumerate(attempts):
+        if wait:
+            await asyncio.sleep(wait)
+        try:
+            resp = await client.aio.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=types.GenerateContentConfig(temperature=0)
+            )
+            return (resp.text or "").strip(), model
+        except Exception as e:
+            if not _gemini_retry_after(e, fallback=i == len(attempts)-1):
+                return None, None
+
+_PARSE_PROMPT = """
 Extract structured CV information in this JSON format:
-{{
+{
   "name": "",
-  "education": [{{"degree":"","field":"","university":"","country":"","start":null,"end":null,"gpa":null,"scale":null}}],
-  "experience": [{{"title":"","org":"","start":null,"end":null,"duration_months":null,"domain":""}}],
-  "publications": [{{"title":"","venue":"","year":null,"type":"","authors":[],"author_position":null,"journal_if":null,"domain":""}}],
-  "awards": [{{"title":"","issuer":"","year":null,"type":""}}]
-}}
+  "education": [{"degree":"","field":"","university":"","country":"","start":null,"end":null,"gpa":null,"scale":null}],
+  "experience": [{"title":"","org":"","start":null,"end":null,"duration_months":null,"domain":""}],
+  "publications": [{"title":"","venue":"","year":null,"type":"","authors":[],"author_position":null,"journal_if":null,"domain":""}],
+  "awards": [{"title":"","issuer":"","year":null,"type":""}]
+}
 RULES:
 1. Extract the full name of the person from the resume and put it in the "name" field.
 2. For experience, if end date missing, set "end": "currently working".
 3. For education, include only Bachelor's or university-level degree or higher.
 4. Return ONLY valid JSON.
 """
-    raw = call_gemini_with_retry(prompt + text)
-    if not raw:
-        return {"name": "", "education": [], "experience": [], "publications": [], "awards": []}
+
+def _build_parse_prompt(text):
+    if GEMINI_MAX_INPUT_CHARS and len(text) > GEMINI_MAX_INPUT_CHARS:
+        log_step(f"CV text truncated from {len(text)} to {GEMINI_MAX_INPUT_CHARS} characters for Gemini")
+        text = text[:GEMINI_MAX_INPUT_CHARS]
+    return _PARSE_PROMPT + text
+
+def _empty_cv():
+    return {"name": "", "education": [], "experience": [], "publications": [], "awards": []}
+
+def _decode_gemini_json(raw):
+    """Decode a Gemini reply as JSON, repairing trailing commas; None if it does not decode."""
     try:
         return json.loads(raw)
     except Exception as e:
@@ -84,16 +180,98 @@ RULES:
             return json.loads(c)
         except Exception as e2:
             print(f"Error parsing fallback JSON: {e2}")
-            return {"name": "", "education": [], "experience": [], "publications": [], "awards": []}
+            return None
+
+def _cached_parse(prompt):
+    """Return (cache path, cached parse or None) for a CV parse prompt."""
+    cache_path = _response_cache_path(GEMINI_PRIMARY_MODEL, prompt)
+    raw = _read_cached_response(cache_path)
+    return cache_path, (_decode_gemini_json(raw) if raw is not None else None)
+
+def _finish_parse(cache_path, raw, model):
+    """Decode a fresh reply; it is cached only if it decodes and came from the primary model."""
+    parsed = _decode_gemini_json(raw) if raw else None
+    if parsed is None:
+        return _empty_cv()
+    if model == GEMINI_PRIMARY_MODEL:
+        _write_cached_response(cache_path, raw)
+    return parsed
+
+def parse_cv_with_gemini(text):
+    prompt = _build_parse_prompt(text)
+    cache_path, parsed = _cached_parse(prompt)
+    if parsed is not None:
+        return parsed
+    raw, model = _call_gemini(prompt, GEMINI_PRIMARY_MODEL, 3, None)
+    return _finish_parse(cache_path, raw, model)
+
+def parse_cvs_with_gemini(texts, max_concurrency=8):
+    """
+    Parse several CVs with concurrent Gemini requests.
+
+    Args:
+        texts: CV texts to parse
+        max_concurrency: Most requests in flight at once (keeps within API rate limits)
+
+    Returns:
+        list: Parsed CV dict per text, in input order; a CV whose request
+        failed gets the exception instead. Identical texts are sent once and
+        get separate copies of the result
+
+    Called from inside a running event loop (e.g. Jupyter), the requests run
+    on their own loop in a helper thread, and this call blocks until they finish.
+    """
+    async def parse_all(prompts):
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def parse_one(prompt):
+            cache_path, parsed = _cached_parse(prompt)
+            if parsed is not None:
+                return parsed
+            async with semaphore:
+                raw, model = await _call_gemini_async(prompt, GEMINI_PRIMARY_MODEL, 3, None)
+            return _finish_parse(cache_path, raw, model)
+
+        return await asyncio.gather(*(parse_one(p) for p in prompts), return_exceptions=True)
+
+    prompts = [_build_parse_prompt(text) for text in texts]
+    unique_prompts = list(dict.fromkeys(prompts))
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        results = asyncio.run(parse_all(unique_prompts))
+    else:
+        # asyncio.run cannot start a loop inside a running one
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            results = pool.submit(asyncio.run, parse_all(unique_prompts)).result()
+    parsed = dict(zip(unique_prompts, results))
+    return [parsed[p] if isinstance(parsed[p], Exception) else copy.deepcopy(parsed[p]) for p in prompts]
+
+_ISO_YEAR_MONTH_RE = re.compile(r'([12]\d{3})(?:-(0[1-9]|1[0-2]))?')
+
+@lru_cache(maxsize=4096)
+def _parse_date(s):
+    """
+    dateutil's parser.parse, memoized since the same dates recur across entries
+    and CVs, with a fast path for "YYYY-MM" and "YYYY".
+
+    Only the year and month of the result are meaningful; like dateutil, a bare
+    year takes the current month.
+    """
+    match = _ISO_YEAR_MONTH_RE.fullmatch(s) if isinstance(s, str) else None
+    if match:
+        year, month = match.groups()
+        return datetime(int(year), int(month) if month else datetime.now().month, 1)
+    return parser.parse(s)
 
 def calculate_duration_months(start, end):
     try:
-        start_date = parser.parse(start)
+        start_date = _parse_date(start)
         if end == "currently working":
             end_date = datetime.now()
         else:
             try:
-                end_date = parser.parse(end)
+                end_date = _parse_date(end)
             except Exception as e:
                 print(f"Error parsing end date '{end}': {e}")
                 return None
@@ -0,0 +1,142 @@
+"""
+Differential tests for the ranking kernels in src/evaluation/_rank_numba.py.
+
+The Kendall tau-b kernel is checked against scipy.stats.kendalltau, and the
+pairwise agreement and top-3 kernels against their NumPy (_py) twins. The
+kernels are tested both as plain Python and, when Numba is installed, as the
+compiled versions the evaluators use.
+
+Run with: python -m unittest discover tests
+"""
+import unittest
+
+import numpy as np
+from scipy import stats
+
+from src.evaluation import _rank_numba as rn
+
+
+def _kendall_variants():
+    """Kendall tau-b implementations under test, by name."""
+    variants = {'python': rn._kendall_tau_b_kernel}
+    if rn._NUMBA_AVAILABLE:
+        variants['numba'] = rn.kendall_tau_b
+    return variants
+
+
+class KendallTauTest(unittest.TestCase):
+    """kendall_tau_b against scipy.stats.kendalltau."""
+
+    def assert_matches_scipy(self, x, y):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        expected_tau, expected_p = stats.kendalltau(x, y)
+        for name, kernel in _kendall_variants().items():
+            with self.subTest(kernel=name, n=len(x)):
+                tau, p_value = kernel(x, y, rn._FACTORIALS, True)
+                np.testing.assert_allclose(tau, expected_tau, rtol=1e-12, atol=1e-15, equal_nan=True)
+                np.testing.assert_allclose(p_value, expected_p, rtol=1e-9, atol=1e-300, equal_nan=True)
+                tau_only, p_skipped = kernel(x, y, rn._FACTORIALS, False)
+                np.testing.assert_allclose(tau_only, expected_tau, rtol=1e-12, atol=1e-15, equal_nan=True)
+                self.assertTrue(np.isnan(p_skipped))
+
+    def test_exact_without_ties(self):
+        # n <= 33 without ties takes SciPy's exact p-value
+        rng = np.random.default_rng(0)
+        for n in range(1, 34):
+            for _ in range(5):
+                self.assert_matches_scipy(rng.permutation(n), rng.permutation(n))
+
+    def test_exact_near_perfect_order(self):
+        # Beyond 33, zero or one discordant pair still uses the exact p-value
+        for n in (34, 60, 200):
+            x = np.arange(n)
+            swapped = x.copy()
+            swapped[[10, 11]] = swapped[[11, 10]]
+            self.assert_matches_scipy(x, x)
+            self.assert_matches_scipy(x, swapped)
+            self.assert_matches_scipy(x, swapped[::-1])
+
+    def test_asymptotic_without_ties(self):
+        rng = np.random.default_rng(1)
+        for n in (34, 35, 50, 101, 500):
+            for _ in range(5):
+                self.assert_matches_scipy(rng.random(n), rng.random(n))
+
+    def test_ties(self):
+        # Ties always take the tie-corrected normal approximation
+        rng = np.random.default_rng(2)
+        for n in (3, 5, 10, 33, 34, 80, 300):
+            for levels in (2, 3, 5):
+                self.assert_matches_scipy(rng.integers(0, levels, n), rng.integers(0, levels, n))
+                self.assert_matches_scipy(rng.integers(0, levels, n), rng.random(n))
+
+    def test_correlated_scores(self):
+        rng = np.random.default_rng(3)
+        for n in (10, 40, 200):
+            x = np.round(rng.random(n), 1)
+            self.assert_matches_scipy(x, x + rng.normal(0, 0.05, n))
+
+    def test_degenerate_inputs(self):
+        self.assert_matches_scipy([1.0, 1.0, 1.0], [1.0, 2.0, 3.0])
+        self.assert_matches_scipy([1.0, 2.0, 3.0], [2.0, 2.0, 2.0])
+        self.assert_matches_scipy([1.0, np.nan, 3.0], [1.0, 2.0, 3.0])
+        self.assert_matches_scipy([1.0, 2.0], [2.0, 1.0])
+
+    def test_rows_match_single_rankings(self):
+        rng = np.random.default_rng(4)
+        lengths = np.array([5, 40, 2, 33], dtype=np.int64)
+        x = np.full((len(lengths), lengths.max()), np.nan)
+        y = np.full_like(x, np.nan)
+        for r, n in enumerate(lengths):
+            x[r, :n] = rng.integers(0, 4, n) if r % 2 else rng.random(n)
+            y[r, :n] = rng.random(n)
+        rows = rn.kendall_tau_b_rows(x, y, lengths, rn._FACTORIALS, True)
+        for r, n in enumerate(lengths):
+            expected_tau, expected_p = stats.kendalltau(x[r, :n], y[r, :n])
+            np.testing.assert_allclose(rows[r], [expected_tau, expected_p], rtol=1e-9, equal_nan=True)
+
+
+class PairwiseAgreementTest(unittest.TestCase):
+    """pairwise_agreement against _pairwise_agreement_py."""
+
+    def test_matches_python_version(self):
+        rng = np.random.default_rng(5)
+        for n in (0, 1, 2, 3, 10, 57):
+            for threshold in (0.0, 0.05, 0.3):
+                sys_scores = rng.random(n)
+                # Ground truth on a coarse grid, so many gaps sit on the threshold
+                gt_scores = np.round(rng.integers(0, 20, n) * 0.05, 2)
+                with self.subTest(n=n, threshold=threshold):
+                    correct, total, first5 = rn.pairwise_agreement(sys_scores, gt_scores, threshold)
+                    expected = rn._pairwise_agreement_py(sys_scores, gt_scores, threshold)
+                    self.assertEqual((int(correct), int(total)), expected[:2])
+                    np.testing.assert_array_equal(first5, expected[2])
+
+    def test_float32_system_scores(self):
+        rng = np.random.default_rng(6)
+        sys_scores = rng.random(30).astype(np.float32)
+        gt_scores = np.round(rng.integers(0, 20, 30) * 0.05, 2)
+        correct, total, first5 = rn.pairwise_agreement(sys_scores, gt_scores, 0.05)
+        expected = rn._pairwise_agreement_py(sys_scores, gt_scores, 0.05)
+        self.assertEqual((int(correct), int(total)), expected[:2])
+        np.testing.assert_array_equal(first5, expected[2])
+
+
+class Top3AbsIndicesTest(unittest.TestCase):
+    """top3_abs_indices against _top3_abs_indices_py."""
+
+    def test_matches_python_version(self):
+        rng = np.random.default_rng(7)
+        for n in (0, 1, 2, 3, 4, 9):
+            for threshold in (0.0, 0.1, 0.5):
+                # Rounded values give ties and exact zeros
+                x = np.round(rng.normal(0, 0.5, n), 1)
+                with self.subTest(n=n, threshold=threshold, x=x.tolist()):
+                    np.testing.assert_array_equal(
+                        rn.top3_abs_indices(x, threshold), rn._top3_abs_indices_py(x, threshold)
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()